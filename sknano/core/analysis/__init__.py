@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 
 __docformat__ = 'restructuredtext en'
 
+from .neighbor_lists import *
 from .periodic_kdtree import *
 from .ring_analysis import *
 # from .ring_finder import *
@@ -17,15 +17,44 @@ ctypedef np.uint64_t uint64_t
 cdef struct queue_item
 
 
+cdef void graph_distances(int32_t root, int32_t *amat_indptr,
+                          int32_t *amat_indices, int32_t max_depth,
+                          vector[int32_t] &dist,
+                          vector[int32_t] &reached) noexcept nogil
+
+
+cdef void reset_distances(vector[int32_t] &dist,
+                          vector[int32_t] &reached) noexcept nogil
+
+
+cdef void bond_order(int32_t Natoms, int32_t *nn_idx, int32_t *nn_seed,
+                     vector[int32_t] &bond_owner,
+                     vector[int32_t] &bond_rank) noexcept nogil
+
+
 cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
-                       vector[int32_t] &visited, int32_t Natoms,
-                       int32_t *nn_idx, int32_t *nn_seed, int32_t *nn_amat,
-                       float64_t *nn_vecs, int32_t max_ring_size, float64_t eps,
-                       vector[int32_t] &ring_counts,
-                       vector[vector[int32_t]] &nodes_list)
+                       int32_t *bond_owner, int32_t *bond_rank,
+                       int32_t *nn_idx, int32_t *nn_seed,
+                       int32_t *amat_indptr, int32_t *amat_indices,
+                       vector[int32_t] &dist, vector[int32_t] &ring_dist,
+                       vector[int32_t] &ring_reached, float64_t *nn_vecs,
+                       int32_t max_ring_size, float64_t eps,
+                       vector[vector[int32_t]] &nodes_list) noexcept nogil
+
+
+cdef void search_root(int32_t root, int32_t *bond_owner,
+                      int32_t *bond_rank, int32_t *nn_idx, int32_t *nn_seed,
+                      int32_t *amat_indptr, int32_t *amat_indices,
+                      vector[int32_t] &dist, vector[int32_t] &reached,
+                      vector[int32_t] &ring_dist,
+                      vector[int32_t] &ring_reached, float64_t *nn_vecs,
+                      int32_t max_ring_size, int32_t max_depth,
+                      float64_t eps,
+                      vector[vector[int32_t]] &nodes_list) noexcept nogil
 
 
 cpdef tuple find_rings(int32_t Natoms, int32_t NNN, int32_t[::1] nn_idx,
-                       int32_t[::1] nn_seed, int32_t[:,::1] nn_amat,
-                       float64_t[:,::1] nn_vecs, int32_t max_ring_size,
-                       float64_t eps)
+                       int32_t[::1] nn_seed, int32_t[::1] amat_indptr,
+                       int32_t[::1] amat_indices, float64_t[:,::1] nn_vecs,
+                       int32_t max_ring_size, float64_t eps,
+                       int32_t num_threads=*)
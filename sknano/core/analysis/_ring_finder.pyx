@@ -4,11 +4,15 @@
 # cython: language_level=3
 # distutils: language=c++
 
+from cython.parallel cimport prange, threadid
 from libc.math cimport sqrt
+from libc.stdint cimport INT32_MAX
 from libc.stdlib cimport abs
 from libcpp.deque cimport deque
 from libcpp.vector cimport vector
 
+from operator import itemgetter
+
 import numpy as np
 cimport numpy as np
 
@@ -22,34 +26,137 @@ cdef struct queue_item:
     float64_t r[3]
 
 
+cdef void graph_distances(int32_t root, int32_t *amat_indptr,
+                          int32_t *amat_indices, int32_t max_depth,
+                          vector[int32_t] &dist,
+                          vector[int32_t] &reached) noexcept nogil:
+    """Compute graph distances from `root` by breadth-first search.
+
+    Parameters
+    ----------
+    root : int32_t
+    amat_indptr, amat_indices : int32_t arrays
+        CSR structure of the adjacency matrix.
+    max_depth : int32_t
+        Maximum distance to search. Unbounded if negative.
+    dist : int32_t vector
+        Distances from `root`. Must be -1 for all nodes on entry.
+        Unreached nodes are left at -1.
+    reached : int32_t vector
+        Nodes reached from `root`, used for resetting `dist`.
+
+    """
+    cdef:
+        size_t head = 0
+        int32_t i, si, ni, d
+
+    reached.clear()
+    dist[root] = 0
+    reached.push_back(root)
+    while head < reached.size():
+        i = reached[head]
+        head += 1
+        d = dist[i]
+        if max_depth >= 0 and d >= max_depth:
+            continue
+        for si in range(amat_indptr[i], amat_indptr[i + 1]):
+            ni = amat_indices[si]
+            if dist[ni] < 0:
+                dist[ni] = d + 1
+                reached.push_back(ni)
+
+
+cdef void reset_distances(vector[int32_t] &dist,
+                          vector[int32_t] &reached) noexcept nogil:
+    """Reset the `dist` entries of the `reached` nodes to -1."""
+    cdef size_t k
+    for k in range(reached.size()):
+        dist[reached[k]] = -1
+    reached.clear()
+
+
+cdef inline bint is_visited(int32_t si, int32_t root, int32_t root_si,
+                            int32_t *bond_owner,
+                            int32_t *bond_rank) noexcept nogil:
+    """Check if the bond `si` was searched before the bond `root_si`.
+
+    The bonds are searched in the order of their :func:`bond_order`,
+    so this only depends on the starting bond and each root atom can be
+    searched independently.
+
+    """
+    return bond_owner[si] < root or \
+        (bond_owner[si] == root and bond_rank[si] <= root_si)
+
+
+cdef void bond_order(int32_t Natoms, int32_t *nn_idx, int32_t *nn_seed,
+                     vector[int32_t] &bond_owner,
+                     vector[int32_t] &bond_rank) noexcept nogil:
+    """Compute the order in which the bonds are searched.
+
+    The bond `si` from atom `i` to atom `ni` with `i < ni` is searched
+    from root atom `i`, and is marked visited, along with the reverse
+    bond from `ni` to `i`, when the search of root `i` reaches `si`.
+    Bonds that are never searched have owner `INT32_MAX`.
+
+    Parameters
+    ----------
+    Natoms : int32_t
+    nn_idx : int32_t array
+    nn_seed : int32_t array
+    bond_owner : int32_t vector
+        Root atom of each bond.
+    bond_rank : int32_t vector
+        Position of each bond in the neighbor list of its root atom.
+
+    """
+    cdef int32_t i, si, ni, nsi
+
+    for i in range(Natoms):
+        for si in range(nn_seed[i], nn_seed[i+1]):
+            ni = nn_idx[si]
+            if i < ni:
+                bond_owner[si] = i
+                bond_rank[si] = si
+                for nsi in range(nn_seed[ni], nn_seed[ni+1]):
+                    if nn_idx[nsi] == i and bond_owner[nsi] == INT32_MAX:
+                        bond_owner[nsi] = i
+                        bond_rank[nsi] = si
+
+
 cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
-                       vector[int32_t] &visited, int32_t Natoms,
-                       int32_t *nn_idx, int32_t *nn_seed, int32_t *nn_amat,
-                       float64_t *nn_vecs, int32_t max_ring_size,
-                       float64_t eps, vector[int32_t] &ring_counts,
-                       vector[vector[int32_t]] &nodes_list):
+                       int32_t *bond_owner, int32_t *bond_rank,
+                       int32_t *nn_idx, int32_t *nn_seed,
+                       int32_t *amat_indptr, int32_t *amat_indices,
+                       vector[int32_t] &dist, vector[int32_t] &ring_dist,
+                       vector[int32_t] &ring_reached, float64_t *nn_vecs,
+                       int32_t max_ring_size, float64_t eps,
+                       vector[vector[int32_t]] &nodes_list) noexcept nogil:
     """Search for closed paths starting from `root` atom.
 
     Parameters
     ----------
     root, node : int32_t
     node_si : int32_t
-    visited : int32_t array
-    Natoms : int32_t
+    bond_owner, bond_rank : int32_t arrays
+        Bond search order from :func:`bond_order`.
     nn_idx : int32_t array
     nn_seed : int32_t array
-    nn_amat : int32_t array
+    amat_indptr, amat_indices : int32_t arrays
+    dist : int32_t vector
+        Graph distances from `root`.
+    ring_dist, ring_reached : int32_t vectors
+        Work space for the graph distances between ring nodes.
     nn_vecs : float64_t array
     max_ring_size : int32_t
     eps : float64_t
-    ring_counts : vector
     nodes_list : vector of vectors
 
     """
     cdef:
         int32_t i, j, ni, si, di, dni, n, m, s, abs_m, abs_n, ring_size
         int32_t prev, last
-        float64_t r, rsq
+        float64_t r, rsq, dr
         float64_t r0[3]
         bint found_ring, new_node = False
         vector[int32_t] nodes, tmpnodes
@@ -74,9 +181,10 @@ cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
             i = last
             for si in range(nn_seed[i], nn_seed[i+1]):
                 ni = nn_idx[si]
-                if not visited[si] and ni != prev:
-                    di = nn_amat[Natoms * root + i]
-                    dni = nn_amat[Natoms * root + ni]
+                if (ni != prev and not is_visited(si, root, node_si,
+                                                  bond_owner, bond_rank)):
+                    di = dist[i]
+                    dni = dist[ni]
                     tmpnodes = nodes
                     if ((dni == di + 1) and
                         (nodes.size() < (max_ring_size - 1) / 2 or
@@ -98,13 +206,15 @@ cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
             i = -last
             for si in range(nn_seed[i], nn_seed[i + 1]):
                 ni = nn_idx[si]
-                if not visited[si] and ni != prev:
-                    di = nn_amat[Natoms * root + i]
-                    dni = nn_amat[Natoms * root + ni]
+                if (ni != prev and not is_visited(si, root, node_si,
+                                                  bond_owner, bond_rank)):
+                    di = dist[i]
+                    dni = dist[ni]
                     if ni == root:
                         rsq = 0.0
                         for j in range(3):
-                            rsq += pow(r0[j] + nn_vecs[3 * si + j], 2)
+                            dr = r0[j] + nn_vecs[3 * si + j]
+                            rsq += dr * dr
                         r = sqrt(rsq)
                         # For a closed ring, the vector sum of the
                         # ring bond vectors will have zero length.
@@ -112,23 +222,30 @@ cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
                             found_ring = True
                             nodes.push_back(root)
                             ring_size = nodes.size()
-                            for n in range(ring_size):
+                            # A ring is irreducible if the graph distance
+                            # between its nodes is the distance along
+                            # the ring.
+                            for n in range(ring_size - 1):
+                                abs_n = abs(nodes[n])
+                                graph_distances(abs_n, amat_indptr,
+                                                amat_indices, ring_size / 2,
+                                                ring_dist, ring_reached)
                                 for m in range(n + 1, ring_size):
                                     s = m - n
                                     if s > ring_size / 2:
                                         s = ring_size - s
 
                                     abs_m = abs(nodes[m])
-                                    abs_n = abs(nodes[n])
 
-                                    if nn_amat[Natoms * abs_m + abs_n] != s:
+                                    if ring_dist[abs_m] != s:
                                         found_ring = False
+                                        break
+                                reset_distances(ring_dist, ring_reached)
+                                if not found_ring:
+                                    break
 
                             if found_ring:
-                                if ring_counts.size() < ring_size + 1:
-                                    ring_counts.resize(ring_size + 1)
                                 nodes_list.push_back(nodes)
-                                ring_counts[ring_size] += 1
 
                     elif dni == di - 1:
                         tmpnodes = nodes
@@ -141,10 +258,50 @@ cdef void search_paths(int32_t root, int32_t node, int32_t node_si,
                         q.push_back(qi)
 
 
+cdef void search_root(int32_t root, int32_t *bond_owner,
+                      int32_t *bond_rank, int32_t *nn_idx, int32_t *nn_seed,
+                      int32_t *amat_indptr, int32_t *amat_indices,
+                      vector[int32_t] &dist, vector[int32_t] &reached,
+                      vector[int32_t] &ring_dist,
+                      vector[int32_t] &ring_reached, float64_t *nn_vecs,
+                      int32_t max_ring_size, int32_t max_depth,
+                      float64_t eps,
+                      vector[vector[int32_t]] &nodes_list) noexcept nogil:
+    """Search for closed paths from each bond of the `root` atom."""
+    cdef:
+        int32_t si, ni
+        bint root_searched = False
+
+    for si in range(nn_seed[root], nn_seed[root+1]):
+        ni = nn_idx[si]
+        if root < ni:
+            if not root_searched:
+                graph_distances(root, amat_indptr, amat_indices, max_depth,
+                                dist, reached)
+                root_searched = True
+            search_paths(root, ni, si, bond_owner, bond_rank, nn_idx,
+                         nn_seed, amat_indptr, amat_indices, dist, ring_dist,
+                         ring_reached, nn_vecs, max_ring_size, eps,
+                         nodes_list)
+    if root_searched:
+        reset_distances(dist, reached)
+
+
+def canonical_ring(nodes):
+    """Return the atom indices of the ring `nodes` as a :class:`~python:tuple`
+    that does not depend on the starting atom or direction of the ring."""
+    ring = [abs(n) for n in nodes]
+    start = ring.index(min(ring))
+    forward = ring[start:] + ring[:start]
+    backward = forward[:1] + forward[:0:-1]
+    return tuple(min(forward, backward))
+
+
 cpdef tuple find_rings(int32_t Natoms, int32_t NNN, int32_t[::1] nn_idx,
-                       int32_t[::1] nn_seed, int32_t[:,::1] nn_amat,
-                       float64_t[:,::1] nn_vecs, int32_t max_ring_size,
-                       float64_t eps):
+                       int32_t[::1] nn_seed, int32_t[::1] amat_indptr,
+                       int32_t[::1] amat_indices, float64_t[:,::1] nn_vecs,
+                       int32_t max_ring_size, float64_t eps,
+                       int32_t num_threads=1):
     """Find rings.
 
     Parameters
@@ -153,32 +310,71 @@ cpdef tuple find_rings(int32_t Natoms, int32_t NNN, int32_t[::1] nn_idx,
     NNN : :class:`~python:int`
     nn_idx : :class:`~numpy:numpy.ndarray`
     nn_seed : :class:`~numpy:numpy.ndarray`
-    nn_amat : :class:`~numpy:numpy.ndarray`
+    amat_indptr, amat_indices : :class:`~numpy:numpy.ndarray`
+        CSR structure of the sparse nearest-neighbor adjacency matrix.
     nn_vecs : :class:`~numpy:numpy.ndarray`
     max_ring_size : :class:`~python:int`, optional
     eps : :class:`~python:float`, optional
+    num_threads : :class:`~python:int`, optional
+        Number of OpenMP threads to split the root atoms across.
 
     """
 
     cdef:
-        int32_t i, si, ni, nsi, nni
-        vector[int32_t] visited
-        vector[int32_t] ring_counts
-        vector[vector[int32_t]] nodes_list
+        int32_t i, t, tid, max_depth = -1
+        vector[int32_t] bond_owner, bond_rank
+        vector[vector[int32_t]] dists, reached, ring_dists, ring_reached
+        vector[vector[vector[int32_t]]] thread_nodes_list
 
-    visited.resize(NNN)
+    if NNN == 0:
+        return [], []
 
-    for i in range(Natoms):
-        for si in range(nn_seed[i], nn_seed[i+1]):
-            ni = nn_idx[si]
-            if i < ni:
-                visited[si] = 1
-                for nsi in range(nn_seed[ni], nn_seed[ni+1]):
-                    nni = nn_idx[nsi]
-                    if nni == i:
-                        visited[nsi] = 1
-                search_paths(i, ni, si, visited, Natoms, &nn_idx[0],
-                             &nn_seed[0], &nn_amat[0,0], &nn_vecs[0,0],
-                             max_ring_size, eps, ring_counts, nodes_list)
+    if num_threads < 1:
+        num_threads = 1
+
+    bond_owner.resize(NNN, INT32_MAX)
+    bond_rank.resize(NNN, INT32_MAX)
+
+    # Thread-local work space and ring buffers
+    dists.resize(num_threads, vector[int32_t](Natoms, -1))
+    ring_dists.resize(num_threads, vector[int32_t](Natoms, -1))
+    reached.resize(num_threads)
+    ring_reached.resize(num_threads)
+    thread_nodes_list.resize(num_threads)
+
+    # Paths never extend further than half of the maximum ring size from
+    # the root, so the graph distances beyond that are not needed.
+    if max_ring_size > 0:
+        max_depth = (max_ring_size + 1) / 2
+
+    with nogil:
+        bond_order(Natoms, &nn_idx[0], &nn_seed[0], bond_owner, bond_rank)
+        for i in prange(Natoms, num_threads=num_threads, schedule='dynamic'):
+            tid = threadid()
+            search_root(i, &bond_owner[0], &bond_rank[0], &nn_idx[0],
+                        &nn_seed[0], &amat_indptr[0], &amat_indices[0],
+                        dists[tid], reached[tid], ring_dists[tid],
+                        ring_reached[tid], &nn_vecs[0,0], max_ring_size,
+                        max_depth, eps, thread_nodes_list[tid])
+
+    # Merge the thread-local rings in root atom order, dropping any
+    # ring found more than once.
+    nodes_list = []
+    unique_rings = set()
+    for t in range(num_threads):
+        thread_rings = thread_nodes_list[t]
+        for nodes in thread_rings:
+            ring = canonical_ring(nodes)
+            if ring not in unique_rings:
+                unique_rings.add(ring)
+                nodes_list.append(nodes)
+    nodes_list.sort(key=itemgetter(-1))
+
+    ring_counts = []
+    for nodes in nodes_list:
+        ring_size = len(nodes)
+        while len(ring_counts) < ring_size + 1:
+            ring_counts.append(0)
+        ring_counts[ring_size] += 1
 
     return ring_counts, nodes_list
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+Linked-cell neighbor lists (:mod:`sknano.core.analysis.neighbor_lists`)
+===============================================================================
+
+.. currentmodule:: sknano.core.analysis.neighbor_lists
+
+Neighbor lists built by binning points into cells in fractional coordinates
+of an arbitrary (triclinic) simulation cell with mixed per-axis periodicity.
+
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext en'
+
+from itertools import product
+
+import numpy as np
+
+__all__ = ['linked_cell_neighbor_list', 'cell_matrix_and_offset']
+
+
+def cell_matrix_and_offset(lattice):
+    """Return the cell matrix and origin of a lattice or domain.
+
+    Parameters
+    ----------
+    lattice : {:class:`~sknano.core.crystallography.LatticeBase`, \
+        :class:`~sknano.core.crystallography.Domain`}
+
+    Returns
+    -------
+    cell_matrix : :class:`~numpy:numpy.ndarray`
+        :math:`3\\times 3` matrix of cell row vectors.
+    offset : :class:`~numpy:numpy.ndarray`
+        Origin of the cell.
+
+    """
+    try:
+        cell_matrix = np.asarray(lattice.cell_matrix, dtype=float)
+        offset = np.asarray(lattice.offset, dtype=float)
+    except AttributeError:
+        # LAMMPS style `Domain` box
+        cell_matrix = np.asarray([[lattice.lx, 0.0, 0.0],
+                                  [lattice.xy, lattice.ly, 0.0],
+                                  [lattice.xz, lattice.yz, lattice.lz]],
+                                 dtype=float)
+        offset = np.asarray([lattice.xlo, lattice.ylo, lattice.zlo],
+                            dtype=float)
+    return cell_matrix, offset
+
+
+def linked_cell_neighbor_list(coords, cutoff, lattice=None, pbc=None):
+    """Compute neighbor lists of `coords` within distance `cutoff`.
+
+    The points are binned into a grid of cells in the fractional
+    coordinates of the `lattice` cell, with cells at least `cutoff` wide
+    along each cell axis, so that each point only needs to be compared
+    against the points in the neighboring cells. Along periodic axes the
+    points are wrapped into the unit cell and the neighboring cells include
+    the periodic images. Along non-periodic axes the cells span the extent
+    of the points. The run time scales linearly with the number of points.
+
+    Parameters
+    ----------
+    coords : array_like, shape (N, 3)
+        Cartesian coordinates.
+    cutoff : :class:`~python:float`
+        Neighbor radius cutoff.
+    lattice : {:class:`~sknano.core.crystallography.LatticeBase`, \
+        :class:`~sknano.core.crystallography.Domain`}, optional
+        Simulation cell. If `None`, the cartesian axes are used and
+        no axis is periodic.
+    pbc : array_like, optional
+        :class:`~python:bool` flags for periodic boundaries along each cell
+        axis. Default is `True` along all axes if `lattice` is not `None`.
+
+    Returns
+    -------
+    indptr : :class:`~numpy:numpy.ndarray`
+        Array of length N + 1. The neighbors of point `i` are
+        ``indices[indptr[i]:indptr[i+1]]``, sorted by distance.
+    indices : :class:`~numpy:numpy.ndarray`
+        Neighbor indices.
+    distances : :class:`~numpy:numpy.ndarray`
+        Neighbor distances.
+    vectors : :class:`~numpy:numpy.ndarray`
+        Minimum image displacement vectors from each point to its
+        neighbors, with shape (len(indices), 3).
+
+    Raises
+    ------
+    ValueError
+        If `cutoff` is not less than half of the width of the cell along a
+        periodic axis, in which case more than one periodic image of a
+        point could be within `cutoff`.
+
+    """
+    coords = np.asarray(coords, dtype=float).reshape((-1, 3))
+    Npts = len(coords)
+
+    if lattice is None:
+        cell_matrix, offset = np.identity(3), np.zeros(3)
+        pbc = np.zeros(3, dtype=bool)
+    else:
+        cell_matrix, offset = cell_matrix_and_offset(lattice)
+        if pbc is None:
+            pbc = np.ones(3, dtype=bool)
+        pbc = np.asarray(pbc, dtype=bool).reshape((3, ))
+
+    # The perpendicular cell widths are the inverse lengths of the
+    # reciprocal lattice vectors
+    heights = 1 / np.linalg.norm(np.linalg.inv(cell_matrix), axis=0)
+    if np.any(pbc & (2 * cutoff >= heights)):
+        raise ValueError('`cutoff` must be less than half of the cell '
+                         'width along each periodic axis')
+
+    if Npts == 0:
+        return np.zeros(1, dtype=int), np.zeros(0, dtype=int), \
+            np.zeros(0), np.zeros((0, 3))
+
+    # Map points onto fractional coordinates, wrapping along periodic axes
+    fcoords = np.dot(coords - offset, np.linalg.inv(cell_matrix))
+    fcoords[:, pbc] -= np.floor(fcoords[:, pbc])
+    coords = np.dot(fcoords, cell_matrix) + offset
+
+    fmin = np.where(pbc, 0.0, fcoords.min(axis=0))
+    fextent = np.where(pbc, 1.0, fcoords.max(axis=0) - fmin)
+    widths = heights * fextent
+    ncells = np.maximum(np.floor(widths / cutoff), 1).astype(int)
+    # Limit the number of (mostly empty) cells for sparse systems
+    while np.prod(ncells) > 8 * Npts and np.any(ncells > 1):
+        ncells = np.maximum(ncells // 2, 1)
+    # Number of cells to search on each side along each axis
+    nsearch = np.ceil(cutoff * ncells / np.where(widths > 0, widths, 1))
+    nsearch = np.where(pbc | (ncells > 1), nsearch, 0).astype(int)
+
+    cells = np.floor((fcoords - fmin) / np.where(fextent > 0, fextent, 1) *
+                     ncells).astype(int)
+    cells = np.clip(cells, 0, ncells - 1)
+
+    # Sort points by cell to get contiguous cell contents
+    cell_ids = np.ravel_multi_index(cells.T, ncells)
+    order = np.argsort(cell_ids, kind='mergesort')
+    cell_counts = np.bincount(cell_ids, minlength=np.prod(ncells))
+    cell_start = np.concatenate(([0], np.cumsum(cell_counts)[:-1]))
+
+    points = np.arange(Npts)
+    idx = []
+    nn_idx = []
+    vectors = []
+    # Only search half of the neighboring cells. The pairs found in the
+    # other half are the same pairs in reverse.
+    for disp in product(*[range(-n, n + 1) for n in nsearch]):
+        if disp < (0, 0, 0):
+            continue
+        neighbor_cells = cells + disp
+        shifts = np.where(pbc, np.floor_divide(neighbor_cells, ncells), 0)
+        neighbor_cells -= shifts * ncells
+        valid = np.all((neighbor_cells >= 0) & (neighbor_cells < ncells),
+                       axis=1)
+        i = points[valid]
+        if i.size == 0:
+            continue
+        neighbor_ids = \
+            np.ravel_multi_index(neighbor_cells[valid].T, ncells)
+        counts = cell_counts[neighbor_ids]
+
+        # Expand each point against every point in its neighbor cell
+        pair_i = np.repeat(i, counts)
+        first = np.repeat(cell_start[neighbor_ids] - np.cumsum(counts) +
+                          counts, counts)
+        pair_j = np.take(order, first + np.arange(pair_i.size))
+        image_shifts = shifts[valid]
+        dr = np.take(coords, pair_j, axis=0) - \
+            np.repeat(coords[i] - np.dot(image_shifts, cell_matrix), counts,
+                      axis=0)
+
+        keep = np.einsum('ij,ij->i', dr, dr) <= cutoff ** 2
+        if not any(disp):
+            # Pairs within the same cell image are found twice
+            keep &= pair_i < pair_j
+        pair_i, pair_j, dr = pair_i[keep], pair_j[keep], dr[keep]
+        idx.extend((pair_i, pair_j))
+        nn_idx.extend((pair_j, pair_i))
+        vectors.extend((dr, -dr))
+
+    idx = np.concatenate(idx) if idx else np.zeros(0, dtype=int)
+    nn_idx = np.concatenate(nn_idx) if nn_idx else np.zeros(0, dtype=int)
+    vectors = np.vstack(vectors) if vectors else np.zeros((0, 3))
+    distances = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+
+    # Sort by point index and then by distance
+    order = np.argsort(idx + distances / (2 * cutoff))
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(idx,
+                                                        minlength=Npts))))
+    return indptr, nn_idx[order], distances[order], vectors[order]
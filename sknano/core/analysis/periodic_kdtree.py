@@ -187,9 +187,8 @@ class PeriodicCKDTree(cKDTree):
 
     Searches with periodic boundaries are implemented by mapping all
     initial data points to one canonical periodic image, building an
-    ordinary kd-tree with these points, then querying this kd-tree multiple
-    times, if necessary, with all the relevant periodic images of the
-    query point.
+    ordinary kd-tree with these points, then querying this kd-tree once
+    for each relevant periodic image of the whole array of query points.
 
     Note that to ensure that no two distinct images of the same point
     appear in the results, it is essential to restrict the maximum
@@ -199,10 +198,6 @@ class PeriodicCKDTree(cKDTree):
     def __init__(self, data, boxsize=None, leafsize=10):
         """Construct a kd-tree.
 
-        Parameters
-        ----------
-        Construct a kd-tree.
-
         Parameters
         ----------
         data : array_like, shape (n,k)
@@ -219,50 +214,60 @@ class PeriodicCKDTree(cKDTree):
             brute-force.
 
         """
-        # Map all points to canonical periodic image
-        boxsize = self.boxsize = np.asarray(boxsize)
-        data = np.asarray(data)
-        wrapped_data = data - \
-            np.where(boxsize > 0.0, np.floor(data / boxsize) * boxsize, 0.0)
+        # cKDTree.boxsize is a read-only attribute in scipy >= 0.16,
+        # so the periodic box is stored as `periodic_boxsize`.
+        boxsize = self.periodic_boxsize = np.asarray(boxsize, dtype=float)
 
         # Calculate maximum distance_upper_bound
         self.max_distance_upper_bound = \
             np.amin(np.where(boxsize > 0, 0.5 * boxsize, np.inf))
 
-        # Set up underlying kd-tree
-        super().__init__(wrapped_data, leafsize)
+        # Set up underlying kd-tree with all points mapped to their
+        # canonical periodic image
+        super().__init__(self._wrap(data), leafsize)
 
-    # Ideally, KDTree and cKDTree would expose identical query and __query
-    # interfaces.  But they don't, and cKDTree.__query is also inaccessible
-    # from Python.  We do our best here to cope.
-    def __query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf):
-        # This is the internal query method, which guarantees that x
-        # is a single point, not an array of points
-        #
-        # A slight complication: k could be "None", which means "return
-        # all neighbors within the given distance_upper_bound".
+    def _wrap(self, x):
+        """Map points `x` onto the canonical unit cell."""
+        x = np.asarray(x, dtype=float)
+        boxsize = self.periodic_boxsize
+        return x - np.where(boxsize > 0, np.floor(x / boxsize) * boxsize, 0.0)
 
-        # Cap distance_upper_bound
-        distance_upper_bound = np.amin([distance_upper_bound,
-                                        self.max_distance_upper_bound])
+    def _generate_images(self, x, distance_upper_bound):
+        """Generate the periodic image displacements of the points `x`.
 
-        # Run queries over all relevant images of x
-        hits_list = []
-        for xi in _generate_images(x, self.boxsize, distance_upper_bound):
-            d, i = \
-                super().query(xi, k, eps, p, distance_upper_bound)
-            if k > 1:
-                hits_list.append(list(zip(d, i)))
-            else:
-                hits_list.append([(d, i)])
+        Parameters
+        ----------
+        x : array_like, shape (n,k)
+            Wrapped query points.
+        distance_upper_bound : nonnegative float
 
-        # Now merge results
-        if k > 1:
-            return heapq.nsmallest(k, itertools.chain(*hits_list))
-        elif k == 1:
-            return [min(itertools.chain(*hits_list))]
-        else:
-            raise ValueError("Invalid k in periodic_kdtree._KDTree__query")
+        Returns
+        -------
+        :class:`~python:list`
+            :class:`~python:list` of (displacement, mask) 2-tuples, where
+            `mask` selects the points in `x` whose image displaced by
+            `displacement` may lie within `distance_upper_bound` of the
+            canonical unit cell.
+
+        """
+        boxsize = self.periodic_boxsize
+        images = [(np.zeros(self.m), np.ones(len(x), dtype=bool))]
+        for i in np.flatnonzero(boxsize > 0):
+            disp = np.zeros(self.m)
+            disp[i] = boxsize[i]
+
+            # Points near lower boundary, include image on upper side
+            lower = np.abs(x[:, i]) < distance_upper_bound
+            # Points near upper boundary, include image on lower side
+            upper = np.abs(boxsize[i] - x[:, i]) < distance_upper_bound
+
+            extra_images = []
+            for xdisp, mask in images:
+                extra_images.append((xdisp + disp, mask & lower))
+                extra_images.append((xdisp - disp, mask & upper))
+            images.extend(extra_images)
+
+        return [(xdisp, mask) for xdisp, mask in images if np.any(mask)]
 
     def query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf):
         """
@@ -301,74 +306,53 @@ class PeriodicCKDTree(cKDTree):
             Missing neighbors are indicated with self.n.
 
         """
-        x = np.asarray(x)
+        x = np.asarray(x, dtype=float)
         if np.shape(x)[-1] != self.m:
             raise ValueError("x must consist of vectors of length "
                              "{:d} but has shape {!s}".format(self.m,
                                                               np.shape(x)))
         if p < 1:
             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
-        retshape = np.shape(x)[:-1]
-        if retshape != ():
-            if k > 1:
-                dd = np.empty(retshape+(k,), dtype=np.float)
-                dd.fill(np.inf)
-                ii = np.empty(retshape+(k,), dtype=np.int)
-                ii.fill(self.n)
-            elif k == 1:
-                dd = np.empty(retshape, dtype=np.float)
-                dd.fill(np.inf)
-                ii = np.empty(retshape, dtype=np.int)
-                ii.fill(self.n)
-            else:
-                raise ValueError("k must be >= 1, or None")
-            for c in np.ndindex(retshape):
-                hits = self.__query(x[c], k=k, eps=eps, p=p,
-                                    distance_upper_bound=distance_upper_bound)
-                if k > 1:
-                    for j in range(len(hits)):
-                        dd[c+(j,)], ii[c+(j,)] = hits[j]
-                elif k == 1:
-                    if len(hits) > 0:
-                        dd[c], ii[c] = hits[0]
-                    else:
-                        dd[c] = np.inf
-                        ii[c] = self.n
-            return dd, ii
-        else:
-            hits = self.__query(x, k=k, eps=eps, p=p,
-                                distance_upper_bound=distance_upper_bound)
-            if k == 1:
-                if len(hits) > 0:
-                    return hits[0]
-                else:
-                    return np.inf, self.n
-            elif k > 1:
-                dd = np.empty(k, dtype=np.float)
-                dd.fill(np.inf)
-                ii = np.empty(k, dtype=np.int)
-                ii.fill(self.n)
-                for j in range(len(hits)):
-                    dd[j], ii[j] = hits[j]
-                return dd, ii
-            else:
-                raise ValueError("k must be >= 1, or None")
-
-    # Ideally, KDTree and cKDTree would expose identical __query_ball_point
-    # interfaces.  But they don't, and cKDTree.__query_ball_point is also
-    # inaccessible from Python.  We do our best here to cope.
-    def __query_ball_point(self, x, r, p=2., eps=0):
-        # This is the internal query method, which guarantees that x
-        # is a single point, not an array of points
+        if k is None or k < 1:
+            raise ValueError("k must be >= 1")
 
-        # Cap r
-        r = min(r, self.max_distance_upper_bound)
+        # Cap distance_upper_bound
+        distance_upper_bound = np.amin([distance_upper_bound,
+                                        self.max_distance_upper_bound])
 
-        # Run queries over all relevant images of x
-        results = []
-        for xi in _generate_images(x, self.boxsize, r):
-            results.extend(super().query_ball_point(xi, r, p, eps))
-        return results
+        retshape = np.shape(x)[:-1]
+        x = self._wrap(x.reshape((-1, self.m)))
+        npts = len(x)
+
+        # Run one vectorized query for each relevant image of the points
+        dd = []
+        ii = []
+        for xdisp, mask in self._generate_images(x, distance_upper_bound):
+            d = np.empty((npts, k), dtype=float)
+            d.fill(np.inf)
+            i = np.empty((npts, k), dtype=int)
+            i.fill(self.n)
+            dmask, imask = \
+                super().query(x[mask] + xdisp, k=k, eps=eps, p=p,
+                              distance_upper_bound=distance_upper_bound)
+            d[mask] = np.reshape(dmask, (-1, k))
+            i[mask] = np.reshape(imask, (-1, k))
+            dd.append(d)
+            ii.append(i)
+
+        # Now merge results, ordered by distance and then by index
+        dd = np.hstack(dd)
+        ii = np.hstack(ii)
+        order = np.lexsort((ii, dd), axis=1)[:, :k]
+        rows = np.arange(npts)[:, np.newaxis]
+        dd = dd[rows, order]
+        ii = ii[rows, order]
+
+        if k == 1:
+            if retshape == ():
+                return dd[0, 0], ii[0, 0]
+            return dd.reshape(retshape), ii.reshape(retshape)
+        return dd.reshape(retshape + (k,)), ii.reshape(retshape + (k,))
 
     def query_ball_point(self, x, r, p=2., eps=0):
         """
@@ -401,18 +385,31 @@ class PeriodicCKDTree(cKDTree):
         save substantial amounts of time by putting them in a
         PeriodicCKDTree and using query_ball_tree.
         """
-        x = np.asarray(x).astype(np.float)
+        x = np.asarray(x, dtype=float)
         if x.shape[-1] != self.m:
             raise ValueError("Searching for a %d-dimensional point in a "
                              "%d-dimensional KDTree" % (x.shape[-1], self.m))
-        if len(x.shape) == 1:
-            return self.__query_ball_point(x, r, p, eps)
-        else:
-            retshape = x.shape[:-1]
-            result = np.empty(retshape, dtype=np.object)
-            for c in np.ndindex(retshape):
-                result[c] = self.__query_ball_point(x[c], r, p, eps)
-            return result
+
+        # Cap r
+        r = min(r, self.max_distance_upper_bound)
+
+        retshape = x.shape[:-1]
+        x = self._wrap(x.reshape((-1, self.m)))
+
+        # Run one vectorized query for each relevant image of the points
+        results = [[] for _ in range(len(x))]
+        for xdisp, mask in self._generate_images(x, r):
+            hits = super().query_ball_point(x[mask] + xdisp, r, p, eps)
+            for n, nhits in zip(np.flatnonzero(mask), hits):
+                results[n].extend(nhits)
+
+        if retshape == ():
+            return results[0]
+
+        result = np.empty(len(results), dtype=np.object)
+        for n, nresults in enumerate(results):
+            result[n] = nresults
+        return result.reshape(retshape)
 
     # def query_ball_tree(self, other, r, p=2., eps=0):
     #     raise NotImplementedError()
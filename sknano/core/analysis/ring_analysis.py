@@ -14,6 +14,7 @@ __docformat__ = 'restructuredtext en'
 from collections import deque
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 # from sknano.core import timethis
 # from sknano.core.math import Vector
@@ -28,7 +29,8 @@ __all__ = ['find_rings', 'py_find_rings']
 
 # @timethis
 def find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
-               max_ring_size=None, eps=0.0001, pyversion=False):
+               max_ring_size=None, eps=0.0001, pyversion=False,
+               num_threads=1):
     """Find rings.
 
     Parameters
@@ -37,29 +39,68 @@ def find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
     NNN : :class:`~python:int`
     nn_idx : :class:`~numpy:numpy.ndarray`
     nn_seed : :class:`~numpy:numpy.ndarray`
-    nn_amat : :class:`~numpy:numpy.ndarray`
+    nn_amat : :class:`~scipy:scipy.sparse.csr_matrix`
+        Sparse nearest-neighbor adjacency matrix. The graph distances
+        between atoms are computed from its sparsity structure as needed.
     nn_vecs : :class:`~numpy:numpy.ndarray`
     max_ring_size : :class:`~python:int`, optional
     eps : :class:`~python:float`, optional
+    pyversion : :class:`~python:bool`, optional
+        Use the pure Python ring finder.
+    num_threads : :class:`~python:int`, optional
+        Number of OpenMP threads to split the root atoms across in the
+        compiled ring finder.
 
     """
     if max_ring_size is None:
         max_ring_size = -1
 
+    nn_amat = csr_matrix(nn_amat)
+    try:
+        nn_vecs = np.asarray([v.__array__() for v in nn_vecs], dtype=np.double)
+    except AttributeError:
+        nn_vecs = np.asarray(nn_vecs, dtype=np.double)
+    nn_vecs = nn_vecs.reshape((-1, 3))
+
     if _ring_finder is None or pyversion:
         return py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
                              max_ring_size, eps)
 
     nn_idx = np.asarray(nn_idx, dtype=np.intc)
     nn_seed = np.asarray(nn_seed, dtype=np.intc)
-    nn_amat = np.asarray(nn_amat, dtype=np.intc)
-    try:
-        nn_vecs = np.asarray([v.__array__() for v in nn_vecs], dtype=np.double)
-    except AttributeError:
-        nn_vecs = np.asarray(nn_vecs, dtype=np.double)
+    amat_indptr = np.asarray(nn_amat.indptr, dtype=np.intc)
+    amat_indices = np.asarray(nn_amat.indices, dtype=np.intc)
 
     return _ring_finder.find_rings(Natoms, NNN, nn_idx, nn_seed,
-                                   nn_amat, nn_vecs, max_ring_size, eps)
+                                   amat_indptr, amat_indices, nn_vecs,
+                                   max_ring_size, eps, num_threads)
+
+
+def _graph_distances(root, indptr, indices, max_depth=-1):
+    """Return :class:`~python:dict` of graph distances from `root`.
+
+    Parameters
+    ----------
+    root : :class:`~python:int`
+    indptr, indices : array_like
+        CSR structure of the adjacency matrix.
+    max_depth : :class:`~python:int`, optional
+        Maximum distance to search. Unbounded if negative.
+
+    """
+    distances = {root: 0}
+    nodes = [root]
+    depth = 0
+    while nodes and (max_depth < 0 or depth < max_depth):
+        depth += 1
+        next_nodes = []
+        for i in nodes:
+            for ni in indices[indptr[i]:indptr[i + 1]]:
+                if ni not in distances:
+                    distances[ni] = depth
+                    next_nodes.append(ni)
+        nodes = next_nodes
+    return distances
 
 
 # @timethis
@@ -73,7 +114,7 @@ def py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
     NNN : :class:`~python:int`
     nn_idx : :class:`~numpy:numpy.ndarray`
     nn_seed : :class:`~numpy:numpy.ndarray`
-    nn_amat : :class:`~numpy:numpy.ndarray`
+    nn_amat : :class:`~scipy:scipy.sparse.csr_matrix`
     nn_vecs : :class:`~numpy:numpy.ndarray`
     max_ring_size : :class:`~python:int`, optional
     eps : :class:`~python:float`, optional
@@ -82,18 +123,44 @@ def py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
     if max_ring_size is None:
         max_ring_size = -1
 
+    nn_amat = csr_matrix(nn_amat)
+    amat_indptr = nn_amat.indptr.tolist()
+    amat_indices = nn_amat.indices.tolist()
+    nn_vecs = np.asarray(nn_vecs, dtype=float).reshape((-1, 3))
+
+    # Paths never extend further than half of the maximum ring size from
+    # the root, so the graph distances beyond that are not needed.
+    max_depth = (max_ring_size + 1) // 2 if max_ring_size > 0 else -1
+
     visited = np.zeros(NNN, dtype=bool)
     # ring_counter = Counter()
     ring_counts = []
     nodes_list = []
 
-    def search_paths(root=None, node=None, d=None):
+    def is_irreducible(nodes):
+        """Check if the graph distance between the ring `nodes` is the \
+            distance along the ring."""
+        ring_size = len(nodes)
+        for n in range(ring_size - 1):
+            distances = _graph_distances(abs(nodes[n]), amat_indptr,
+                                         amat_indices, ring_size // 2)
+            for m in range(n + 1, ring_size):
+                s = m - n
+                if s > ring_size // 2:
+                    s = ring_size - s
+                if distances.get(abs(nodes[m])) != s:
+                    return False
+        return True
+
+    def search_paths(root=None, node=None, d=None, dist=None):
         """Search for closed paths starting from `root` atom.
 
         Parameters
         ----------
         root, node : :class:`~python:int`
         d : array_like
+        dist : :class:`~python:dict`
+            Graph distances from `root`.
 
         """
         q = deque([(root, [node], d)])
@@ -105,8 +172,8 @@ def py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
                 for si in range(nn_seed[i], nn_seed[i+1]):
                     ni = nn_idx[si]
                     if not visited[si] and ni != prev:
-                        di = nn_amat[root][i]
-                        dni = nn_amat[root][ni]
+                        di = dist[i]
+                        dni = dist.get(ni, -1)
                         if (dni == di + 1):
                             if (len(nodes) < (max_ring_size - 1) // 2 or
                                     max_ring_size < 0):
@@ -123,25 +190,16 @@ def py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
                 for si in range(nn_seed[i], nn_seed[i + 1]):
                     ni = nn_idx[si]
                     if not visited[si] and ni != prev:
-                        di = nn_amat[root][i]
-                        dni = nn_amat[root][ni]
+                        di = dist[i]
+                        dni = dist.get(ni, -1)
                         if ni == root:
                             dr = nn_vecs[si] + d
                             # For a closed ring, the vector sum of the
                             # ring bond vectors will have zero length.
-                            if dr.norm < eps:
-                                found_ring = True
+                            if np.linalg.norm(dr) < eps:
                                 nodes.append(root)
                                 ring_size = len(nodes)
-                                for n in range(ring_size):
-                                    for m in range(n + 1, ring_size):
-                                        s = m - n
-                                        if s > ring_size // 2:
-                                            s = ring_size - s
-                                        if nn_amat[abs(nodes[m])][
-                                                abs(nodes[n])] != s:
-                                            found_ring = False
-                                if found_ring:
+                                if is_irreducible(nodes):
                                     nodes_list.append(nodes)
                                     while len(ring_counts) < ring_size + 1:
                                         ring_counts.append(0)
@@ -150,14 +208,18 @@ def py_find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
                             q.append((node, nodes + [-ni], d + nn_vecs[si]))
 
     for i in range(Natoms):
+        dist = None
         for si in range(nn_seed[i], nn_seed[i+1]):
             ni = nn_idx[si]
             if i < ni:
+                if dist is None:
+                    dist = _graph_distances(i, amat_indptr, amat_indices,
+                                            max_depth)
                 visited[si] = True
                 for nsi in range(nn_seed[ni], nn_seed[ni+1]):
                     nni = nn_idx[nsi]
                     if nni == i:
                         visited[nsi] = True
-                search_paths(root=i, node=ni, d=nn_vecs[si])
+                search_paths(root=i, node=ni, d=nn_vecs[si], dist=dist)
 
     return ring_counts, nodes_list
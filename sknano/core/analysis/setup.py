@@ -2,6 +2,7 @@
 from __future__ import division, print_function, absolute_import, \
     unicode_literals
 import os
+import sys
 
 
 def configuration(parent_package='core', top_path=None):
@@ -22,11 +23,17 @@ def configuration(parent_package='core', top_path=None):
 
     extra_compile_args = []
     #extra_compile_args.append('-std=c++11')
+    extra_link_args = []
+    if os.name == 'posix' and sys.platform != 'darwin':
+        # OpenMP for the multithreaded ring finder
+        extra_compile_args.append('-fopenmp')
+        extra_link_args.append('-fopenmp')
 
     config.add_extension('_ring_finder',
                          sources=['_ring_finder.cxx'],
                          include_dirs=include_dirs,
                          extra_compile_args=extra_compile_args,
+                         extra_link_args=extra_link_args,
                          )
 
     return config
@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import nose
+from nose.tools import assert_equal, assert_raises, assert_true
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from sknano.core.analysis import linked_cell_neighbor_list
+from sknano.core.crystallography import Crystal3DLattice, Domain
+
+
+def brute_force_neighbors(coords, cutoff, cell_matrix, offset, pbc):
+    fcoords = np.dot(coords - offset, np.linalg.inv(cell_matrix))
+    fcoords[:, pbc] -= np.floor(fcoords[:, pbc])
+    coords = np.dot(fcoords, cell_matrix) + offset
+    images = [np.array(image) for image in
+              np.ndindex(*[5 if periodic else 1 for periodic in pbc])]
+    images = [np.where(pbc, image - 2, 0) for image in images]
+    Npts = len(coords)
+    image_coords = np.vstack([coords + np.dot(image, cell_matrix)
+                              for image in images])
+    tree = cKDTree(image_coords)
+    zero_image = [i for i, image in enumerate(images) if not np.any(image)][0]
+    neighbors = []
+    for i, x in enumerate(coords):
+        neighbors.append(sorted([j % Npts for j in
+                                 tree.query_ball_point(x, cutoff)
+                                 if j != zero_image * Npts + i]))
+    return neighbors
+
+
+def test1():
+    lattice = Crystal3DLattice(a=10, b=9, c=8, alpha=80, beta=70, gamma=100)
+    cell_matrix = np.asarray(lattice.cell_matrix)
+    offset = np.asarray(lattice.offset)
+    rng = np.random.RandomState(1)
+    for cutoff, pbc in ((2.5, [True, True, False]),
+                        (4.2, [True, True, False]),
+                        (3.5, [True, True, True]),
+                        (3.0, [False, False, False]),
+                        (2.0, [False, True, False])):
+        pbc = np.asarray(pbc)
+        fcoords = rng.random_sample((200, 3)) * [1, 1, 1.5] - [0, 0, 0.2]
+        coords = np.dot(fcoords, cell_matrix)
+        indptr, indices, distances, vectors = \
+            linked_cell_neighbor_list(coords, cutoff, lattice=lattice,
+                                      pbc=pbc)
+        neighbors = brute_force_neighbors(coords, cutoff, cell_matrix,
+                                          offset, pbc)
+        assert_equal(len(indptr), len(coords) + 1)
+        for i in range(len(coords)):
+            assert_equal(sorted(indices[indptr[i]:indptr[i+1]].tolist()),
+                         neighbors[i])
+            assert_true(np.all(np.diff(distances[indptr[i]:indptr[i+1]]) >=
+                               0))
+        assert_true(np.allclose(np.linalg.norm(vectors, axis=1), distances))
+
+
+def test2():
+    domain = Domain()
+    domain.triclinic = True
+    domain.xlo, domain.xhi = -5.0, 5.0
+    domain.ylo, domain.yhi = -5.0, 5.0
+    domain.zlo, domain.zhi = 0.0, 10.0
+    domain.xy, domain.xz, domain.yz = 2.0, 1.0, 0.0
+    coords = np.array([[-4.9, 0, 1], [4.9, 0, 1], [0, 0, 5]])
+    indptr, indices, distances, vectors = \
+        linked_cell_neighbor_list(coords, 1.0, lattice=domain)
+    assert_equal(indices.tolist(), [1, 0])
+    assert_true(np.allclose(distances, 0.2))
+    assert_true(np.allclose(vectors, [[-0.2, 0, 0], [0.2, 0, 0]]))
+
+    indptr, indices, distances, vectors = \
+        linked_cell_neighbor_list(coords, 1.0, lattice=domain,
+                                  pbc=[False, True, True])
+    assert_equal(len(indices), 0)
+    assert_equal(indptr.tolist(), [0, 0, 0, 0])
+
+
+def test3():
+    lattice = Crystal3DLattice(a=10, b=9, c=8, alpha=80, beta=70, gamma=100)
+    coords = np.dot(np.random.RandomState(3).random_sample((50, 3)),
+                    lattice.cell_matrix)
+    for pbc in ([True, True, True], [False, False, True]):
+        assert_raises(ValueError, linked_cell_neighbor_list, coords, 4.0,
+                      lattice=lattice, pbc=pbc)
+    indptr, indices, distances, vectors = \
+        linked_cell_neighbor_list(coords, 4.0, lattice=lattice,
+                                  pbc=[True, True, False])
+    for i in range(len(coords)):
+        neighbors = indices[indptr[i]:indptr[i+1]].tolist()
+        assert_equal(len(neighbors), len(set(neighbors)))
+
+
+if __name__ == '__main__':
+    nose.runmodule()
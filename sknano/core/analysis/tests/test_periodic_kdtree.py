@@ -9,7 +9,7 @@ from __future__ import absolute_import, division, print_function, \
     unicode_literals
 
 import numpy as np
-from sknano.core.analysis import PeriodicKDTree
+from sknano.core.analysis import PeriodicKDTree, PeriodicCKDTree
 
 from nose.tools import assert_is_instance, assert_true
 from numpy.testing import assert_equal, assert_array_equal, \
@@ -132,6 +132,20 @@ class test_random_far(test_random):
         self.x = np.random.randn(self.m)+10
 
 
+class test_random_ckdtree(test_random):
+    def setUp(self):
+        super().setUp()
+        self.kdtree = PeriodicCKDTree(self.data, self.boxsize, leafsize=2)
+
+    def test_kdtree_consistency(self):
+        kdtree = PeriodicKDTree(self.data, self.boxsize, leafsize=2)
+        x = np.random.randn(5, self.m)
+        d, i = self.kdtree.query(x, self.k, distance_upper_bound=self.d)
+        d_real, i_real = kdtree.query(x, self.k, distance_upper_bound=self.d)
+        assert_array_almost_equal(d, d_real)
+        assert_array_equal(i, i_real)
+
+
 class test_small(ConsistencyTests):
     def setUp(self):
         self.data = np.array([[0, 0, 0],
@@ -164,6 +178,12 @@ class test_small_nonleaf(test_small):
         self.kdtree = PeriodicKDTree(self.data, self.boxsize, leafsize=1)
 
 
+class test_small_ckdtree(test_small):
+    def setUp(self):
+        super().setUp()
+        self.kdtree = PeriodicCKDTree(self.data, self.boxsize)
+
+
 class test_vectorization(object):
     def setUp(self):
         self.data = np.array([[0, 0, 0],
@@ -261,6 +281,19 @@ class test_random_ball(ball_consistency):
         self.d = 0.2
 
 
+class test_random_ball_ckdtree(test_random_ball):
+
+    def setUp(self):
+        super().setUp()
+        self.T = PeriodicCKDTree(self.data, self.boxsize, leafsize=10)
+
+    def test_kdtree_consistency(self):
+        T = PeriodicKDTree(self.data, self.boxsize, leafsize=10)
+        assert_equal(
+            sorted(self.T.query_ball_point(self.x, self.d, p=self.p)),
+            sorted(T.query_ball_point(self.x, self.d, p=self.p)))
+
+
 class test_random_ball_approx(test_random_ball):
 
     def setUp(self):
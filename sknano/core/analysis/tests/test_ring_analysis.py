@@ -136,6 +136,24 @@ class Tests(AtomsTestFixture):
         #                           pyversion=True)
         # print(ring_cntr)
 
+    def test6(self):
+        atoms = self.atoms
+        atoms.set_pbc('xyz')
+        atoms.update_neighbors()
+        rings, ring_cntr = \
+            atoms.analyze_network(cutoff=1.5, max_ring_size=20,
+                                  retcodes=('rings', 'ring_counter'))
+        mt_rings, mt_ring_cntr = \
+            atoms.analyze_network(cutoff=1.5, max_ring_size=20,
+                                  retcodes=('rings', 'ring_counter'),
+                                  num_threads=4)
+        assert_equal(ring_cntr, mt_ring_cntr)
+        assert_equal(mt_ring_cntr[6], 50)
+        assert_equal(mt_ring_cntr[10], 10)
+        for n, n_rings in rings.items():
+            assert_equal([ring.ids.tolist() for ring in n_rings],
+                         [ring.ids.tolist() for ring in mt_rings[n]])
+
 
 if __name__ == '__main__':
     nose.runmodule()
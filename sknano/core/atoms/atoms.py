@@ -16,12 +16,13 @@ from operator import attrgetter
 import copy
 import numbers
 import re
+import weakref
 # import warnings
 
 import numpy as np
 
 from sknano.core import BaseClass, UserList, TabulateMixin, dedupe
-from sknano.core.math import convert_condition_str, \
+from sknano.core.math import Vector, convert_condition_str, \
     get_rotation_parameters_from_kwargs
 from sknano.core.refdata import atomic_masses, atomic_mass_symbol_map, \
     atomic_numbers, atomic_number_symbol_map, element_symbols, element_names
@@ -70,6 +71,42 @@ class Atom(BaseClass):
     def _is_valid_operand(self, other):
         return isinstance(other, self.__class__)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if isinstance(value, Vector):
+            value.__dict__['_owner'] = self
+        if self.__dict__.get('_containers'):
+            self._update_attrs_version(name)
+
+    def __setstate__(self, state):
+        state.pop('_containers', None)
+        self.__dict__.update(state)
+        for value in state.values():
+            if isinstance(value, Vector) and \
+                    value.__dict__.get('_owner') is None:
+                value.__dict__['_owner'] = self
+
+    def _update_attrs_version(self, name=None):
+        """Invalidate the cached columns of the `Atoms` containing `self`.
+
+        Called whenever an attribute is assigned and when one of the
+        :class:`~sknano.core.math.Vector` attributes is modified in-place.
+
+        Parameters
+        ----------
+        name : {None, :class:`~python:str`}, optional
+            Name of the modified attribute, or `None` if unknown.
+
+        """
+        containers = self.__dict__.get('_containers')
+        if containers:
+            for key, ref in list(containers.items()):
+                atoms = ref()
+                if atoms is None:
+                    del containers[key]
+                else:
+                    atoms._attrs_changed(name)
+
     @property
     def __atoms_class__(self):
         return Atoms
@@ -308,6 +345,9 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
         existing `Atoms` instance object.
 
     """
+    _attrs_version = 0
+    _atoms_registered = False
+
     def __init__(self, atoms=None, update_item_class=True, **kwargs):
         verbose = kwargs.get('verbose', False)
         if atoms is not None and \
@@ -344,6 +384,126 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
     def __atom_class__(self):
         return Atom
 
+    @property
+    def data(self):
+        """:class:`~python:list` of `Atom` objects."""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._reset_columns()
+
+    def _reset_columns(self):
+        """Discard all cached attribute columns."""
+        self._columns = {}
+        self._atoms_registered = False
+
+    def _register_atoms(self):
+        """Register `self` with its atoms.
+
+        Registered atoms invalidate the cached columns of `self` when
+        they are modified (see :meth:`Atom._update_attrs_version`).
+
+        """
+        if self._atoms_registered:
+            return
+        key = id(self)
+        ref = weakref.ref(self)
+        for atom in self._data:
+            containers = atom.__dict__.get('_containers')
+            if containers is None:
+                containers = atom.__dict__['_containers'] = {}
+            elif len(containers) > 32:
+                for k in [k for k, r in containers.items() if r() is None]:
+                    del containers[k]
+            containers[key] = ref
+        self._atoms_registered = True
+
+    def _attrs_changed(self, name=None):
+        """Invalidate the cached columns after an `Atom` attribute changed.
+
+        Parameters
+        ----------
+        name : {None, :class:`~python:str`}, optional
+            Name of the modified attribute, or `None` if unknown.
+
+        """
+        self._attrs_version += 1
+
+    def _update_attrs_version(self):
+        """Invalidate the cached columns of every `Atoms` containing the \
+            atoms in `self`.
+
+        Must be called after the atom attributes are modified in-place
+        without going through the `Atom` or
+        :class:`~sknano.core.math.Vector` methods, e.g. through
+        :class:`~numpy:numpy.ndarray` views of the position vectors.
+
+        """
+        for atom in self._data:
+            atom._update_attrs_version()
+        self._attrs_changed()
+
+    def get_column(self, attr, aslist=False):
+        """Return cached column of `Atom` attribute `attr` values.
+
+        The column is gathered from the atoms on first access and reused
+        until either the list of atoms or an attribute of one of the atoms
+        is modified.
+        The returned column is shared with the cache and must not be
+        modified.
+
+        Parameters
+        ----------
+        attr : :class:`~python:str`
+            Name of `Atom` attribute.
+        aslist : :class:`~python:bool`, optional
+            If `True`, return the :class:`~python:list` of attribute values
+            instead of a read-only :class:`~numpy:numpy.ndarray`.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray` or :class:`~python:list`
+
+        """
+        def column():
+            values = [getattr(atom, attr) for atom in self._data]
+            if not aslist:
+                values = np.asarray(values)
+                values.flags.writeable = False
+            return values
+
+        return self._get_cached((attr, aslist), column)
+
+    def _get_cached(self, key, compute):
+        """Return cached result of `compute()` stored under `key`.
+
+        The result is invalidated together with the cached attribute
+        columns, i.e. when either the list of atoms or an attribute of one
+        of the atoms is modified.
+
+        Parameters
+        ----------
+        key : :class:`~python:collections.abc.Hashable`
+        compute : :class:`~python:collections.abc.Callable`
+            Function of no arguments that computes the value.
+
+        """
+        try:
+            version, value = self._columns[key]
+        except KeyError:
+            pass
+        else:
+            if version == self._attrs_version:
+                return value
+
+        self._register_atoms()
+        version = self._attrs_version
+        value = compute()
+        self._columns[key] = (version, value)
+        return value
+
     @property
     def __item_class__(self):
         return self.__atom_class__
@@ -408,6 +568,7 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
         if isinstance(key, str):
             key = attrgetter(key)
         super().sort(key=key, reverse=reverse)
+        self._reset_columns()
 
     @classmethod
     def _from_iterable(cls, it, **kwargs):
@@ -455,71 +616,159 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
                 #     item = self.__atom_class__(item)
                 item = self.__cast_item(item)
         super().__setitem__(index, item)
+        self._reset_columns()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reset_columns()
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._reset_columns()
+        return self
 
     def append(self, atom):
         if not self._is_valid_operand(atom):
             atom = self.__cast_item(atom)
         super().append(atom)
+        self._reset_columns()
 
     def insert(self, i, atom):
         if not self._is_valid_operand(atom):
             atom = self.__cast_item(atom)
         super().insert(i, atom)
+        self._reset_columns()
+
+    def extend(self, other):
+        super().extend(other)
+        self._reset_columns()
+
+    def pop(self, i=-1):
+        self._reset_columns()
+        return super().pop(i)
+
+    def remove(self, atom):
+        super().remove(atom)
+        self._reset_columns()
+
+    def clear(self):
+        super().clear()
+        self._reset_columns()
+
+    def reverse(self):
+        super().reverse()
+        self._reset_columns()
+
+    def _lookup_key(self, atom):
+        """Return hashable key used to look up `atom` in hash tables.
+
+        Atoms that compare equal must have equal keys. `Atom` equality
+        requires equal :attr:`~Atom.element`\ s.
+
+        """
+        return atom.element
+
+    def _lookup_keys(self, atom):
+        """Return the :meth:`_lookup_key`\ s of the atoms that may compare \
+            equal to `atom`."""
+        return (self._lookup_key(atom),)
+
+    def _lookup_table(self):
+        """Return :class:`~python:dict` mapping :meth:`_lookup_key`\ s to \
+            the list positions of the atoms with that key."""
+        table = {}
+        for i, atom in enumerate(self.data):
+            table.setdefault(self._lookup_key(atom), []).append(i)
+        return table
+
+    def _contains_mask(self, atoms):
+        """Return :class:`~python:list` of :class:`~python:bool`\ s testing \
+            whether each atom in `atoms` is in `self`.
+
+        Equivalent to ``[atom in self for atom in atoms]``, but atoms are
+        first looked up by identity and otherwise only compared with the
+        atoms with one of their :meth:`_lookup_keys`, so the cost is linear
+        in the number of atoms as long as few atoms share a key.
+
+        """
+        data = self.data
+        identities = {id(atom) for atom in data}
+        table = self._lookup_table()
+        return [id(atom) in identities or
+                any(data[i] is atom or atom == data[i]
+                    for key in self._lookup_keys(atom)
+                    for i in table.get(key, ()))
+                for atom in atoms]
 
     def __add__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
+        other = self.__cast(other)
         atoms = self.data + \
-            list(atom for atom in self.__cast(other) if atom not in self)
+            [atom for atom, found in zip(other, self._contains_mask(other))
+             if not found]
         return self._from_iterable(atoms, **self.kwargs)
 
     def __radd__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
         other = self.__cast(other)
-        atoms = other.data + list(atom for atom in self if atom not in other)
+        atoms = other.data + \
+            [atom for atom, found in zip(self, other._contains_mask(self))
+             if not found]
         return self._from_iterable(atoms, **self.kwargs)
 
     def __iadd__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        self.data += list(atom for atom in self.__cast(other)
-                          if atom not in self)
+        other = self.__cast(other)
+        self.data += \
+            [atom for atom, found in zip(other, self._contains_mask(other))
+             if not found]
         return self
 
     def __sub__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        return self._from_iterable((atom for atom in self
-                                    if atom not in self.__cast(other)),
-                                   **self.kwargs)
+        other = self.__cast(other)
+        return self._from_iterable(
+            (atom for atom, found in zip(self, other._contains_mask(self))
+             if not found), **self.kwargs)
 
     def __rsub__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        return self._from_iterable((atom for atom in self.__cast(other)
-                                    if atom not in self),
-                                   **self.kwargs)
+        other = self.__cast(other)
+        return self._from_iterable(
+            (atom for atom, found in zip(other, self._contains_mask(other))
+             if not found), **self.kwargs)
 
     def __isub__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        self.data -= list(atom for atom in self.__cast(other) if atom in self)
+        other = self.__cast(other)
+        self.data = \
+            [atom for atom, found in zip(self, other._contains_mask(self))
+             if not found]
         return self
 
     def __and__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        return self._from_iterable((atom for atom in self.__cast(other)
-                                    if atom in self), **self.kwargs)
+        other = self.__cast(other)
+        return self._from_iterable(
+            (atom for atom, found in zip(other, self._contains_mask(other))
+             if found), **self.kwargs)
 
     __rand__ = __and__
 
     def __iand__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
-        self.data -= list(atom for atom in self.__cast(other)
-                          if atom not in self)
+        other = self.__cast(other)
+        self.data = \
+            [atom for atom, found in zip(self, other._contains_mask(self))
+             if found]
         return self
 
     def __or__(self, other):
@@ -535,8 +784,10 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
     def __ior__(self, other):
         if not self._is_valid_operand(other):
             return NotImplemented
+        other = self.__cast(other)
         self.data += \
-            list(atom for atom in self.__cast(other) if atom not in self)
+            [atom for atom, found in zip(other, self._contains_mask(other))
+             if not found]
         return self
 
     def __xor__(self, other):
@@ -554,11 +805,11 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
             self.clear()
         else:
             other = self.__cast(other)
-            for atom in other:
-                if atom in self:
-                    self.remove(atom)
-                else:
-                    self.append(atom)
+            in_self = self._contains_mask(other)
+            in_other = other._contains_mask(self)
+            self.data = \
+                [atom for atom, found in zip(self, in_other) if not found] + \
+                [atom for atom, found in zip(other, in_self) if not found]
         return self
 
     @property
@@ -575,17 +826,17 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
     @property
     def elements(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`Atom.element`\ s."""
-        return np.asarray([atom.element for atom in self])
+        return self.get_column('element').copy()
 
     @property
     def masses(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`Atom.mass`\ s."""
-        return np.asarray([atom.mass for atom in self])
+        return self.get_column('mass').copy()
 
     @property
     def symbols(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`Atom.symbol`\ s."""
-        return np.asarray([atom.symbol for atom in self])
+        return self.get_column('symbol').copy()
 
     def filter(self, condition, invert=False):
         """Filter `Atoms` by `condition`.
@@ -718,8 +969,13 @@ class Atoms(AtomsSelectionMixin, TabulateMixin, UserList):
                     obj = getattr(obj, attr, default)
                 attr_values.append(obj)
             return np.asarray(attr_values)
-        else:
-            return np.asarray([getattr(atom, attr, default) for atom in self])
+
+        if default is None and hasattr(self.__atom_class__, attr):
+            try:
+                return self.get_column(attr).copy()
+            except AttributeError:
+                pass
+        return np.asarray([getattr(atom, attr, default) for atom in self])
 
     def mapatomattr(self, from_attr=None, to_attr=None, attrmap=None):
         """Set/update atom attribute from another atom attribute with dict.
@@ -136,7 +136,7 @@ class ChargedAtoms(Atoms):
     @property
     def charges(self):
         """Return array of `ChargedAtom` charges."""
-        return np.asarray([atom.q for atom in self])
+        return self.get_column('q').copy()
 
     @property
     def q(self):
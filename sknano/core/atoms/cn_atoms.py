@@ -130,7 +130,7 @@ class CNAtoms(Atoms):
     @property
     def coordination_numbers(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`CNAtom.CN`\ s."""
-        return np.asarray([atom.CN for atom in self])
+        return self.get_column('CN').copy()
 
     @property
     def coordination_number_counts(self):
@@ -232,7 +232,7 @@ class DipoleAtoms(Atoms):
     @property
     def p(self):
         """:class:`Vectors` of :attr:`DipoleAtom.p` :class:`Vector`\ s."""
-        return Vectors([atom.p for atom in self])
+        return Vectors(self.get_column('p', aslist=True))
 
     @property
     def dipole_moments(self):
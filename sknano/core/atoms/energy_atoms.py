@@ -167,17 +167,17 @@ class EnergyAtoms(Atoms):
     @property
     def ke(self):
         """:class:`~numpy:numpy.ndarray` of `EnergyAtom.ke`."""
-        return np.asarray([atom.ke for atom in self])
+        return self.get_column('ke').copy()
 
     @property
     def pe(self):
         """:class:`~numpy:numpy.ndarray` of `EnergyAtom.pe`."""
-        return np.asarray([atom.pe for atom in self])
+        return self.get_column('pe').copy()
 
     @property
     def etotal(self):
         """:class:`~numpy:numpy.ndarray` of `EnergyAtom.etotal`."""
-        return np.asarray([atom.etotal for atom in self])
+        return self.get_column('etotal').copy()
 
     @property
     def kinetic_energies(self):
@@ -244,7 +244,7 @@ class ForceAtoms(Atoms):
     @property
     def f(self):
         """:class:`Vectors` of `ForceAtom` forces."""
-        return Vectors([atom.f for atom in self])
+        return Vectors(self.get_column('f', aslist=True))
 
     @property
     def forces(self):
@@ -202,19 +202,25 @@ class IDAtoms(Atoms):
         existing `IDAtoms` instance object.
 
     """
+    _ids_version = 0
+
     @property
     def __atom_class__(self):
         return IDAtom
 
+    def _attrs_changed(self, name=None):
+        if name in (None, '_id'):
+            self._ids_version += 1
+        super()._attrs_changed(name)
+
     def sort(self, key=attrgetter('mol', 'id'), reverse=False):
         super().sort(key=key, reverse=reverse)
 
     @property
     def ids(self):
         """Return array of :attr:`IDAtom.id`\ s."""
-        if len(set([atom.id for atom in self])) != len(self):
-            self.assign_unique_ids()
-        return np.asarray([atom.id for atom in self])
+        self._get_id_index()
+        return self.get_column('id').copy()
 
     @property
     def atom_ids(self):
@@ -229,7 +235,7 @@ class IDAtoms(Atoms):
     @property
     def mols(self):
         """Return array of `IDAtom.mol`\ s."""
-        return np.asarray([atom.mol for atom in self])
+        return self.get_column('mol').copy()
 
     @property
     def mol_ids(self):
@@ -244,13 +250,121 @@ class IDAtoms(Atoms):
     @property
     def indices(self):
         """Return array of :attr:`IDAtom.index`\ s."""
-        return np.asarray([self.index(atom) for atom in self])
+        data = self.data
+        table = self._lookup_table()
+        return np.asarray(
+            [next(i for i in table[self._lookup_key(atom)]
+                  if data[i] is atom or atom == data[i])
+             for atom in data], dtype=int)
+
+    def _lookup_key(self, atom):
+        """Return hashable key used to look up `atom` in hash tables.
+
+        `IDAtom` equality requires equal :attr:`IDAtom.id`\ s.
+
+        """
+        return atom.id
 
     def assign_unique_ids(self, starting_id=1):
         """Assign unique :attr:`IDAtom.id` to each `IDAtom` in `IDAtoms`."""
         [setattr(atom, 'id', i) for i, atom in
          enumerate(self, start=starting_id)]
 
+    def _get_id_index(self):
+        """Return cached :class:`~python:dict` mapping ids to list indices.
+
+        The map is rebuilt only after the list of atoms or the
+        :attr:`IDAtom.id` of any `IDAtom` is modified. If the
+        :attr:`IDAtom.id`\ s are not unique,
+        :meth:`~IDAtoms.assign_unique_ids` is called first.
+
+        Returns
+        -------
+        :class:`~python:dict`
+
+        """
+        try:
+            version, id_index = self._columns['id_index']
+        except KeyError:
+            pass
+        else:
+            if version == self._ids_version:
+                return id_index
+
+        ids = self.get_column('id').tolist()
+        id_index = dict(zip(ids, range(len(ids))))
+        if len(id_index) != len(ids):
+            self.assign_unique_ids()
+            ids = self.get_column('id').tolist()
+            id_index = dict(zip(ids, range(len(ids))))
+        self._columns['id_index'] = (self._ids_version, id_index)
+        return id_index
+
+    def _get_id_indices(self, atom_ids):
+        """Return list indices of the atoms with ids in `atom_ids`.
+
+        Parameters
+        ----------
+        atom_ids : array_like
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Array of list indices in the order of `atom_ids`, excluding
+            ids not found in `IDAtoms`.
+
+        """
+        indices = self._lookup_ids(atom_ids)
+        return indices[indices >= 0]
+
+    def _lookup_ids(self, atom_ids):
+        """Return list indices of the atoms with ids `atom_ids`.
+
+        The ids are looked up by binary search in the cached sorted
+        array of :attr:`IDAtom.id`\ s.
+
+        Parameters
+        ----------
+        atom_ids : array_like
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Array of list indices aligned with `atom_ids`, with -1 for
+            ids not found in `IDAtoms`.
+
+        """
+        self._get_id_index()
+        try:
+            version, ids, order = self._columns['sorted_ids']
+        except KeyError:
+            version = None
+        if version != self._ids_version:
+            ids = self.get_column('id')
+            order = np.argsort(ids, kind='mergesort')
+            ids = ids[order]
+            self._columns['sorted_ids'] = (self._ids_version, ids, order)
+
+        atom_ids = np.asarray(atom_ids).ravel()
+        indices = np.full(atom_ids.size, -1, dtype=int)
+        if ids.size == 0 or atom_ids.size == 0:
+            return indices
+        positions = np.searchsorted(ids, atom_ids)
+        positions[positions == ids.size] = 0
+        found = ids[positions] == atom_ids
+        indices[found] = order[positions[found]]
+        return indices
+
+    def _atoms_with_ids(self, atom_ids, invert=False):
+        """Return :class:`~python:list` of atoms with ids in `atom_ids`."""
+        indices = self._get_id_indices(atom_ids)
+        data = self.data
+        if invert:
+            mask = np.ones(len(data), dtype=bool)
+            mask[indices] = False
+            indices = np.flatnonzero(mask)
+        return [data[i] for i in indices.tolist()]
+
     def filter_ids(self, atom_ids, invert=False):
         """Filter `Atoms` by :attr:`IDAtoms.ids` in `atom_ids`.
 
@@ -263,11 +377,10 @@ class IDAtoms(Atoms):
         ----------
         atom_ids : array_like
         invert : bool, optional
+            If `True`, keep the atoms whose ids are **not** in `atom_ids`.
 
         """
-        # mask = np.in1d(self.ids, atom_ids, invert=invert).nonzero()
-        # self.data = np.asarray(self)[mask].tolist()
-        self.data = [self.get_atom(id) for id in atom_ids]
+        self.data = self._atoms_with_ids(atom_ids, invert=invert)
 
     def filtered_ids(self, atom_ids, invert=False):
         """Return new `Atoms` object filtered by `atom_ids`.
@@ -281,6 +394,7 @@ class IDAtoms(Atoms):
         ----------
         atom_ids : array_like
         invert : bool, optional
+            If `True`, return the atoms whose ids are **not** in `atom_ids`.
 
         Returns
         -------
@@ -288,10 +402,8 @@ class IDAtoms(Atoms):
             An instance of `Atoms` (sub)class.
 
         """
-        # mask = np.in1d(self.ids, atom_ids, invert=invert).nonzero()
-        # return self.__class__(atoms=np.asarray(self)[mask].tolist(),
-        #                       **self.kwargs)
-        return self.__class__(atoms=[self.get_atom(id) for id in atom_ids],
+        return self.__class__(atoms=self._atoms_with_ids(atom_ids,
+                                                         invert=invert),
                               **self.kwargs)
 
     def get_atom(self, id):
@@ -309,15 +421,16 @@ class IDAtoms(Atoms):
 
         """
         try:
-            return self[np.where(self.ids == id)[0]]
-        except TypeError:
+            return self.data[self._get_id_index()[id]]
+        except (KeyError, TypeError):
             print('No atom with id = {}'.format(id))
             return None
 
     def get_atoms(self, ids=None, **kwargs):
         """Overrides parent class :meth:`Atoms.get_atoms`.
 
-        Calls :meth:`~IDAtoms.filtered_ids` if `ids` is not None.
+        Returns the atoms with :attr:`IDAtom.id`\ s in `ids` if `ids` is
+        not None, looked up in a single batch.
 
         Parameters
         ----------
@@ -334,6 +447,10 @@ class IDAtoms(Atoms):
         """
         if ids is None:
             return super().get_atoms(**kwargs)
-        else:
-            kwargs['aslist'] = kwargs.pop('aslist', False)
-            return self.filtered_ids(ids).get_atoms(**kwargs)
+
+        atoms = self._atoms_with_ids(ids)
+        if kwargs.get('asarray', False):
+            return np.asarray(atoms)
+        elif kwargs.get('aslist', False):
+            return atoms
+        return self.__class__(atoms=atoms, **self.kwargs)
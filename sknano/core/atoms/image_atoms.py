@@ -175,7 +175,7 @@ class ImageAtoms(Atoms):
     @property
     def images(self):
         """:class:`~numpy:numpy.ndarray` of `ImageAtom` images."""
-        return np.asarray([atom.i for atom in self])
+        return self.get_column('i').copy()
 
     @property
     def i(self):
@@ -334,8 +334,9 @@ class LatticeAtoms(PBCAtomsMixin, Atoms):
     def wrap_coords(self, pbc=None):
         """Wrap coordinates into lattice."""
         try:
-            [setattr(atom, 'r', self.lattice.wrap_cartesian_coordinate(
-                     atom.r, pbc=pbc if pbc is not None else self.pbc))
-             for atom in self]
+            coords = self.lattice.wrap_cartesian_coordinates(
+                self.get_column('r').reshape(-1, 3),
+                pbc=pbc if pbc is not None else self.pbc)
         except AttributeError:
-            pass
+            return
+        [setattr(atom, 'r', r) for atom, r in zip(self, coords)]
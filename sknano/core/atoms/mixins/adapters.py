@@ -102,11 +102,7 @@ class VMDAtomsAdapterMixin:
         :class:`~sknano.core.atoms.Atom` or `None`
 
         """
-        try:
-            return self[np.where(self.vmd_indices == vmd_index)[0]]
-        except TypeError:
-            print('No atom with id = {}'.format(vmd_index))
-            return None
+        return self.get_atom(vmd_index + 1)
 
     def get_vmd_selection_string(self, keyword):
         """Get a VMD selection string for the VMD keyword."""
@@ -11,6 +11,8 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from itertools import compress
+
 import numpy as np
 # import pandas as pd
 
@@ -125,6 +127,6 @@ class BoundingRegionsMixin:
         region : :class:`~sknano.core.geometric_regions.Geometric3DRegion`
 
         """
-        return \
-            self.__class__([atom for atom in self if region.contains(atom.r)],
-                           update_item_class=False, **self.kwargs)
+        mask = region.contains_points(self._get_coords_array())
+        return self.__class__(list(compress(self, mask.tolist())),
+                              update_item_class=False, **self.kwargs)
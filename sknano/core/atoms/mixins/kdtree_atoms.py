@@ -67,7 +67,7 @@ class KDTreeAtomsMixin(metaclass=ABCMeta):
         """
         atom_tree = self.atom_tree
         if atom_tree is not None:
-            d, i = atom_tree.query(np.asarray(self.coords), k=k+1, eps=eps,
+            d, i = atom_tree.query(self._get_coords_array(), k=k+1, eps=eps,
                                    p=p, distance_upper_bound=rc)
             return d[:, 1:], i[:, 1:]
 
@@ -108,8 +108,10 @@ class KDTreeAtomsMixin(metaclass=ABCMeta):
 
         Parameters
         ----------
-        other : :class:`~scipy:scipy.spatial.KDTree`
-            The tree containing points to search against
+        other : :class:`~sknano.core.atoms.Atoms`
+            The `Atoms` to search against. Their coordinates are queried
+            against the cached :attr:`atom_tree`, so no tree is built
+            for `other`.
         r : positive :class:`~python:float`
             The radius of :class:`~sknano.core.atoms.KDTAtoms` to return
         p : float, 1<=p<=infinity
@@ -127,10 +129,8 @@ class KDTreeAtomsMixin(metaclass=ABCMeta):
         """
         atom_tree = self.atom_tree
         if atom_tree is not None:
-            # NNi = \
-            #     atom_tree.query_ball_tree(other.atom_tree, r, p=p, eps=eps)
-            NNi = \
-                other.atom_tree.query_ball_tree(atom_tree, r, p=p, eps=eps)
+            NNi = atom_tree.query_ball_point(other._get_coords_array(), r,
+                                             p=p, eps=eps)
             NNi = list(dedupe(flatten(NNi)))
 
         return self.__class__(atoms=np.asarray(self)[NNi].tolist(),
@@ -21,7 +21,7 @@ import numpy as np
 np.seterr(all='warn')
 
 from sknano.core import BaseClass, timethis
-from sknano.core.math import Vectors, vector as vec
+from sknano.core.math import Vector, Vectors, vector as vec
 
 __all__ = ['POAV', 'POAV1', 'POAV2', 'POAVR',
            'POAVAtomMixin', 'POAVAtomsMixin']
@@ -503,14 +503,33 @@ class POAVAtomMixin:
         self._POAV1 = None
         self._POAV2 = None
         self._POAVR = None
+        self._POAV_data = None
+
+    def _get_POAV(self, POAV_name):
+        """Return the :class:`POAV` instance `POAV_name`.
+
+        After :meth:`~POAVAtomsMixin.analyze_POAVs`, the instance is created
+        on first access from the row of the POAV arrays of the atom.
+
+        """
+        try:
+            POAV = getattr(self, '_' + POAV_name)
+            poavs, row = self._POAV_data
+        except (AttributeError, TypeError):
+            return getattr(self, '_' + POAV_name, None)
+
+        if POAV is None:
+            POAV = POAV_classes[POAV_name](self)
+            arrays = poavs[POAV_name]
+            for attr in POAV_angles:
+                setattr(POAV, attr, arrays[attr][row].tolist())
+            setattr(self, '_' + POAV_name, POAV)
+        return POAV
 
     @property
     def POAV1(self):
         """:class:`~sknano.core.atoms.mixins.POAV1` instance."""
-        try:
-            return self._POAV1
-        except AttributeError:
-            return None
+        return self._get_POAV('POAV1')
 
     @POAV1.setter
     def POAV1(self, value):
@@ -522,10 +541,7 @@ class POAVAtomMixin:
     @property
     def POAV2(self):
         """:class:`~sknano.core.atoms.mixins.POAV2` instance."""
-        try:
-            return self._POAV2
-        except AttributeError:
-            return None
+        return self._get_POAV('POAV2')
 
     @POAV2.setter
     def POAV2(self, value):
@@ -537,10 +553,7 @@ class POAVAtomMixin:
     @property
     def POAVR(self):
         """:class:`~sknano.core.atoms.mixins.POAVR` instance."""
-        try:
-            return self._POAVR
-        except AttributeError:
-            return None
+        return self._get_POAV('POAVR')
 
     @POAVR.setter
     def POAVR(self, value):
@@ -583,58 +596,67 @@ class POAVAtomsMixin:
 
     @timethis
     def analyze_POAVs(self, **kwargs):
-        """Compute `POAV1`, `POAV2`, `POAVR`."""
+        """Compute `POAV1`, `POAV2`, `POAVR`.
+
+        The POAV vectors and angles of all atoms with 3 bonds are computed
+        at once from the :math:`M\\times 3\\times 3` array of their
+        bond vectors and stored as arrays in :attr:`~POAVAtomsMixin.poavs`.
+        The :class:`POAV` instances of the atoms are created from these
+        arrays when first accessed.
+
+        """
         if not self.neighbors_analyzed:
             self.update_neighbors(**kwargs)
 
-        POAV_classes = {'POAV1': POAV1, 'POAV2': POAV2, 'POAVR': POAVR}
-
-        for atom in self:
+        id_index = self._get_id_index()
+        sp2 = []
+        NN = []
+        NN_coords = []
+        for i, atom in enumerate(self):
+            atom._POAV1 = atom._POAV2 = atom._POAVR = None
+            atom._POAV_data = None
+            neighbors = atom.NN
             # the central atom must have 3 bonds for POAV analysis.
-            if atom.bonds.Nbonds == 3:
-                for POAV_name, POAV_class in list(POAV_classes.items()):
-                    setattr(atom, POAV_name, POAV_class(atom))
+            if neighbors is None or len(neighbors) != 3:
+                continue
+            sp2.append(i)
+            for NN_atom in neighbors:
+                NN.append(id_index.get(NN_atom.id, -1))
+                NN_coords.append(NN_atom.r)
+
+        sp2 = np.asarray(sp2, dtype=int)
+        NN = np.asarray(NN, dtype=int).reshape((-1, 3))
+        NN_coords = np.asarray(NN_coords, dtype=float).reshape((-1, 3, 3))
+        coords = np.take(self._get_coords_array(), sp2, axis=0)
+        bonds = self._minimum_image(NN_coords - coords[:, np.newaxis])
+
+        # the bonded atom must have a POAV to compute the misalignment
+        # angles. Bonded atoms missing from self (index -1) map to the
+        # extra last row.
+        rows = np.full(self.Natoms + 1, -1, dtype=int)
+        rows[sp2] = np.arange(sp2.size)
+        NN_rows = rows[NN]
+
+        R = np.linalg.norm(bonds, axis=-1)
+        V = bonds / R[:, :, np.newaxis]
+        # cosine of the bond angle opposite to each bond
+        cosa = np.einsum('ijk,ijk->ij', np.roll(V, -1, axis=1),
+                         np.roll(V, 1, axis=1))
+        POAV_vi = {'POAV1': V, 'POAV2': cosa[:, :, np.newaxis] * V,
+                   'POAVR': bonds}
+
+        atom_ids = self.ids[sp2]
+        self.poavs = OrderedDict()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for POAV_name in ('POAV1', 'POAV2', 'POAVR'):
+                vi = POAV_vi[POAV_name]
+                arrays = self.poavs[POAV_name] = \
+                    _POAV_arrays(vi, bonds, NN_rows)
+                arrays['atom_ids'] = atom_ids
 
-        for atom in self:
-            # the central atom must have 3 bonds for POAV analysis.
-            if atom.bonds.Nbonds == 3:
-                for POAV_name in ('POAV1', 'POAV2', 'POAVR'):
-                    POAV = getattr(atom, POAV_name)
-                    sigma_pi_angles = []
-                    pyramidalization_angles = []
-                    misalignment_angles = []
-                    for bond, NN in zip(atom.bonds, atom.NN):
-                        # first compute the pyramidalization angle
-                        sigma_pi_angle = vec.angle(POAV.Vpi, bond.vector)
-                        if sigma_pi_angle < np.pi / 2:
-                            sigma_pi_angle = np.pi - sigma_pi_angle
-                        sigma_pi_angles.append(sigma_pi_angle)
-                        pyramidalization_angles.append(
-                            sigma_pi_angle - np.pi / 2)
-
-                        # the bonded atom must have a POAV to compute the
-                        # misalignment angles
-                        if getattr(NN, POAV_name) is not None:
-                            NN_POAV = getattr(NN, POAV_name)
-                            # compute vector that is orthogonal to the plane
-                            # defined by the bond vector and the POAV of the
-                            # center atom.
-                            nvec = vec.cross(bond.vector, POAV.Vpi)
-
-                            # the misalignment angle is the angle between the
-                            # nearest neighbor's POAV and the plane defined by
-                            # the bond vector and the POAV of the center atom,
-                            # which is pi/2 minus the angle between
-                            # the NN POAV and the normal vector to the plane
-                            # computed above.
-                            misalignment_angles.append(np.abs(
-                                np.pi / 2 - vec.angle(NN_POAV.Vpi, nvec)))
-                        else:
-                            misalignment_angles.append(np.nan)
-
-                    POAV.pyramidalization_angles = pyramidalization_angles
-                    POAV.misalignment_angles = misalignment_angles
-                    POAV.sigma_pi_angles = sigma_pi_angles
+        for row, i in enumerate(sp2.tolist()):
+            self[i]._POAV_data = (self.poavs, row)
+        self._columns['POAVs'] = (self._get_coords_array(), self.poavs)
 
     def compute_POAVs(self, **kwargs):
         """Alias for :meth:`~POAVAtomsMixin.analyze_POAVs`."""
@@ -644,6 +666,10 @@ class POAVAtomsMixin:
         """Return list of :class:`~sknano.core.atoms.mixins.POAVAtom` :class:`POAV1` \
             :class:`POAV2` or :class:`POAVR` attribute.
 
+        The attributes stored in :attr:`~POAVAtomsMixin.poavs` by
+        :meth:`~POAVAtomsMixin.analyze_POAVs` are returned directly
+        while the atom coordinates are unchanged.
+
         Parameters
         ----------
         POAV_class : {'POAV1', 'POAV2', 'POAVR'}
@@ -654,6 +680,13 @@ class POAVAtomsMixin:
         :class:`~python:tuple`
 
         """
+        arrays = self._get_POAV_arrays(POAV_class)
+        if arrays is not None and attr in arrays:
+            attr_values = arrays[attr]
+            if attr in POAV_vectors:
+                attr_values = Vectors([Vector(v) for v in attr_values])
+            return attr_values, arrays['atom_ids'].tolist()
+
         attr_values = []
         atom_ids = []
         attr_list = attr.split('.')
@@ -673,6 +706,22 @@ class POAVAtomsMixin:
         # return [getattr(getattr(atom, POAV_class), attr) for atom in self
         #         if getattr(atom, POAV_class) is not None]
 
+    def _get_POAV_arrays(self, POAV_class):
+        """Return the :class:`~python:dict` of `POAV_class` arrays \
+            computed by :meth:`~POAVAtomsMixin.analyze_POAVs`, or `None` \
+            if the atoms have changed since."""
+        try:
+            coords, poavs = self._columns['POAVs']
+        except KeyError:
+            return None
+
+        current_coords = self._get_coords_array()
+        if poavs is not self.poavs or not \
+                (coords is current_coords or
+                 np.array_equal(coords, current_coords)):
+            return None
+        return poavs.get(POAV_class)
+
     def reset_attrs(self, poavs=False, **kwargs):
         """Reset the :class:`POAVAtomsMixin` class attributes, then call \
             parent class `reset_attrs` method."""
@@ -692,5 +741,68 @@ class POAVAtomsMixin:
             self.analyze_POAVs(**kwargs)
 
 
+def _POAV_arrays(vi, bonds, NN_rows):
+    """Compute the POAV vectors and angles of a set of atoms.
+
+    Parameters
+    ----------
+    vi : :class:`~numpy:numpy.ndarray`
+        :math:`M\\times 3\\times 3` array of the POAV vectors
+        :math:`\\mathbf{v}_i` of each atom.
+    bonds : :class:`~numpy:numpy.ndarray`
+        :math:`M\\times 3\\times 3` array of bond vectors of each atom.
+    NN_rows : :class:`~numpy:numpy.ndarray`
+        :math:`M\\times 3` array of the rows of the bonded atoms,
+        or -1 if a bonded atom has no POAV.
+
+    Returns
+    -------
+    :class:`~python:dict`
+
+    """
+    # v_j x v_k for (i, j, k) in ((1, 2, 3), (2, 3, 1), (3, 1, 2))
+    vjxvk = np.cross(np.roll(vi, -1, axis=1), np.roll(vi, 1, axis=1))
+    Vv1v2v3 = np.abs(np.einsum('ij,ij->i', vi[:, 0], vjxvk[:, 0]))
+    Vv1v2v3[Vv1v2v3 == 0] = 1
+    reciprocal_vi = vjxvk / Vv1v2v3[:, np.newaxis, np.newaxis]
+    vpi = reciprocal_vi.sum(axis=1)
+    Vpi = vpi / np.linalg.norm(vpi, axis=-1)[:, np.newaxis]
+
+    sigma_pi_angles = _angle(Vpi[:, np.newaxis], bonds)
+    sigma_pi_angles = np.where(sigma_pi_angles < np.pi / 2,
+                               np.pi - sigma_pi_angles, sigma_pi_angles)
+    pyramidalization_angles = sigma_pi_angles - np.pi / 2
+
+    # the misalignment angle is the angle between the nearest neighbor's
+    # POAV and the plane defined by the bond vector and the POAV of the
+    # center atom, which is pi/2 minus the angle between the NN POAV and
+    # the normal vector to the plane.
+    nvec = np.cross(bonds, Vpi[:, np.newaxis])
+    NN_Vpi = np.take(Vpi, np.maximum(NN_rows, 0), axis=0)
+    misalignment_angles = np.abs(np.pi / 2 - _angle(NN_Vpi, nvec))
+    misalignment_angles[NN_rows < 0] = np.nan
+
+    return OrderedDict(
+        [('v1', vi[:, 0]), ('v2', vi[:, 1]), ('v3', vi[:, 2]),
+         ('reciprocal_v1', reciprocal_vi[:, 0]),
+         ('reciprocal_v2', reciprocal_vi[:, 1]),
+         ('reciprocal_v3', reciprocal_vi[:, 2]),
+         ('vpi', vpi), ('Vpi', Vpi),
+         ('sigma_pi_angles', sigma_pi_angles),
+         ('pyramidalization_angles', pyramidalization_angles),
+         ('misalignment_angles', misalignment_angles)])
+
+
+def _angle(u, v):
+    """Angles between the vectors along the last axis of `u` and `v`."""
+    return np.arccos(np.sum(u * v, axis=-1) /
+                     (np.linalg.norm(u, axis=-1) * np.linalg.norm(v, axis=-1)))
+
+
+POAV_classes = {'POAV1': POAV1, 'POAV2': POAV2, 'POAVR': POAVR}
+
+POAV_angles = ('sigma_pi_angles', 'pyramidalization_angles',
+               'misalignment_angles')
+
 POAV_vectors = ('v1', 'v2', 'v3', 'vpi', 'V1', 'V2', 'V3', 'Vpi',
                 'reciprocal_v1', 'reciprocal_v2', 'reciprocal_v3')
@@ -114,7 +114,7 @@ class RingAtomsMixin:
 
     @timethis
     def analyze_network(self, cutoff=np.inf, max_ring_size=None, eps=0.0001,
-                        retcodes=None, pyversion=False):
+                        retcodes=None, pyversion=False, num_threads=1):
         """Analyze the network connectivity.
 
         Parameters
@@ -123,6 +123,9 @@ class RingAtomsMixin:
         max_ring_size : :class:`~python:int`, optional
         eps : :class:`~python:float`, optional
         retcodes : :class:`~python:tuple`, optional
+        pyversion : :class:`~python:bool`, optional
+        num_threads : :class:`~python:int`, optional
+            Number of threads used by the compiled ring finder.
 
         """
         if max_ring_size is None:
@@ -140,11 +143,11 @@ class RingAtomsMixin:
         nn_idx = self.nn_idx
         nn_seed = self.nn_seed
         nn_amat = self.nn_adjacency_matrix
-        nn_vecs = self.nn_vectors
+        nn_vecs = self.nn_vecs
 
         ring_counts, nodes_list = \
             find_rings(Natoms, NNN, nn_idx, nn_seed, nn_amat, nn_vecs,
-                       max_ring_size, eps, pyversion)
+                       max_ring_size, eps, pyversion, num_threads)
 
         self._update_ring_counter(ring_counts)
         self._update_rings(nodes_list)
@@ -14,21 +14,135 @@ __docformat__ = 'restructuredtext en'
 from collections import Iterable, namedtuple
 # from operator import attrgetter
 
-# import numpy as np
+import numpy as np
 # np.set_printoptions(edgeitems=20)
 # np.set_printoptions(threshold=10000)
 
+from sknano.core import rezero_array
 from .angles import Angle, Angles, compute_angle
 from .bonds import Bond, Bonds, compute_bond
 from .dihedrals import Dihedral, Dihedrals, compute_dihedral
 from .impropers import Improper, Impropers, compute_improper
 
-__all__ = ['AtomTopologyMixin', 'AtomsTopologyMixin', 'AtomsTopologyStats']
+__all__ = ['AtomTopologyMixin', 'AtomsTopologyMixin', 'AtomsTopologyStats',
+           'AtomsTopologyIndices', 'AtomsTopologyMeasures',
+           'topology_indices']
 
 operand_error_msg = 'Expected an `iterable` object containing {}'
 ids_operand_error_msg = operand_error_msg.format('`ints`')
 AtomsTopologyStats = namedtuple('AtomsTopologyStats',
                                 ('angles', 'bonds', 'dihedrals', 'impropers'))
+AtomsTopologyIndices = namedtuple('AtomsTopologyIndices',
+                                  AtomsTopologyStats._fields)
+AtomsTopologyMeasures = namedtuple('AtomsTopologyMeasures',
+                                   AtomsTopologyStats._fields)
+
+
+def _unique_neighbors(indptr, indices):
+    """Remove self and duplicate entries (periodic images) from the \
+        neighbor lists in CSR format."""
+    indptr = np.asarray(indptr, dtype=int)
+    indices = np.asarray(indices, dtype=int)
+    Natoms = len(indptr) - 1
+    rows = np.repeat(np.arange(Natoms), np.diff(indptr))
+    keys = rows * Natoms + indices
+    _, first = np.unique(keys, return_index=True)
+    keep = np.zeros(keys.size, dtype=bool)
+    keep[first] = True
+    keep &= rows != indices
+    rows, indices = rows[keep], indices[keep]
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows,
+                                                        minlength=Natoms))))
+    return indptr, indices, rows
+
+
+def _neighbor_pairs(indptr, rows1, rows2):
+    """Return the positions in the neighbor list of all pairs of \
+        neighbors of `rows1` and `rows2`, in row major order."""
+    n1 = np.diff(indptr)[rows1]
+    n2 = np.diff(indptr)[rows2]
+    counts = n1 * n2
+    group = np.repeat(np.arange(counts.size), counts)
+    local = np.arange(group.size) - \
+        np.repeat(np.cumsum(counts) - counts, counts)
+    n2 = n2[group]
+    return group, indptr[rows1][group] + local // n2, \
+        indptr[rows2][group] + local % n2
+
+
+def topology_indices(indptr, indices):
+    """Generate the bond, angle, dihedral, and improper index arrays of \
+        a neighbor graph.
+
+    Each bond, angle, dihedral and improper is listed once, in the same
+    order as the :attr:`~AtomsTopologyMixin.bonds`,
+    :attr:`~AtomsTopologyMixin.angles`,
+    :attr:`~AtomsTopologyMixin.dihedrals`, and
+    :attr:`~AtomsTopologyMixin.impropers` generated from the
+    atom neighbors.
+
+    Parameters
+    ----------
+    indptr, indices : array_like
+        Neighbor lists in CSR format. The neighbors of atom `i` are
+        ``indices[indptr[i]:indptr[i+1]]``.
+
+    Returns
+    -------
+    :class:`AtomsTopologyIndices`
+        Integer arrays of atom indices with shapes (Nangles, 3),
+        (Nbonds, 2), (Ndihedrals, 4), and (Nimpropers, 4).
+
+    """
+    indptr, indices, rows = _unique_neighbors(indptr, indices)
+    Natoms = len(indptr) - 1
+
+    mask = rows < indices
+    bonds = np.column_stack((rows[mask], indices[mask]))
+
+    centers, left, right = \
+        _neighbor_pairs(indptr, np.arange(Natoms), np.arange(Natoms))
+    mask = left < right
+    angles = np.column_stack((indices[left[mask]], centers[mask],
+                              indices[right[mask]]))
+
+    b, c = bonds.T
+    group, left, right = _neighbor_pairs(indptr, b, c)
+    a, d = indices[left], indices[right]
+    b, c = b[group], c[group]
+    mask = (a != c) & (d != b) & (a != d)
+    dihedrals = np.column_stack((a[mask], b[mask], c[mask], d[mask]))
+
+    return AtomsTopologyIndices(angles=angles.reshape((-1, 3)),
+                                bonds=bonds.reshape((-1, 2)),
+                                dihedrals=dihedrals.reshape((-1, 4)),
+                                impropers=dihedrals.reshape((-1, 4)).copy())
+
+
+def _bond_lengths(b12):
+    return np.sqrt(np.einsum('ij,ij->i', b12, b12))
+
+
+def _bond_angles(b21, b23):
+    cosa = np.einsum('ij,ij->i', b21, b23) / \
+        (_bond_lengths(b21) * _bond_lengths(b23))
+    return np.arccos(np.clip(cosa, -1, 1))
+
+
+def _dihedral_angles(b12, b23, b34):
+    m = np.cross(b12, b23)
+    n = np.cross(b23, b34)
+    sina = np.einsum('ij,ij->i', m, b34) * _bond_lengths(b23)
+    cosa = np.einsum('ij,ij->i', m, n)
+    return np.arctan2(sina, cosa)
+
+
+def _improper_angles(b21, b23, b34):
+    m = np.cross(b21, b23)
+    n = np.cross(b23, b34)
+    cosa = -np.einsum('ij,ij->i', m, n) / \
+        (_bond_lengths(m) * _bond_lengths(n))
+    return np.arccos(np.clip(cosa, -1, 1))
 
 
 class AtomTopologyMixin:
@@ -228,6 +342,39 @@ class AtomsTopologyMixin:
         topostats['impropers'] = None
         return AtomsTopologyStats(**topostats)
 
+    @property
+    def topology_indices(self):
+        """:class:`AtomsTopologyIndices` of atom index arrays.
+
+        The angles, bonds, dihedrals, and impropers are generated directly
+        from the nearest-neighbor lists, without creating
+        :class:`~sknano.core.atoms.mixins.Topology` objects. The rows list
+        the same atoms, in the same order, as the atom ids of
+        :attr:`~AtomsTopologyMixin.angles`,
+        :attr:`~AtomsTopologyMixin.bonds`,
+        :attr:`~AtomsTopologyMixin.dihedrals`, and
+        :attr:`~AtomsTopologyMixin.impropers`.
+
+        """
+        return self._get_topology_arrays()[0]
+
+    @property
+    def topology_measures(self):
+        """:class:`AtomsTopologyMeasures` of measure arrays.
+
+        Bond lengths and angles computed from the
+        :attr:`~AtomsTopologyMixin.topology_indices` arrays. Angles are
+        in degrees if :attr:`~AtomsTopologyMixin.angles_in_degrees` is
+        `True`.
+
+        """
+        measures = self._get_topology_arrays()[1]
+        if self.angles_in_degrees:
+            measures = measures._replace(
+                **{field: np.degrees(getattr(measures, field)) for field in
+                   ('angles', 'dihedrals', 'impropers')})
+        return measures
+
     def get_angle(self, *triplet, check_operands=True, degrees=False):
         """Compute bond angles.
 
@@ -417,10 +564,64 @@ class AtomsTopologyMixin:
         """Update :class:`AtomsTopologyMixin` class attributes."""
         super().update_attrs(**kwargs)
         if topology:
-            [atom._update_bonds() for atom in self]
-            [atom._update_angles() for atom in self]
-            [atom._update_dihedrals() for atom in self]
-            [atom._update_impropers() for atom in self]
+            self._update_topology_arrays()
+            self._reset_topology()
+
+    def _get_topology_arrays(self):
+        try:
+            coords, nn_idx, indices, measures = self._columns['topology']
+            if nn_idx is self.nn_idx:
+                current = self._get_coords_array()
+                if coords is current or np.array_equal(coords, current):
+                    return indices, measures
+        except KeyError:
+            pass
+        return self._update_topology_arrays()
+
+    def _update_topology_arrays(self):
+        coords = self._get_coords_array()
+        if self.Natoms == 0:
+            indptr, nn_idx = np.zeros(1, dtype=int), np.zeros(0, dtype=int)
+        else:
+            self.update_neighbor_lists()
+            indptr, nn_idx = self.nn_seed, self.nn_idx
+        indices = topology_indices(indptr, nn_idx)
+
+        def bond_vectors(origins, ends):
+            return self._minimum_image(np.take(coords, ends, axis=0) -
+                                       np.take(coords, origins, axis=0))
+
+        a1, a2, a3 = indices.angles.T
+        angles = _bond_angles(bond_vectors(a2, a1), bond_vectors(a2, a3))
+        a1, a2 = indices.bonds.T
+        bonds = _bond_lengths(bond_vectors(a1, a2))
+        a1, a2, a3, a4 = indices.dihedrals.T
+        dihedrals = _dihedral_angles(bond_vectors(a1, a2),
+                                     bond_vectors(a2, a3),
+                                     bond_vectors(a3, a4))
+        a1, a2, a3, a4 = indices.impropers.T
+        impropers = _improper_angles(bond_vectors(a2, a1),
+                                     bond_vectors(a2, a3),
+                                     bond_vectors(a3, a4))
+        measures = \
+            AtomsTopologyMeasures(angles=rezero_array(angles),
+                                  bonds=rezero_array(bonds),
+                                  dihedrals=rezero_array(dihedrals),
+                                  impropers=rezero_array(impropers))
+        self._columns['topology'] = \
+            (coords, None if self.Natoms == 0 else self.nn_idx, indices,
+             measures)
+        return indices, measures
+
+    def _reset_topology(self):
+        """Discard the topology objects, which are regenerated \
+            when accessed."""
+        for attr in ('_all_angles', '_all_bonds', '_all_dihedrals',
+                     '_all_impropers'):
+            self.__dict__.pop(attr, None)
+        for atom in self:
+            for attr in ('_angles', '_bonds', '_dihedrals', '_impropers'):
+                atom.__dict__.pop(attr, None)
 
     def _update_topology(self):
         self._update_angles()
@@ -11,7 +11,7 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
-# import numpy as np
+import numpy as np
 # import pandas as pd
 
 from sknano.core.math import transformation_matrix
@@ -19,6 +19,52 @@ from sknano.core.math import transformation_matrix
 __all__ = ['AtomTransformationsMixin', 'AtomsTransformationsMixin']
 
 
+def _transformed_vector_attrs(atom_class, method):
+    """Return the `Atom` vector attributes transformed by `method`.
+
+    Walks the MRO of `atom_class` through the `Atom` classes whose `method`
+    transforms a vector attribute and defers to :func:`super`, down to
+    :class:`AtomTransformationsMixin`. Returns `None` if an unknown
+    override is encountered, in which case the atoms must be transformed
+    one at a time.
+
+    """
+    from ..dipole_atoms import DipoleAtom
+    from ..force_atoms import ForceAtom
+    from ..velocity_atoms import VelocityAtom
+    vector_attrs = {DipoleAtom: 'p', ForceAtom: 'f', VelocityAtom: 'v'}
+    if method == 'translate':
+        vector_attrs = {}
+
+    attrs = []
+    for cls in atom_class.__mro__:
+        if method not in vars(cls):
+            continue
+        if cls is AtomTransformationsMixin:
+            return attrs + ['r', 'r0']
+        try:
+            attrs.append(vector_attrs[cls])
+        except KeyError:
+            return None
+    return None
+
+
+def _vector_points(vectors):
+    """Return (N, 3) arrays of the tail and head points of `vectors`."""
+    p0 = np.array([np.asarray(vector._p0) for vector in vectors], dtype=float)
+    p = np.array([np.asarray(vector._p) for vector in vectors], dtype=float)
+    return p0, p
+
+
+def _set_vector_points(vectors, p0, p):
+    """Set the tail and head points and components of `vectors` in place."""
+    for vector, vp0, vp in zip(vectors, p0.tolist(), p.tolist()):
+        np.ndarray.view(vector._p0, np.ndarray)[:] = vp0
+        np.ndarray.view(vector._p, np.ndarray)[:] = vp
+        np.ndarray.view(vector, np.ndarray)[:] = \
+            [h - t for h, t in zip(vp, vp0)]
+
+
 class AtomTransformationsMixin:
     """Mixin `Atom` class for performing affine transformations."""
 
@@ -104,7 +150,28 @@ class AtomsTransformationsMixin:
         transform_matrix = kwargs.get('transform_matrix', None)
         if transform_matrix is None:
             kwargs['transform_matrix'] = transformation_matrix(**kwargs)
-        [atom.rotate(**kwargs) for atom in self]
+
+        transform_matrix = np.asarray(kwargs['transform_matrix'])
+        attrs = self._transformed_vector_attrs('rotate')
+        if attrs is None or transform_matrix.shape not in ((3, 3), (4, 4)):
+            [atom.rotate(**kwargs) for atom in self]
+            return
+
+        with_lattice = kwargs.pop('with_lattice', True)
+        fix_anchor_point = kwargs.get('fix_anchor_point', False)
+        rotation = transform_matrix[:3, :3].T
+        translation = transform_matrix[:3, 3] \
+            if transform_matrix.shape == (4, 4) else np.zeros(3)
+        if with_lattice:
+            self._transform_lattices('rotate', **kwargs)
+        for attr in attrs:
+            vectors = [getattr(atom, attr) for atom in self]
+            p0, p = _vector_points(vectors)
+            if not fix_anchor_point:
+                p0 = np.dot(p0, rotation) + translation
+            _set_vector_points(vectors, p0,
+                               np.dot(p, rotation) + translation)
+        self._update_attrs_version()
 
     def translate(self, t, fix_anchor_points=True, cartesian=True,
                   with_lattice=True):
@@ -116,6 +183,46 @@ class AtomsTransformationsMixin:
         fix_anchor_points : bool, optional
 
         """
-        [atom.translate(t, fix_anchor_point=fix_anchor_points,
-                        cartesian=cartesian, with_lattice=with_lattice)
-         for atom in self]
+        attrs = self._transformed_vector_attrs('translate')
+        if attrs is None or not cartesian:
+            [atom.translate(t, fix_anchor_point=fix_anchor_points,
+                            cartesian=cartesian, with_lattice=with_lattice)
+             for atom in self]
+            return
+
+        t = np.asarray(t, dtype=float)
+        if with_lattice:
+            self._transform_lattices('translate', t)
+        for attr in attrs:
+            vectors = [getattr(atom, attr) for atom in self]
+            p0, p = _vector_points(vectors)
+            if fix_anchor_points:
+                p = p + t
+            else:
+                p0, p = p0 + t, p + t
+            _set_vector_points(vectors, p0, p)
+        self._update_attrs_version()
+
+    def _transformed_vector_attrs(self, method):
+        """Return the vector attributes transformed by the `Atom` `method`.
+
+        Returns `None` unless all atoms are of the same class and that
+        class's `method` only transforms known vector attributes, in which
+        case the atoms are transformed one at a time.
+
+        """
+        try:
+            atom_class = type(self[0])
+        except IndexError:
+            return None
+        if any(type(atom) is not atom_class for atom in self):
+            return None
+        return _transformed_vector_attrs(atom_class, method)
+
+    def _transform_lattices(self, method, *args, **kwargs):
+        """Call `method` of the lattice of each atom that has one."""
+        for atom in self:
+            try:
+                getattr(atom.lattice, method)(*args, **kwargs)
+            except AttributeError:
+                pass
@@ -17,14 +17,15 @@ import numbers
 import numpy as np
 
 try:
-    from scipy.spatial import KDTree
-    # from scipy.spatial import cKDTree as KDTree
+    from scipy.sparse import csr_matrix
+    from scipy.spatial import cKDTree
 except ImportError:
     raise ImportError('Install scipy version >= 0.13.0 to allow '
                       'nearest-neighbor queries between atoms.')
 
 from sknano.core import ordinal_form
-from sknano.core.analysis import PeriodicKDTree
+from sknano.core.analysis import PeriodicCKDTree, cell_matrix_and_offset, \
+    linked_cell_neighbor_list
 from sknano.core.math import Vector, Vectors
 
 from .atoms import Atom, Atoms
@@ -257,6 +258,7 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
         self._nn_adjacency_map = None
         self._nn_adjacency_list = None
         self._nn_vectors = None
+        self._nn_vecs = None
         self._nn_seed = None
 
     @property
@@ -265,25 +267,141 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
 
     @property
     def atom_tree(self):
-        """Concrete implementation of :attr:`~KDTreeAtomsMixin.atom_tree`."""
+        """Concrete implementation of :attr:`~KDTreeAtomsMixin.atom_tree`.
+
+        The :class:`~scipy:scipy.spatial.cKDTree` (or
+        :class:`~sknano.core.analysis.PeriodicCKDTree` if any of the
+        :attr:`~PBCAtomsMixin.pbc` flags are set) is cached and only rebuilt
+        after the atom coordinates, the lattice or the
+        :attr:`~PBCAtomsMixin.pbc` flags change.
+
+        """
+        coords = self._get_coords_array()
+        boxsize = self._atom_tree_boxsize()
         try:
-            try:
-                if np.any(self.pbc):
-                    boxsize = np.asarray(self.lattice.lengths)
-                    for i, pbc in enumerate(self.pbc):
-                        if not pbc:
-                            boxsize[i] = -1
-                    return PeriodicKDTree(np.asarray(self.coords),
-                                          boxsize=boxsize,
-                                          lattice=self.lattice)
-            except AttributeError:
-                pass
+            tree_coords, tree_boxsize, atom_tree = self._columns['atom_tree']
+        except KeyError:
+            pass
+        else:
+            if np.array_equal(boxsize, tree_boxsize) and \
+                    (coords is tree_coords or
+                     np.array_equal(coords, tree_coords)):
+                return atom_tree
+
+        try:
+            if boxsize is not None:
+                atom_tree = PeriodicCKDTree(coords, boxsize=boxsize)
             else:
-                return KDTree(np.asarray(self.coords))
+                atom_tree = cKDTree(coords)
         except ValueError as e:
             print(e)
             return None
 
+        self._columns['atom_tree'] = (coords, boxsize, atom_tree)
+        return atom_tree
+
+    def _atom_tree_boxsize(self):
+        """Return the periodic box size of the :attr:`atom_tree`.
+
+        Returns
+        -------
+        {:class:`~numpy:numpy.ndarray`, `None`}
+            :attr:`~sknano.core.crystallography.Crystal3DLattice.lengths`
+            with non-periodic dimensions set to -1, or `None` if there are
+            no periodic dimensions.
+
+        """
+        try:
+            pbc = self.pbc
+            if not np.any(pbc):
+                return None
+            boxsize = np.array(self.lattice.lengths, dtype=float)
+        except AttributeError:
+            return None
+        boxsize[~pbc] = -1
+        return boxsize
+
+    def _get_neighbor_list(self, cutoff):
+        """Return the periodic neighbor list of the atoms within `cutoff`.
+
+        The neighbor list is computed with
+        :func:`~sknano.core.analysis.linked_cell_neighbor_list` in the
+        :attr:`~LatticeAtoms.lattice` cell and cached until the atom
+        coordinates, the lattice, the :attr:`~PBCAtomsMixin.pbc` flags or
+        `cutoff` change.
+
+        Returns
+        -------
+        {:class:`~python:tuple`, `None`}
+            The (indptr, indices, distances, vectors) CSR neighbor list
+            or `None` if there are no periodic dimensions or if `cutoff`
+            is not less than half of the periodic cell width.
+
+        """
+        if self._atom_tree_boxsize() is None or not np.isfinite(cutoff):
+            return None
+
+        coords = self._get_coords_array()
+        cell_matrix, offset = cell_matrix_and_offset(self.lattice)
+        pbc = self.pbc
+        key = (cutoff, cell_matrix, offset, pbc)
+        try:
+            list_coords, list_key, neighbor_list = \
+                self._columns['neighbor_list']
+        except KeyError:
+            pass
+        else:
+            if all([np.array_equal(a, b) for a, b in zip(key, list_key)]) \
+                    and (coords is list_coords or
+                         np.array_equal(coords, list_coords)):
+                return neighbor_list
+
+        try:
+            neighbor_list = linked_cell_neighbor_list(coords, cutoff,
+                                                      lattice=self.lattice,
+                                                      pbc=pbc)
+        except ValueError:
+            return None
+        self._columns['neighbor_list'] = (coords, key, neighbor_list)
+        return neighbor_list
+
+    def _query_neighbors(self, k, rc):
+        """Query `k` nearest-neighbor distances and indices within `rc`.
+
+        Uses the periodic :meth:`~NeighborAtoms._get_neighbor_list` if any of
+        the :attr:`~PBCAtomsMixin.pbc` flags are set, otherwise
+        :meth:`~KDTreeAtomsMixin.query_atom_tree`.
+
+        Returns
+        -------
+        d, i : :class:`~numpy:numpy.ndarray`
+            Same as :meth:`~KDTreeAtomsMixin.query_atom_tree`.
+
+        """
+        neighbor_list = self._get_neighbor_list(rc)
+        if neighbor_list is None:
+            return self.query_atom_tree(k=k, rc=rc)
+
+        indptr, indices, distances, _ = neighbor_list
+        Natoms = self.Natoms
+        rows, cols = self._neighbor_list_positions(indptr)
+        mask = cols < k
+        d = np.empty((Natoms, k), dtype=float)
+        d.fill(np.inf)
+        i = np.empty((Natoms, k), dtype=int)
+        i.fill(Natoms)
+        d[rows[mask], cols[mask]] = distances[mask]
+        i[rows[mask], cols[mask]] = indices[mask]
+        return d, i
+
+    @staticmethod
+    def _neighbor_list_positions(indptr):
+        """Return the row and column of each entry of a CSR neighbor list."""
+        counts = np.diff(indptr)
+        rows = np.repeat(np.arange(len(counts)), counts)
+        cols = np.arange(indptr[-1]) - np.repeat(indptr[:-1], counts)
+        return rows, cols
+
     @property
     def kNN(self):
         """Max number of nearest-neighbors to return from kd-tree search."""
@@ -335,7 +453,7 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
     @property
     def coordination_numbers(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`NeighborAtom.CN`\ s."""
-        return np.asarray([atom.CN for atom in self])
+        return self.get_column('CN').copy()
 
     @property
     def coordination_number_counts(self):
@@ -441,7 +559,7 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
 
         for n, cutoff in enumerate(self.neighbor_cutoffs, start=1):
             try:
-                NNd, NNi = self.query_atom_tree(k=self.kNN, rc=cutoff)
+                NNd, NNi = self._query_neighbors(k=self.kNN, rc=cutoff)
                 for i, atom in enumerate(self):
                     neighbors = \
                         self.__class__([self[NNi[i][j]] for j, d in
@@ -463,12 +581,21 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
         """Update neighbor lists"""
         self._update_nn_lists()
         self._update_nn_seed()
-        self._update_nn_vectors()
+        if self._nn_vecs is None:
+            self._update_nn_vectors()
         self._update_nn_adjacency_matrix()
 
     @property
     def nn_adjacency_matrix(self):
-        """Return nearest-neighbor adjacency matrix."""
+        """Return nearest-neighbor adjacency matrix.
+
+        The nearest-neighbor graph is stored as a
+        :class:`~scipy:scipy.sparse.csr_matrix`, with
+        :attr:`~NeighborAtoms.nn_seed` and :attr:`~NeighborAtoms.nn_idx`
+        as its `indptr` and `indices` arrays, so the bond vectors
+        in :attr:`~NeighborAtoms.nn_vecs` are aligned with its entries.
+
+        """
         if self._nn_adjacency_matrix is None:
             self._update_nn_adjacency_matrix()
         return self._nn_adjacency_matrix
@@ -489,120 +616,98 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
 
     @property
     def nn_seed(self):
-        """Return nearest-neighbor seed list"""
+        """Return nearest-neighbor seed list.
+
+        The neighbors of atom `i` are ``nn_idx[nn_seed[i]:nn_seed[i+1]]``.
+
+        """
         if self._nn_seed is None:
             self._update_nn_seed()
         return self._nn_seed
 
+    @property
+    def nn_vecs(self):
+        """Return array of nearest-neighbor vectors."""
+        if self._nn_vecs is None:
+            self._update_nn_vectors()
+        return self._nn_vecs
+
     @property
     def nn_vectors(self):
         """Return nearest-neighbor vectors."""
         if self._nn_vectors is None:
-            self._update_nn_vectors()
+            self._nn_vectors = Vectors([Vector(v) for v in self.nn_vecs])
         return self._nn_vectors
 
     def _update_nn_lists(self, NNi=None, cutoff=None):
+        self._nn_vectors = self._nn_vecs = None
         if NNi is None:
             if cutoff is None:
                 cutoff = self.NNrc
+            neighbor_list = self._get_neighbor_list(cutoff)
+            if neighbor_list is not None:
+                # The periodic neighbor list provides the minimum image
+                # neighbor vectors as well.
+                indptr, indices, _, vectors = neighbor_list
+                rows, cols = self._neighbor_list_positions(indptr)
+                mask = cols < self.kNN
+                self.idx = rows[mask]
+                self.nn_idx = indices[mask]
+                self._nn_vecs = vectors[mask]
+                return
             _, NNi = self.query_atom_tree(k=self.kNN, rc=cutoff)
-        Natoms = self.Natoms
-        idx = []
-        nn_idx = []
-        for i, nn_indices in enumerate(NNi):
-            for ni in nn_indices[:]:
-                if ni < Natoms:
-                    idx.append(i)
-                    nn_idx.append(ni)
-        self.idx = np.asarray(idx, dtype=int)
-        self.nn_idx = np.asarray(nn_idx, dtype=int)
+        NNi = np.asarray(NNi)
+        mask = NNi < self.Natoms
+        self.idx = np.asarray(np.nonzero(mask)[0], dtype=int)
+        self.nn_idx = np.asarray(NNi[mask], dtype=int)
 
     def _update_nn_seed(self):
-        n = self.Natoms
-        nnn = self.NNN
-        idx = self.idx
-        nn_seed = (n + 1) * [0]
-        for k in range(n):
-            nn_seed[k] = -1
-        nn_seed[n] = nnn
-        nn_seed[idx[0]] = 0
-        for k in range(1, nnn):
-            if idx[k] != idx[k - 1]:
-                nn_seed[idx[k]] = k
-        self._nn_seed = np.asarray(nn_seed, dtype=int)
+        counts = np.bincount(np.asarray(self.idx, dtype=int),
+                             minlength=self.Natoms)
+        self._nn_seed = np.concatenate(([0], np.cumsum(counts)))
 
     def _update_nn_adjacency_matrix(self):
         Natoms = self.Natoms
-        nn_seed = self.nn_seed
-        nn_idx = self.nn_idx
-        nn_adjacency_matrix = np.zeros((Natoms, Natoms), dtype=int)
-        # self._update_nn_lists()
-
-        def _update_nn_adjacency_map(nn_map, indices, nindices):
-            for i in indices:
-                for ni in nindices:
-                    if ni not in nn_map:
-                        nn_map[ni] = nn_map[i] + 1
-
-        for i, atom in enumerate(self):
-            nn_map = atom.nn_adjacency_map = {}
-            nn_map[i] = 0
-            indices = [i]
-            nindices = [nn_idx[si] for si in range(nn_seed[i], nn_seed[i+1])]
-            _update_nn_adjacency_map(nn_map, indices, nindices)
-            while len(nindices) > 0:
-                indices = nindices[:]
-                nindices = []
-                for ni in indices[:]:
-                    nindices.extend(
-                        [nn_idx[nsi] for nsi in
-                         range(nn_seed[ni], nn_seed[ni+1])
-                         if nn_idx[nsi] not in nn_map])
-                    _update_nn_adjacency_map(nn_map, indices, nindices)
-            [nn_adjacency_matrix[i].__setitem__(j, nn_map[j])
-             for j in range(Natoms) if j in nn_map]
-        self._nn_adjacency_matrix = nn_adjacency_matrix
+        nn_idx = np.asarray(self.nn_idx, dtype=int)
+        self._nn_adjacency_matrix = \
+            csr_matrix((np.ones(nn_idx.size, dtype=int), nn_idx,
+                        self.nn_seed), shape=(Natoms, Natoms))
 
     def _update_nn_adjacency_map(self):
-        Natoms = self.Natoms
-        nn_idx = self.nn_idx
-        nn_seed = self.nn_seed
         nn_adjacency_map = OrderedDict()
-        for i in range(Natoms):
-            nn_adjacency_map[i] = \
-                [nn_idx[si] for si in range(nn_seed[i], nn_seed[i+1])]
+        for i, neighbors in enumerate(self.nn_adjacency_list):
+            nn_adjacency_map[i] = neighbors
         self._nn_adjacency_map = nn_adjacency_map
 
     def _update_nn_adjacency_list(self):
-        Natoms = self.Natoms
-        nn_idx = self.nn_idx
-        nn_seed = self.nn_seed
-        nn_adjacency_list = []
-        for i in range(Natoms):
-            nn_adjacency_list.append(
-                [nn_idx[si] for si in range(nn_seed[i], nn_seed[i+1])])
-        self._nn_adjacency_list = nn_adjacency_list
+        nn_idx = np.asarray(self.nn_idx, dtype=int)
+        self._nn_adjacency_list = \
+            [neighbors.tolist() for neighbors in
+             np.split(nn_idx, self.nn_seed[1:-1])]
 
     def _update_nn_vectors(self):
-        # from sknano.core.crystallography import pbc_diff
-        idx = self.idx
-        nn_idx = self.nn_idx
-        nn_vectors = Vectors()
+        idx = np.asarray(self.idx, dtype=int)
+        nn_idx = np.asarray(self.nn_idx, dtype=int)
+        coords = self._get_coords_array()
+        self._nn_vecs = \
+            self._minimum_image(np.take(coords, nn_idx, axis=0) -
+                                np.take(coords, idx, axis=0))
+
+    def _minimum_image(self, dr):
+        """Apply the minimum image convention to the displacement \
+            vectors `dr` along the periodic axes."""
+        dr = np.asarray(dr, dtype=float)
         try:
             lattice = self.lattice
-            pbc = np.any(self.pbc)
-            if not pbc or lattice is None:
+            pbc = np.asarray(self.pbc, dtype=bool)
+            if not np.any(pbc) or lattice is None:
                 raise AttributeError
         except AttributeError:
-            for i, ni in zip(idx, nn_idx):
-                r = self[ni].r - self[i].r
-                nn_vectors.append(r)
-        else:
-            for i, ni in zip(idx, nn_idx):
-                fdiff = lattice.fractional_diff(self[ni].rs, self[i].rs)
-                dr = Vector(lattice.fractional_to_cartesian(fdiff))
-                nn_vectors.append(dr)
-        self._nn_vectors = nn_vectors
+            return dr
+        cell_matrix, _ = cell_matrix_and_offset(lattice)
+        fdiff = np.dot(dr, np.linalg.inv(cell_matrix))
+        fdiff[..., pbc] -= np.round(fdiff[..., pbc])
+        return np.dot(fdiff, cell_matrix)
 
     def count_neighbors_in_self(self, r, p=2.0):
         """Count number of neighbor pairs for each atom in self.
@@ -624,6 +729,6 @@ class NeighborAtoms(KDTreeAtomsMixin, Atoms):
         #     return PeriodicKDTree(np.asarray(self.coords), boxsize=boxsize,
         #                           lattice=self.lattice)
 
-        return np.asarray([KDTree([atom.r]).count_neighbors(
+        return np.asarray([cKDTree([atom.r]).count_neighbors(
                            self.filtered(ids != atom.id).atom_tree,
                            r, p=p) for atom in self])
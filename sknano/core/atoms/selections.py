@@ -11,9 +11,9 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
-from functools import reduce
+from functools import lru_cache, reduce
 from importlib import import_module
-from operator import and_, or_
+from itertools import chain
 
 import numpy as np
 
@@ -42,18 +42,36 @@ def as_region(s, l, t):
 
 
 class Selection(BaseClass):
-    """Base selection class."""
+    """Base selection class.
+
+    A parsed selection is evaluated by :meth:`mask`, which returns a
+    boolean mask over the atoms computed from their attribute columns.
+
+    """
     def __init__(self, selection):
         super().__init__()
         self.selection = selection
         self.fmtstr = "{selection!r}"
 
-    def apply(self, atoms, filtered=None, mask=None):
-        if mask is not None and isinstance(mask, np.ndarray) and \
-                (mask.dtype in (bool, int)):
-            return atoms.filtered(mask)
-        elif filtered is not None:
-            return atoms.__class__(atoms=filtered[:], **atoms.kwargs)
+    def apply(self, atoms, as_mask=False):
+        """Apply selection to `atoms`.
+
+        Parameters
+        ----------
+        atoms : :class:`~sknano.core.atoms.Atoms`
+        as_mask : :class:`~python:bool`, optional
+            If `True`, return the boolean mask of selected atoms instead of
+            the selected `Atoms`.
+
+        """
+        mask = self.mask(atoms)
+        if as_mask:
+            return mask
+        return atoms.filtered(mask)
+
+    def mask(self, atoms):
+        """Return boolean mask of the `atoms` in selection."""
+        return NotImplemented
 
     def todict(self):
         return dict(selection=self.selection)
@@ -65,100 +83,69 @@ class AtomsSelectionException(ParseException):
 
 
 class AndSelection(Selection):
-    def apply(self, atoms, as_mask=False):
-        mask = None
-        try:
-            mask = reduce(lambda lsel, rsel: np.bitwise_and(lsel, rsel),
-                          [sel.apply(atoms, as_mask=True) for sel in
-                           self.selection[0]])
-            if as_mask:
-                return mask
-        except (TypeError, ValueError):
-            filtered = reduce(lambda lsel, rsel: and_(lsel, rsel),
-                              [sel.apply(atoms) for sel in self.selection[0]])
-
-        if mask is not None:
-            return super().apply(atoms, mask=mask)
-        else:
-            return super().apply(atoms, filtered=filtered)
+
+    def mask(self, atoms):
+        return reduce(np.logical_and,
+                      [sel.mask(atoms) for sel in self.selection[0]])
 
 
 class OrSelection(Selection):
 
-    def apply(self, atoms, as_mask=False):
-        mask = None
-        try:
-            mask = reduce(lambda lsel, rsel: np.bitwise_or(lsel, rsel),
-                          [sel.apply(atoms, as_mask=True) for sel in
-                           self.selection[0]])
-            if as_mask:
-                return mask
-        except (TypeError, ValueError):
-            filtered = reduce(lambda lsel, rsel: or_(lsel, rsel),
-                              [sel.apply(atoms) for sel in self.selection[0]])
-
-        if mask is not None:
-            return super().apply(atoms, mask=mask)
-        else:
-            return super().apply(atoms, filtered=filtered)
+    def mask(self, atoms):
+        return reduce(np.logical_or,
+                      [sel.mask(atoms) for sel in self.selection[0]])
 
 
 class NotSelection(Selection):
 
-    def apply(self, atoms):
-        return atoms[:] - self.selection[0][0].apply(atoms[:])
+    def mask(self, atoms):
+        return ~self.selection[0][0].mask(atoms)
 
 
 class AllSelection(Selection):
-    def apply(self, atoms):
-        return atoms[:]
+
+    def mask(self, atoms):
+        return np.ones(len(atoms), dtype=bool)
 
 
 class NoneSelection(Selection):
 
-    def apply(self, atoms):
-        # return super().apply(atoms, [])
+    def apply(self, atoms, as_mask=False):
+        if as_mask:
+            return self.mask(atoms)
         return None
 
+    def mask(self, atoms):
+        return np.zeros(len(atoms), dtype=bool)
+
 
 class IDSelection(Selection):
 
-    def apply(self, atoms, as_mask=False):
-        mask = np.in1d(atoms.ids, self.selection.asList()).nonzero()[0]
-        if as_mask:
-            return mask
-        return super().apply(atoms, mask=mask)
+    def mask(self, atoms):
+        return np.in1d(atoms.ids, self.selection.asList())
 
 
 class MolIDSelection(Selection):
 
-    def apply(self, atoms, as_mask=False):
-        mask = np.in1d(atoms.mol_ids, self.selection.asList()).nonzero()[0]
-        if as_mask:
-            return mask
-        return super().apply(atoms, mask=mask)
+    def mask(self, atoms):
+        return np.in1d(atoms.mol_ids, self.selection.asList())
 
 
 class TypeSelection(Selection):
 
-    def apply(self, atoms, as_mask=False):
-        mask = np.in1d(atoms.types, self.selection.asList()).nonzero()[0]
-        if as_mask:
-            return mask
-        return super().apply(atoms, mask=mask)
+    def mask(self, atoms):
+        return np.in1d(atoms.types, self.selection.asList())
 
 
 class AttributeSelection(Selection):
 
-    def apply(self, atoms, as_mask=False):
+    def mask(self, atoms):
         try:
             attr, op, val = self.selection
             if hasattr(atoms, attr):
                 mask = op(getattr(atoms, attr), val)
             else:
-                mask = \
-                    np.asarray([op(getattr(atom, attr), val)
-                                for atom in atoms])
+                mask = [op(getattr(atom, attr), val) for atom in atoms]
         except ValueError:
             attr, val = self.selection
             if hasattr(atoms, attr + 's'):
@@ -166,36 +153,46 @@ class AttributeSelection(Selection):
             elif hasattr(atoms, attr):
                 mask = getattr(atoms, attr) == val
             else:
-                mask = \
-                    np.asarray([True if getattr(atom, attr) == val else False
-                                for atom in atoms])
-        if as_mask:
-            return mask
-        else:
-            return super().apply(atoms, mask=mask)
+                mask = [getattr(atom, attr) == val for atom in atoms]
+        return np.asarray(mask, dtype=bool).reshape(len(atoms))
 
 
 class WithinSelection(Selection):
     """:class:`Selection` class for selections within regions or distance."""
-    def apply(self, atoms):
+    def mask(self, atoms):
         try:
-            other = self.selection[-1].apply(atoms)
-            filtered = atoms.query_ball_tree(other, self.selection[0])
-            return super().apply(atoms, filtered=filtered)
+            other = self.selection[-1].mask(atoms)
         except AttributeError:
             region = self.selection[-1]
-            mask = \
-                np.asarray([region.contains(atom.r) for atom in atoms])
-            return super().apply(atoms, mask=mask)
+            return region.contains_points(atoms._get_coords_array())
+        return _within_mask(atoms, other, self.selection[0])
 
 
 class ExWithinSelection(Selection):
     """Exclusive within :class:`Selection` class."""
-    def apply(self, atoms):
-        other = self.selection[-1].apply(atoms)
-        filtered = atoms.query_ball_tree(other, self.selection[0])
-        filtered = super().apply(atoms, filtered=filtered) - other
-        return super().apply(atoms, filtered=filtered)
+    def mask(self, atoms):
+        other = self.selection[-1].mask(atoms)
+        return _within_mask(atoms, other, self.selection[0]) & ~other
+
+
+def _within_mask(atoms, other, r):
+    """Return mask of `atoms` within distance `r` of the `atoms` in the \
+        boolean mask `other`.
+
+    The cached :attr:`~sknano.core.atoms.NeighborAtoms.atom_tree` of
+    `atoms` is queried once with the coordinates of the `other` atoms,
+    so no tree is built for the `other` subset.
+
+    """
+    mask = np.zeros(len(atoms), dtype=bool)
+    if not other.any():
+        return mask
+    atom_tree = atoms.atom_tree
+    if atom_tree is not None:
+        NNi = atom_tree.query_ball_point(
+            atoms._get_coords_array()[other], r)
+        mask[np.fromiter(chain.from_iterable(NNi), dtype=int)] = True
+    return mask
 
 
 class AtomsSelectionParser(BaseClass):
@@ -297,27 +294,74 @@ class AtomsSelectionParser(BaseClass):
         # if selstr is not None:
         #     self.parse(selstr)
 
-    def parse(self, selstr=None, **kwargs):
-        """Parse `selstr`."""
+    def compile(self, selstr=None):
+        """Return the :class:`Selection` compiled from `selstr`.
+
+        The most recently compiled selections are cached by selection
+        string, so that repeated selections skip parsing.
+
+        """
         if selstr is None and self.selstr is not None:
             selstr = self.selstr
 
         try:
-            selection = \
-                self.selection_expression.parseString(selstr, parseAll=True)[0]
-            if self.verbose:
-                print('selstr: {}'.format(selstr))
-                print('selection: {}'.format(selection))
+            return _compile_selection(selstr)
         except ParseException as e:
             raise AtomsSelectionException(e.pstr, e.loc, e.msg, e.parseElement)
-        else:
+
+    def mask(self, selstr=None):
+        """Return boolean mask of the atoms selected by `selstr`.
+
+        The mask is cached on :attr:`atoms` and recomputed once the list of
+        atoms or any `Atom` attribute is modified. `within` and `exwithin`
+        selections also depend on the periodic box of the
+        :attr:`~sknano.core.atoms.NeighborAtoms.atom_tree`, so masks are
+        cached separately for each box.
+
+        """
+        if selstr is None and self.selstr is not None:
+            selstr = self.selstr
+        selection = self.compile(selstr)
+        atoms = self.atoms
+
+        try:
+            boxsize = atoms._atom_tree_boxsize()
+        except AttributeError:
+            boxsize = None
+        if boxsize is not None:
+            boxsize = tuple(boxsize.tolist())
+
+        def mask():
+            mask = np.asarray(selection.mask(atoms), dtype=bool)
+            mask.flags.writeable = False
+            return mask
+
+        return atoms._get_cached(('selection', selstr, boxsize), mask)
+
+    def parse(self, selstr=None, **kwargs):
+        """Parse `selstr`."""
+        if selstr is None and self.selstr is not None:
+            selstr = self.selstr
+
+        selection = self.compile(selstr)
+        if self.verbose:
+            print('selstr: {}'.format(selstr))
+            print('selection: {}'.format(selection))
+        if isinstance(selection, NoneSelection):
             return selection.apply(self.atoms)
+        return self.atoms.filtered(self.mask(selstr))
 
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         return dict(atoms=self.atoms, selstr=self.selstr)
 
 
+@lru_cache(maxsize=128)
+def _compile_selection(selstr):
+    return AtomsSelectionParser.selection_expression.parseString(
+        selstr, parseAll=True)[0]
+
+
 class AtomsSelectionMixin:
     """Mixin class for applying selections to Atoms."""
     def select(self, selstr=None, selstrlist=None, verbose=False):
@@ -5,11 +5,13 @@ from __future__ import unicode_literals
 
 from pkg_resources import resource_filename
 
+import copy
 # from collections import Counter
 # from operator import attrgetter
 
 # import networkx as nx
 import numpy as np
+from scipy.sparse import issparse
 
 import nose
 from nose.tools import assert_equal, assert_true, assert_false, \
@@ -17,10 +19,11 @@ from nose.tools import assert_equal, assert_true, assert_false, \
 
 from sknano.core import rezero_array
 from sknano.core.atoms import Atom, Atoms, BasisAtom, BasisAtoms, \
-    StructureAtom, StructureAtoms
+    MDAtom, MDAtoms, StructureAtom, StructureAtoms
 from sknano.core.crystallography import Crystal2DLattice, Crystal3DLattice
 from sknano.core.geometric_regions import generate_bounding_box
-from sknano.core.math import Vector, Vectors, rotation_matrix
+from sknano.core.math import Vector, Vectors, rotation_matrix, \
+    vector as vec
 from sknano.core.refdata import element_symbols
 from sknano.io import DATAReader
 from sknano.testing import AtomsTestFixture
@@ -522,5 +525,201 @@ class Tests(AtomsTestFixture):
         neighbors = atoms[0].get_n_neighbors(Nneighbors)
         assert_equal(neighbors.Natoms, Nneighbors)
 
+    def test50(self):
+        atoms = self.atoms
+        z = atoms.z
+        assert_true(np.allclose(z, [atom.z for atom in atoms]))
+        assert_true(atoms.get_column('r') is atoms.get_column('r'))
+        atoms[0].z = 100.0
+        assert_equal(atoms.z[0], 100.0)
+        atoms.translate(Vector([0, 0, 1]))
+        assert_true(np.allclose(atoms.z[1:], z[1:] + 1))
+        atoms.rotate(angle=np.pi, axis=Vector([1, 0, 0]),
+                     anchor_point=Vector([0, 0, 0]))
+        assert_true(np.allclose(atoms.z, [atom.z for atom in atoms]))
+        assert_true(np.allclose(atoms.centroid,
+                                np.mean([atom.r for atom in atoms], axis=0)))
+
+    def test51(self):
+        atoms = self.atoms
+        Natoms = atoms.Natoms
+        ids = atoms.ids
+        del atoms[0]
+        assert_equal(atoms.ids.tolist(), ids[1:].tolist())
+        atoms.append(StructureAtom(element='N', id=Natoms + 1))
+        assert_equal(atoms.ids[-1], Natoms + 1)
+        assert_equal(atoms.elements[-1], 'N')
+        atoms.data = atoms.data[:10]
+        assert_equal(len(atoms.masses), 10)
+        atoms.sort(key=lambda atom: atom.id, reverse=True)
+        assert_equal(atoms.ids.tolist(), sorted(atoms.ids, reverse=True))
+        masses = atoms.masses
+        masses[:] = 0.0
+        assert_true(np.all(atoms.masses > 0))
+
+    def test52(self):
+        atoms = self.atoms
+        ids = [12, 3, 7, 10000]
+        selected = atoms.get_atoms(ids=ids, aslist=True)
+        assert_equal([atom.id for atom in selected], [12, 3, 7])
+        assert_equal(atoms.get_atom(7).id, 7)
+        assert_true(atoms.get_atom(10000) is None)
+        inverted = atoms.filtered_ids(ids, invert=True)
+        assert_equal(inverted.Natoms, atoms.Natoms - 3)
+        assert_false(np.any(np.in1d(inverted.ids, ids)))
+        atoms.get_atom(7).id = 10000
+        assert_equal(atoms.get_atom(10000).id, 10000)
+        assert_true(atoms.get_atom(7) is None)
+        del atoms[0]
+        assert_true(atoms.get_atom(1) is None)
+        atoms.assign_unique_ids(starting_id=101)
+        assert_equal(atoms.get_atom(101), atoms[0])
+
+    def test53(self):
+        atoms = self.atoms
+        atom_tree = atoms.atom_tree
+        assert_true(atoms.atom_tree is atom_tree)
+        atoms[0].CN = 10
+        assert_true(atoms.atom_tree is atom_tree)
+        atoms.translate(Vector([0, 0, 1]))
+        assert_false(atoms.atom_tree is atom_tree)
+        assert_true(np.allclose(atoms.atom_tree.data, atoms.coords))
+        atom_tree = atoms.atom_tree
+        atoms.set_pbc('z')
+        assert_false(atoms.atom_tree is atom_tree)
+        atoms.unset_pbc()
+        atoms.update_neighbors()
+        NNd, NNi = atoms.query_atom_tree(k=atoms.kNN, rc=atoms.NNrc)
+        assert_true(np.all(NNd[NNi < atoms.Natoms] <= atoms.NNrc))
+
+    def test54(self):
+        atoms = self.atoms
+        atoms.update_neighbors(cutoff=1.5)
+        atoms.update_neighbor_lists()
+        nn_amat = atoms.nn_adjacency_matrix
+        assert_true(issparse(nn_amat))
+        assert_equal(nn_amat.shape, (atoms.Natoms, atoms.Natoms))
+        assert_true(np.all(nn_amat.indptr == atoms.nn_seed))
+        assert_true(np.all(nn_amat.indices == atoms.nn_idx))
+        assert_true(np.all(np.diff(atoms.nn_seed) ==
+                           atoms.coordination_numbers))
+        assert_equal(atoms.nn_vecs.shape, (atoms.NNN, 3))
+        for i in (0, atoms.Natoms // 2):
+            for si in range(atoms.nn_seed[i], atoms.nn_seed[i+1]):
+                ni = atoms.nn_idx[si]
+                assert_true(np.allclose(atoms.nn_vecs[si],
+                                        np.asarray(atoms[ni].r - atoms[i].r)))
+                assert_true(np.allclose(np.asarray(atoms.nn_vectors[si]),
+                                        atoms.nn_vecs[si]))
+
+    def test55(self):
+        atoms = self.atoms
+        atoms.set_pbc('xyz')
+        atoms.analyze_POAVs()
+        for POAV in ('POAV1', 'POAV2', 'POAVR'):
+            Vpi_vectors, atom_ids = atoms.get_POAV_attr(POAV, 'Vpi')
+            angles, angles_atom_ids = \
+                atoms.get_POAV_attr(POAV, 'sigma_pi_angles')
+            assert_is_instance(Vpi_vectors, Vectors)
+            assert_equal(atom_ids, angles_atom_ids)
+            assert_equal(angles.shape, (len(atom_ids), 3))
+            for Vpi, atom_id, sigma_pi_angles in \
+                    list(zip(Vpi_vectors, atom_ids, angles))[::10]:
+                atom = atoms.get_atom(atom_id)
+                atom_POAV = getattr(atom, POAV)
+                assert_true(np.allclose(Vpi, atom_POAV.Vpi))
+                assert_true(np.allclose(sigma_pi_angles,
+                                        atom_POAV.sigma_pi_angles))
+                for bond, sigma_pi_angle in zip(atom.bonds, sigma_pi_angles):
+                    angle = vec.angle(atom_POAV.Vpi, bond.vector)
+                    assert_true(np.allclose(max(angle, np.pi - angle),
+                                            sigma_pi_angle))
+
+    def test56(self):
+        atoms = copy.deepcopy(self.atoms[:50])
+        expected = copy.deepcopy(self.atoms[:50])
+        [atom.rotate(axis=[1, 1, 1], angle=np.pi/3, anchor_point=[1, 2, 3])
+         for atom in expected]
+        [atom.translate(Vector([1.0, -2.0, 0.5])) for atom in expected]
+        atoms.rotate(axis=[1, 1, 1], angle=np.pi/3, anchor_point=[1, 2, 3])
+        atoms.translate(Vector([1.0, -2.0, 0.5]))
+        for atom, expected_atom in zip(atoms, expected):
+            for attr in ('r', 'r0'):
+                v, ev = getattr(atom, attr), getattr(expected_atom, attr)
+                assert_true(np.allclose(v, ev))
+                assert_true(np.allclose(v.p0, ev.p0))
+                assert_true(np.allclose(v.p, ev.p))
+        assert_true(np.allclose(atoms.coords, expected.coords))
+
+        atoms = MDAtoms([MDAtom('C', x=i, y=1, z=2, vx=1, vy=0, vz=i, fx=0,
+                                fy=i, fz=1) for i in range(5)])
+        expected = copy.deepcopy(atoms)
+        [atom.rotate(axis=[1, 1, 0], angle=0.5, anchor_point=[0, 1, 0])
+         for atom in expected]
+        atoms.rotate(axis=[1, 1, 0], angle=0.5, anchor_point=[0, 1, 0])
+        for attr in ('r', 'v', 'f'):
+            assert_true(np.allclose([getattr(atom, attr) for atom in atoms],
+                                    [getattr(atom, attr) for atom in
+                                     expected]))
+
+    def test57(self):
+        atoms = self.atoms
+        atoms.assign_unique_ids()
+        vacancies = atoms[::7]
+        remaining = atoms - vacancies
+        assert_equal(remaining.ids.tolist(),
+                     [i for i in atoms.ids if (i - 1) % 7 != 0])
+        assert_equal((atoms - copy.deepcopy(vacancies)).ids.tolist(),
+                     remaining.ids.tolist())
+        assert_equal((remaining + vacancies).ids.tolist(),
+                     remaining.ids.tolist() + vacancies.ids.tolist())
+        assert_equal((atoms[:20] & atoms[10:30]).ids.tolist(),
+                     atoms[10:20].ids.tolist())
+        assert_equal(atoms.indices.tolist(), list(range(atoms.Natoms)))
+
+        a = atoms[:10]
+        a -= atoms[:3]
+        assert_equal(a.ids.tolist(), atoms[3:10].ids.tolist())
+        a &= atoms[5:20]
+        assert_equal(a.ids.tolist(), atoms[5:10].ids.tolist())
+        a ^= atoms[8:12]
+        assert_equal(a.ids.tolist(),
+                     atoms[5:8].ids.tolist() + atoms[10:12].ids.tolist())
+
+    def test58(self):
+        atoms = self.atoms
+        subset = atoms[:10]
+        x, centroid = atoms.x, atoms.centroid
+        assert_true(np.allclose(subset.x, x[:10]))
+        atoms[0].r.x = 100.
+        atoms[1].r[1] = 7
+        assert_equal(atoms.x[0], 100.)
+        assert_equal(atoms.y[1], 7.)
+        assert_equal(subset.x[0], 100.)
+        assert_equal(subset.y[1], 7.)
+        assert_true(np.allclose(atoms.x[1:], x[1:]))
+
+        for v in atoms.r:
+            v.x += 10
+        assert_true(np.allclose(atoms.x[1:], x[1:] + 10))
+        assert_true(np.allclose(atoms.centroid.y, atoms.y.mean()))
+        assert_false(np.allclose(atoms.centroid, centroid))
+
+        atoms_copy = copy.deepcopy(atoms)
+        xcopy = atoms_copy.x
+        atoms_copy[2].r.x = -100.
+        assert_equal(atoms_copy.x[2], -100.)
+        assert_equal(atoms.x[2], xcopy[2])
+
+    def test59(self):
+        atoms = StructureAtoms([StructureAtom(element='C', x=x)
+                                for x in np.arange(0.0, 20.0, 0.5)])
+        assert_equal(len(atoms._lookup_table()), 20)
+        near = StructureAtoms([StructureAtom(element='C', x=x)
+                               for x in (1.0 - 1e-12, 2.5, 3.25)])
+        assert_equal(atoms._contains_mask(near), [True, True, False])
+        assert_equal((atoms - near).Natoms, atoms.Natoms - 2)
+        assert_equal((atoms + near).Natoms, atoms.Natoms + 1)
+
 if __name__ == '__main__':
     nose.runmodule()
@@ -17,6 +17,8 @@ from sknano.generators import SWNTGenerator
 # from sknano.io import DATAReader
 # from sknano.core.structures import compute_Natoms
 # from sknano.core.atoms import SelectionParser
+from sknano.core.atoms.selections import AtomsSelectionParser, \
+    _compile_selection
 from sknano.core.geometric_regions import Cylinder
 from sknano.testing import AtomsTestFixture
 
@@ -169,6 +171,77 @@ class Tests(SelectionTestFixture):
         # for i in range(1, 9):
         #     selection_list.append(atoms.select('mol_id {}'.format(i)))
 
+    def test17(self):
+        atoms = self.atoms
+        selstr = "not (z >= 0 or id 4 5 6 9)"
+        parser = AtomsSelectionParser(atoms)
+        assert_true(parser.compile(selstr) is parser.compile(selstr))
+        mask = parser.mask(selstr)
+        assert_true(mask is parser.mask(selstr))
+        assert_equal(mask.tolist(),
+                     [not (atom.z >= 0 or atom.id in (4, 5, 6, 9))
+                      for atom in atoms])
+        sel = atoms.select(selstr)
+        assert_equal(sel.ids.tolist(), atoms.ids[mask].tolist())
+
+        atoms[0].z = -abs(atoms[0].z) - 1.0
+        atoms[0].id = 100000
+        mask = parser.mask(selstr)
+        assert_true(mask[0])
+        assert_true(atoms[0] in atoms.select(selstr))
+
+        within = atoms.select("within 1.5 of id 4 5 6 9")
+        exwithin = atoms.select("exwithin 1.5 of id 4 5 6 9")
+        assert_equal(sorted(within.ids.tolist()),
+                     sorted(exwithin.ids.tolist() + [4, 5, 6, 9]))
+
+    def test18(self):
+        atoms = self.BNatoms
+        atoms.set_pbc('z')
+        atom_tree = atoms.atom_tree
+        c = atoms.lattice.lengths[2]
+        coords = atoms._get_coords_array()
+        for ids in ([1], [1, 2, 3, 50]):
+            selstr = "within 3.0 of id {}".format(' '.join(map(str, ids)))
+            sel = atoms.select(selstr)
+            dr = coords[:, None] - coords[np.in1d(atoms.ids, ids)][None]
+            dr[..., 2] -= c * np.round(dr[..., 2] / c)
+            expected = np.any(np.linalg.norm(dr, axis=-1) <= 3.0, axis=1)
+            assert_equal(sel.ids.tolist(), atoms.ids[expected].tolist())
+            assert_true(atoms.atom_tree is atom_tree)
+
+        query = atoms.query_ball_tree(atoms.filtered(atoms.ids == 1), 3.0)
+        assert_equal(sorted(query.ids.tolist()),
+                     atoms.select("within 3.0 of id 1").ids.tolist())
+
+    def test19(self):
+        atoms = self.atoms
+        selstr = "z >= 0"
+        parser = AtomsSelectionParser(atoms)
+        mask = parser.mask(selstr)
+        atom = atoms[int(np.flatnonzero(~mask)[0])]
+        atom.r.z = abs(atom.z) + 1.0
+        assert_true(atom in atoms.select(selstr))
+        atom.r[2] = -1.0
+        assert_false(atom in atoms.select(selstr))
+        assert_equal(parser.mask(selstr).tolist(),
+                     [atom.z >= 0 for atom in atoms])
+        assert_equal(_compile_selection.cache_info().maxsize, 128)
+
+    def test20(self):
+        atoms = SWNTGenerator((5, 5), nz=4).atoms
+        selstr = "within 2.0 of id 1"
+        assert_equal(atoms.select(selstr).Natoms, 3)
+        atoms.set_pbc('z')
+        c = atoms.lattice.lengths[2]
+        coords = atoms._get_coords_array()
+        dr = coords - coords[atoms.ids == 1]
+        dr[:, 2] -= c * np.round(dr[:, 2] / c)
+        expected = np.linalg.norm(dr, axis=1) <= 2.0
+        assert_equal(atoms.select(selstr).ids.tolist(),
+                     atoms.ids[expected].tolist())
+        assert_equal(atoms.select(selstr).Natoms, 4)
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -10,6 +10,7 @@ import numpy as np
 # from sknano.io import DATAReader
 from sknano.core.math import Vector
 from sknano.core.atoms import compute_angle, compute_dihedral, compute_improper
+from sknano.core.atoms.mixins.topology import _bond_angles
 from sknano.testing import AtomsTestFixture
 
 
@@ -134,5 +135,29 @@ class Tests(AtomsTestFixture):
         atoms.angles_in_degrees = True
         print(atoms.topology_stats)
 
+    def test9(self):
+        atoms = self.atoms
+        atoms.set_pbc('xyz')
+        atoms.update_attrs(topology=True)
+        indices = atoms.topology_indices
+        measures = atoms.topology_measures
+        ids = np.asarray(atoms.ids)
+        for field in indices._fields:
+            topology = getattr(atoms, field)
+            assert_equal(ids[getattr(indices, field)].tolist(),
+                         [list(atom_ids) for atom_ids in topology.atom_ids])
+            assert_true(np.allclose(getattr(measures, field),
+                                    topology.measures, atol=1e-6))
+        atoms.angles_in_degrees = True
+        assert_true(np.allclose(atoms.topology_measures.angles,
+                                np.degrees(measures.angles)))
+
+    def test10(self):
+        b21 = np.array([[1.112627003799402, 1.4800485929872766,
+                         1.914473368931056]])
+        assert_true(np.allclose(_bond_angles(b21, 3 * b21), 0))
+        assert_true(np.allclose(_bond_angles(b21, -3 * b21), np.pi))
+
+
 if __name__ == '__main__':
     nose.runmodule()
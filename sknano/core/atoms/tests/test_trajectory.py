@@ -98,6 +98,24 @@ class Tests(TrajectoryTestFixture):
 
             prev_ss_atom = atom
 
+    def test6(self):
+        traj = self.dump.trajectory
+        reference_atoms = traj.reference_atoms
+        ss = traj[-1]
+        dr = ss.get_displacements()
+        atoms = ss.atoms
+        assert_true(all(atom.reference_atom is
+                        reference_atoms.get_atom(atom.id)
+                        for atom in atoms))
+        assert_true(np.allclose(dr, np.asarray(atoms.dr)))
+
+        selection = atoms.filtered(atoms.ids % 3 == 0)
+        traj.atom_selection.update(selection)
+        assert_equal(ss.nselected, selection.Natoms)
+        assert_equal(ss.atoms.ids.tolist(), selection.ids.tolist())
+        traj.atom_selection.all()
+        assert_equal(ss.nselected, ss.Natoms)
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -23,6 +23,14 @@ from .md_atoms import MDAtom as Atom, MDAtoms as Atoms
 __all__ = ['Snapshot', 'Trajectory']
 
 
+def _astype(column, dtype):
+    """Return :class:`~python:list` of `column` values converted to \
+        `dtype`."""
+    if dtype in (int, float):
+        return column.astype(dtype).tolist()
+    return [dtype(value) for value in column]
+
+
 class AtomSelection:
     """:class:`Trajectory` atom selection class.
 
@@ -30,9 +38,17 @@ class AtomSelection:
     ----------
     traj : :class:`Trajectory`
 
+    Attributes
+    ----------
+    atom_ids : :class:`~numpy:numpy.ndarray`
+        :attr:`~sknano.core.atoms.IDAtom.id`\ s of the atoms selected by
+        the last call to :meth:`~AtomSelection.update` for all snapshots,
+        or `None` if all atoms are selected.
+
     """
     def __init__(self, traj):
         self.traj = traj
+        self.atom_ids = None
 
     def all(self, ts=None):
         """Select all atoms for all snapshots or snapshot at given timestep.
@@ -43,40 +59,52 @@ class AtomSelection:
 
         """
         if ts is None:
+            self.atom_ids = None
             for snapshot in self.traj:
                 if not snapshot.selected:
                     continue
-                for i in range(snapshot.Natoms):
-                    snapshot.atom_selection[i] = True
+                snapshot.atom_selection[:] = True
                 # snapshot.nselected = snapshot.Natoms
         else:
             snapshot = self.traj.get_snapshot(ts)
-            for i in range(snapshot.Natoms):
-                snapshot.atom_selection[i] = True
+            snapshot.atom_selection[:] = True
             # snapshot.nselected = snapshot.Natoms
 
     def update(self, atoms, ts=None):
+        """Select the atoms with the :attr:`~sknano.core.atoms.IDAtom.id`\ s \
+            of `atoms` for all selected snapshots or snapshot at given \
+            timestep.
+
+        Parameters
+        ----------
+        atoms : :class:`~sknano.core.atoms.IDAtoms`
+        ts : {None, int}, optional
+
+        """
         atom_ids = atoms.ids
         if ts is None:
+            self.atom_ids = atom_ids
             for ss in self.traj:
-                if not ss.selected:
-                    continue
-                aselection = ss.atom_selection
-                id_idx = ss.atomattrs.index('id')
-                for i, atom in enumerate(ss.get_atoms(asarray=True)):
-                    if int(atom[id_idx]) in atom_ids:
-                        aselection[i] = True
-                    else:
-                        aselection[i] = False
+                if ss.selected:
+                    self.apply(ss)
         else:
             ss = self.traj.get_snapshot(ts)
-            aselection = ss.atom_selection
-            id_idx = ss.atomattrs.index('id')
-            for i, atom in enumerate(ss.get_atoms(asarray=True)):
-                if int(atom[id_idx]) in atom_ids:
-                    aselection[i] = True
-                else:
-                    aselection[i] = False
+            ss.atom_selection[:] = \
+                np.in1d(ss.get_column('id').astype(int), atom_ids)
+
+    def apply(self, snapshot):
+        """Apply the current atom selection to `snapshot`.
+
+        Parameters
+        ----------
+        snapshot : :class:`Snapshot`
+
+        """
+        if self.atom_ids is None:
+            snapshot.atom_selection[:] = True
+        else:
+            snapshot.atom_selection[:] = \
+                np.in1d(snapshot.get_column('id').astype(int), self.atom_ids)
 
 
 class TimeSelection:
@@ -136,12 +164,23 @@ class Snapshot(TabulateMixin, BaseClass):
     Parameters
     ----------
     trajectory : :class:`Trajectory`, optional
+    loader : callable, optional
+        Function returning the atoms array of the snapshot, which is
+        called when the atoms are first accessed.
+
+    Attributes
+    ----------
+    columns : :class:`~python:dict`
+        :class:`~python:dict` mapping dump attributes to read-only
+        memory-mapped columns of a trajectory cache, or `None`.
 
     """
-    def __init__(self, trajectory=None):
+    def __init__(self, trajectory=None, loader=None):
         super().__init__()
 
         self.trajectory = trajectory
+        self.loader = loader
+        self.columns = None
         self.timestep = None
         self.domain = None
         self._atoms = None
@@ -244,12 +283,15 @@ class Snapshot(TabulateMixin, BaseClass):
         """Alias for :attr:`Snapshot.nselected`."""
         return self.nselected
 
-    def get_atoms(self, asarray=False):
+    def get_atoms(self, asarray=False, load=True):
         """Get atoms.
 
         Parameters
         ----------
         asarray : :class:`~python:bool`
+        load : :class:`~python:bool`, optional
+            If `False`, do not call the :attr:`~Snapshot.loader` to read
+            the atoms array if it has not been read yet.
 
         Returns
         -------
@@ -260,9 +302,71 @@ class Snapshot(TabulateMixin, BaseClass):
 
         """
         if asarray:
+            if self._atoms_array is None and self.loader is not None \
+                    and load:
+                self._atoms_array = self.loader()
             return self._atoms_array
         return self.atoms
 
+    def get_column(self, attr):
+        """Get the column of dump attribute `attr` of the atoms array.
+
+        If the snapshot has trajectory cache :attr:`~Snapshot.columns` and
+        its atoms array has not been read, the memory-mapped cache column
+        is returned without reading the atoms array.
+
+        Parameters
+        ----------
+        attr : :class:`~python:str`
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+
+        """
+        if self._atoms_array is None and self.columns is not None:
+            return self.columns[attr]
+        return self.get_atoms(asarray=True)[:, self.dumpattrs2index[attr]]
+
+    def release(self):
+        """Release the atoms of a snapshot with a :attr:`~Snapshot.loader`.
+
+        The atoms are read again by the :attr:`~Snapshot.loader` when
+        they are next accessed.
+
+        """
+        if self.loader is not None:
+            self._atoms = None
+            self._atoms_array = None
+
+    def get_displacements(self):
+        """Get the displacements of the atoms from their reference atoms.
+
+        The rows of the atoms array are aligned with the
+        :attr:`~Trajectory.reference_atoms` by atom id, without creating
+        the snapshot :attr:`~Snapshot.atoms`.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            :math:`N\\times 3` array of the displacements of the rows of
+            the atoms array. The displacements of atoms without a
+            reference atom are zero.
+
+        """
+        r = np.column_stack([self.get_column(attr) for attr in 'xyz'])
+        dr = np.zeros_like(r)
+        try:
+            reference_atoms = self.trajectory.reference_atoms
+            indices = \
+                reference_atoms._lookup_ids(self.get_column('id').astype(int))
+            r0 = reference_atoms._get_coords_array()
+        except AttributeError:
+            return dr
+        found = indices >= 0
+        dr[found] = r[found] - r0[indices[found]]
+        return dr
+
     def _update_atoms(self):
         atoms = Atoms()
         traj = self.trajectory
@@ -270,16 +374,23 @@ class Snapshot(TabulateMixin, BaseClass):
         atomattrmap = self.atomattrmap
         attr_dtypes = self.attr_dtypes
         id_idx = atomattrs.index('id')
-        for atom in self._atoms_array:
-            try:
-                reference_atom = \
-                    traj.reference_atoms.get_atom(int(atom[id_idx]))
-            except AttributeError:
-                reference_atom = None
+        atoms_array = self.get_atoms(asarray=True)
+        columns = [_astype(atoms_array[:, idx], attr_dtypes[idx])
+                   for idx in range(len(atomattrs))]
 
-            attrs = {attr: attr_dtypes[idx](atom[idx]) for idx, attr in
-                     enumerate(atomattrs)}
+        # Align the rows with the reference atoms in one batched id lookup
+        try:
+            reference_atoms = traj.reference_atoms
+            reference_indices = \
+                reference_atoms._lookup_ids(columns[id_idx]).tolist()
+            reference_data = reference_atoms.data
+        except AttributeError:
+            reference_indices = [-1] * len(atoms_array)
+            reference_data = None
 
+        for i, values in zip(reference_indices, zip(*columns)):
+            reference_atom = reference_data[i] if i >= 0 else None
+            attrs = dict(zip(atomattrs, values))
             atoms.append(Atom(reference_atom=reference_atom, **attrs))
 
         if atomattrmap is not None:
@@ -290,7 +401,7 @@ class Snapshot(TabulateMixin, BaseClass):
 
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
-        return dict(trajectory=self.trajectory)
+        return dict(trajectory=self.trajectory, loader=self.loader)
 
 
 class Trajectory(TabulateMixin, UserList):
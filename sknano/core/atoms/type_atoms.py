@@ -17,8 +17,6 @@ __docformat__ = 'restructuredtext en'
 from operator import attrgetter
 import numbers
 
-import numpy as np
-
 from sknano.core import dedupe
 from .atoms import Atom, Atoms
 
@@ -161,7 +159,7 @@ class TypeAtoms(Atoms):
            attribute.
 
         """
-        return np.asarray([atom.type for atom in self])
+        return self.get_column('type').copy()
 
     @property
     def atomtypes(self):
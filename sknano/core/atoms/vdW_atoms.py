@@ -139,7 +139,7 @@ class VanDerWaalsAtoms(Atoms):
     @property
     def r_vdw(self):
         """Return array of `VanDerWaalsAtom` van der Waals radii."""
-        return np.asarray([atom.r_vdw for atom in self])
+        return self.get_column('r_vdw').copy()
 
 
 def vdw_radius_from_basis(*args):
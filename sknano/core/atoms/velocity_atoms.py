@@ -240,7 +240,7 @@ class VelocityAtoms(Atoms):
     def v(self):
         """Returns a :class:`Vectors` object of :attr:`VelocityAtom.v` \
             :class:`Vector`\ s"""
-        return Vectors([atom.v for atom in self])
+        return Vectors(self.get_column('v', aslist=True))
 
     @property
     def velocities(self):
@@ -15,7 +15,8 @@ __docformat__ = 'restructuredtext en'
 import numbers
 
 from collections import OrderedDict
-from math import fsum
+from itertools import compress, product
+from math import floor, fsum
 from operator import attrgetter
 
 import numpy as np
@@ -304,6 +305,31 @@ class XYZAtoms(Atoms):
     def sort(self, key=attrgetter('r'), reverse=False):
         super().sort(key=key, reverse=reverse)
 
+    def _lookup_key(self, atom):
+        """Return hashable key used to look up `atom` in hash tables.
+
+        `XYZAtom` equality also requires :attr:`XYZAtom.r`\ s that are
+        equal to within :func:`~numpy:numpy.allclose` tolerances, so the
+        key also holds the cell of the unit grid containing
+        :attr:`XYZAtom.r`.
+
+        """
+        return (super()._lookup_key(atom),
+                tuple(floor(x) for x in atom.r.tolist()))
+
+    def _lookup_keys(self, atom):
+        """Return the :meth:`_lookup_key`\ s of the atoms that may compare \
+            equal to `atom`.
+
+        Atoms closer than the :func:`~numpy:numpy.allclose` tolerances may
+        lie in neighbouring grid cells, so the keys of the cell containing
+        `atom` and of its 26 neighbouring cells are returned.
+
+        """
+        key, (i, j, k) = self._lookup_key(atom)
+        return [(key, (i + di, j + dj, k + dk))
+                for di, dj, dk in product((-1, 0, 1), repeat=3)]
+
     @property
     def center_of_mass(self):
         """Center-of-Mass coordinates of `Atoms`.
@@ -321,8 +347,8 @@ class XYZAtoms(Atoms):
             The position vector of the center of mass coordinates.
 
         """
-        masses = np.asarray([self.masses])
-        coords = self.coords
+        masses = np.asarray([self.get_column('mass')])
+        coords = self._get_coords_array()
         MxR = masses.T * coords
         com = Vector(np.sum(MxR, axis=0) / np.sum(masses))
         com.rezero()
@@ -356,7 +382,7 @@ class XYZAtoms(Atoms):
         C : :class:`~sknano.core.math.Vector`
             The position vector of the centroid coordinates.
         """
-        C = Vector(np.mean(self.coords, axis=0))
+        C = Vector(np.mean(self._get_coords_array(), axis=0))
         C.rezero()
         return C
 
@@ -373,7 +399,7 @@ class XYZAtoms(Atoms):
     @property
     def r(self):
         """:class:`Vectors` of :attr:`Atom.r` position `Vector`\ s"""
-        return Vectors([atom.r for atom in self])
+        return Vectors(self.get_column('r', aslist=True))
 
     @property
     def dr(self):
@@ -383,20 +409,22 @@ class XYZAtoms(Atoms):
     @property
     def x(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`XYZAtom.x` coordinates."""
-        # return np.asarray(self.r)[:, 0]
-        return self.r.x
+        return self._get_coords_array()[:, 0].copy()
 
     @property
     def y(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`XYZAtom.y` coordinates."""
-        # return np.asarray(self.r)[:, 1]
-        return self.r.y
+        return self._get_coords_array()[:, 1].copy()
 
     @property
     def z(self):
         """:class:`~numpy:numpy.ndarray` of :attr:`XYZAtom.z` coordinates."""
-        # return np.asarray(self.r)[:, 2]
-        return self.r.z
+        return self._get_coords_array()[:, 2].copy()
+
+    def _get_coords_array(self):
+        """Return cached, read-only :math:`N\\times 3` array of \
+            :attr:`XYZAtom.r` coordinates."""
+        return self.get_column('r').reshape(-1, 3)
 
     @property
     def inertia_tensor(self):
@@ -530,7 +558,8 @@ class XYZAtoms(Atoms):
             centroid0 = self.centroid
             self.translate(-centroid0)
 
-        self.data = [atom for atom in self if region.contains(atom.r)]
+        mask = region.contains_points(self._get_coords_array())
+        self.data = list(compress(self.data, mask.tolist()))
 
         if centroid0 is not None:
             self.translate(centroid0)
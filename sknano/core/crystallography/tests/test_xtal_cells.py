@@ -60,5 +60,32 @@ def test4():
     assert_true(np.allclose(2**3 * gold.unit_cell.volume, supercell.volume))
 
 
+def test5():
+    lattice = Crystal3DLattice.cubic(5.0)
+    unit_cell = UnitCell(lattice=lattice, basis=['C', 'N'],
+                         coords=[[0, 0, 0], [1/2, 1/2, 1/2]])
+    supercell = SuperCell(unit_cell, scaling_matrix=[2, 3, 1])
+    basis = supercell.basis
+    assert_equal(basis.Natoms, 12)
+    assert_equal(basis.symbols.tolist(), 6 * ['C'] + 6 * ['N'])
+
+    tvecs = [[i, j, 0] for i in range(2) for j in range(3)]
+    coords = [np.asarray(r) + t for r in unit_cell.basis.coords for t in
+              np.dot(tvecs, lattice.matrix.A)]
+    assert_true(np.allclose(basis.coords, coords))
+    assert_true(np.allclose(
+        basis.rs, supercell.lattice.cartesian_to_fractional(coords)))
+
+    supercell = SuperCell(unit_cell, scaling_matrix=[2, 3, 1],
+                          wrap_coords=True)
+    rs = np.asarray(supercell.basis.rs)
+    assert_true(np.all((rs >= 0) & (rs < 1)))
+    assert_true(np.allclose(supercell.basis.coords, np.dot(
+        rs, supercell.lattice.matrix.A)))
+
+    supercell.translate_basis([0.25, 0, 0], cartesian=False)
+    assert_true(np.allclose(supercell.basis.xs, (rs[:, 0] + 0.25) % 1))
+
+
 if __name__ == '__main__':
     nose.runmodule()
@@ -597,6 +597,44 @@ class Tests(CrystallographyTestFixture):
         print(lattice.centroid)
         assert_equal(lattice.centroid, lattice.region.centroid)
 
+    def test23(self):
+        lattice = self.get_xtal_lattice(nd=3, a=3.0, b=4.0, c=5.0,
+                                        alpha=80, beta=95, gamma=110,
+                                        offset=[1.0, -2.0, 0.5])
+        cell_matrix = lattice.cell_matrix
+        cell_array = lattice._cell_array
+        assert_true(lattice._cell_array is cell_array)
+        assert_true(np.allclose(cell_array, cell_matrix))
+
+        fcoords = np.random.uniform(-1.5, 2.5, size=(50, 3))
+        ccoords = lattice.fractional_to_cartesian(fcoords)
+        assert_true(np.allclose(
+            ccoords, np.asarray(cell_matrix.T * np.asmatrix(fcoords).T).T +
+            lattice.offset))
+        assert_true(np.allclose(lattice.cartesian_to_fractional(ccoords),
+                                fcoords))
+        assert_true(np.allclose(lattice.fractional_to_cartesian(fcoords[0]),
+                                ccoords[0]))
+
+        wrapped = lattice.wrap_fractional_coordinates(fcoords)
+        assert_true(np.all((wrapped >= 0) & (wrapped < 1)))
+        assert_true(np.allclose(wrapped, fcoords - np.floor(fcoords)))
+        wrapped = lattice.wrap_fractional_coordinates(
+            fcoords, pbc=[True, False, True])
+        assert_true(np.allclose(wrapped[:, 1], fcoords[:, 1]))
+        assert_true(np.allclose(
+            lattice.wrap_cartesian_coordinates(ccoords),
+            lattice.fractional_to_cartesian(fcoords - np.floor(fcoords))))
+
+        lattice.a = 6.0
+        assert_true(lattice._cell_array is not cell_array)
+        assert_true(np.allclose(lattice.fractional_to_cartesian([1, 0, 0]),
+                                np.asarray(lattice.a1) +
+                                np.asarray(lattice.offset)))
+        lattice.rotate(angle=np.pi / 3, axis=zhat)
+        assert_true(np.allclose(lattice.fractional_to_cartesian([0, 1, 0]),
+                                np.asarray(lattice.a2) +
+                                np.asarray(lattice.offset)))
 
 
 if __name__ == '__main__':
@@ -348,20 +348,44 @@ class CrystalCell(BaseClass, TabulateMixin):
 
         basis = self.basis[:]
         max_mol = max(set(basis.mols))
-        self.basis = BasisAtoms()
-        for atom in basis:
-            for i, tvec in enumerate(tvecs):
-                xs, ys, zs = \
-                    self.lattice.cartesian_to_fractional(atom.r + tvec)
-                if self.wrap_coords:
-                    xs, ys, zs = \
-                        self.lattice.wrap_fractional_coordinate(
-                            [xs, ys, zs])
-                mol = i * max_mol + atom.mol
-                self.basis.append(BasisAtom(atom.element,
-                                            mol=mol, id=atom.id,
-                                            lattice=self.lattice,
-                                            xs=xs, ys=ys, zs=zs))
+        ntvecs = len(tvecs)
+        mols = (np.arange(ntvecs)[np.newaxis, :] * max_mol +
+                np.asarray(basis.mols)[:, np.newaxis]).ravel()
+        coords = basis._get_coords_array()[:, np.newaxis, :] + \
+            tvecs[np.newaxis, :, :]
+        self.basis = self._basis_from_columns(
+            np.repeat(basis.get_column('element'), ntvecs),
+            mols, np.repeat(basis.get_column('id'), ntvecs),
+            self.lattice.cartesian_to_fractional(coords.reshape(-1, 3)),
+            wrap_coords=self.wrap_coords)
+
+    def _basis_from_columns(self, elements, mols, ids, rs, wrap_coords=False):
+        """Return :class:`~sknano.core.atoms.BasisAtoms` built from \
+            columns of atom attributes.
+
+        Parameters
+        ----------
+        elements, mols, ids : array_like
+            Per-atom element symbols, molecule ids, and atom ids.
+        rs : :class:`~numpy:numpy.ndarray`
+            (N, 3) array of fractional coordinates in :attr:`lattice`.
+        wrap_coords : {:class:`~python:bool`}, optional
+            Wrap `rs` into the unit cell before creating the atoms.
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.BasisAtoms`
+
+        """
+        lattice = self.lattice
+        if wrap_coords:
+            rs = lattice.wrap_fractional_coordinates(rs)
+        return BasisAtoms([BasisAtom(element, mol=mol, id=id_,
+                                     lattice=lattice, xs=xs, ys=ys, zs=zs)
+                           for element, mol, id_, (xs, ys, zs) in
+                           zip(np.asarray(elements).tolist(),
+                               np.asarray(mols).tolist(),
+                               np.asarray(ids).tolist(), rs.tolist())])
 
     def rezero(self, **kwargs):
         """Rezero the crystal cell basis coordinates."""
@@ -393,18 +417,13 @@ class CrystalCell(BaseClass, TabulateMixin):
         if cartesian:
             t = self.lattice.cartesian_to_fractional(t)
 
-        basis = self.basis[:]
-        self.basis = BasisAtoms()
-
-        for atom in basis:
-            xs, ys, zs = atom.rs + t
-            if wrap_coords:
-                xs, ys, zs = \
-                    self.lattice.wrap_fractional_coordinate([xs, ys, zs])
-            self.basis.append(BasisAtom(atom.element,
-                                        mol=atom.mol, id=atom.id,
-                                        lattice=self.lattice,
-                                        xs=xs, ys=ys, zs=zs))
+        basis = self.basis
+        self.basis = self._basis_from_columns(
+            basis.get_column('element'), basis.get_column('mol'),
+            basis.get_column('id'),
+            self.lattice.cartesian_to_fractional(
+                basis._get_coords_array()) + np.asarray(t),
+            wrap_coords=wrap_coords)
 
     def update_basis(self, element, index=None, step=None):
         """Update a crystal cell basis element."""
@@ -335,10 +335,10 @@ class LatticeBase(TabulateMixin, BaseClass):
         if orientation_matrix is None:
             orientation_matrix = np.asmatrix(np.identity(3))
 
-        self.orientation_matrix = np.asmatrix(orientation_matrix)
+        self.orientation_matrix = orientation_matrix
         self.lattice_type = None
         self._offset = Point(offset, nd=3)
-        self._update_region()
+        self._region_frame = (self.cell_matrix, np.array(self.offset))
         self.fmtstr = "orientation_matrix={orientation_matrix!r}, " + \
             "offset={offset!r}"
 
@@ -350,6 +350,30 @@ class LatticeBase(TabulateMixin, BaseClass):
     def __dir__(self):
         return ['nd', 'offset', 'orientation_matrix']
 
+    def _cached_matrix(self, name, compute):
+        """Return the cached matrix `name`, calling `compute` to compute \
+            it if it is not cached.
+
+        The cached matrices are read-only and are discarded when either the
+        :attr:`~LatticeBase.ortho_matrix` is recomputed after a lattice
+        parameter changes or the :attr:`~LatticeBase.orientation_matrix`
+        is set.
+
+        """
+        ortho_matrix = self.ortho_matrix
+        orientation_matrix = self.__dict__.get('_orientation_matrix')
+        cache = self.__dict__.get('_matrix_cache')
+        if cache is None or cache[0] is not ortho_matrix or \
+                cache[1] is not orientation_matrix:
+            cache = self._matrix_cache = \
+                (ortho_matrix, orientation_matrix, {})
+        try:
+            return cache[-1][name]
+        except KeyError:
+            matrix = cache[-1][name] = compute()
+            matrix.flags.writeable = False
+            return matrix
+
     def __eq__(self, other):
         if isinstance(other, type(self)):
             return self is other or \
@@ -373,6 +397,15 @@ class LatticeBase(TabulateMixin, BaseClass):
         # self.translate(Vector(p0=self._offset, p=Point(value)))
         self._offset[:] = Point(value)
 
+    @property
+    def orientation_matrix(self):
+        """Rotation matrix :math:`[R]` of the lattice orientation."""
+        return self._orientation_matrix
+
+    @orientation_matrix.setter
+    def orientation_matrix(self, value):
+        self._orientation_matrix = np.asmatrix(value)
+
     @property
     def ortho_matrix(self):
         """Transformation matrix to convert from fractional coordinates to \
@@ -413,7 +446,9 @@ class LatticeBase(TabulateMixin, BaseClass):
            =([R][\\mathbf{a}\\,\\mathbf{b}\\,\\mathbf{c}])^T
 
         """
-        return (self.orientation_matrix * self.ortho_matrix).T
+        return self._cached_matrix(
+            'cell_matrix',
+            lambda: (self.orientation_matrix * self.ortho_matrix).T).copy()
 
     @property
     def cell(self):
@@ -461,12 +496,30 @@ class LatticeBase(TabulateMixin, BaseClass):
         where :math:`V` is the volume of the unit cell.
 
         """
-        return np.linalg.inv(self.ortho_matrix)
+        return self._cached_matrix(
+            'fractional_matrix',
+            lambda: np.linalg.inv(self.ortho_matrix)).copy()
 
     @property
     def metric_tensor(self):
         """Metric tensor."""
-        return self.cell_matrix * self.cell_matrix.T
+        return self._cached_matrix(
+            'metric_tensor',
+            lambda: self.cell_matrix * self.cell_matrix.T).copy()
+
+    @property
+    def _cell_array(self):
+        """:class:`~numpy:numpy.ndarray` of the \
+            :attr:`~LatticeBase.cell_matrix`."""
+        return self._cached_matrix('cell_array',
+                                   lambda: np.asarray(self.cell_matrix))
+
+    @property
+    def _inverse_cell_array(self):
+        """:class:`~numpy:numpy.ndarray` of the inverse of the \
+            :attr:`~LatticeBase.cell_matrix`."""
+        return self._cached_matrix('inverse_cell_array',
+                                   lambda: np.linalg.inv(self._cell_array))
 
     @property
     def bounding_box(self):
@@ -475,16 +528,22 @@ class LatticeBase(TabulateMixin, BaseClass):
 
     @property
     def region(self):
-        """:class:`Parallelepiped` defined by lattice vectors."""
-        try:
-            return self._region
-        except AttributeError:
+        """:class:`Parallelepiped` defined by lattice vectors.
+
+        The region is created on first access from the lattice vectors and
+        offset the lattice was constructed with, so that lattices copied for
+        every atom of a large structure do not each build one.
+
+        """
+        if self.__dict__.get('_region') is None:
             self._update_region()
-            return self._region
+        return self._region
 
     def _update_region(self):
-        cell_matrix = self.cell_matrix
-        o = self.offset
+        try:
+            cell_matrix, o = self.__dict__.pop('_region_frame')
+        except KeyError:
+            cell_matrix, o = self.cell_matrix, self.offset
         u, v, w = \
             map(Vector, [cell_matrix[ri].A.flatten() for ri in range(3)])
         # u, v, w = \
@@ -512,18 +571,16 @@ class LatticeBase(TabulateMixin, BaseClass):
         Parameters
         ----------
         fcoords : array_like
+            A single fractional coordinate or an :math:`N\\times 3` array
+            of fractional coordinates.
 
         Returns
         -------
         :class:`~numpy:numpy.ndarray`
 
         """
-        ccoords = self.orientation_matrix * self.ortho_matrix * \
-            np.asmatrix(fcoords).T + self.offset.column_matrix
-        try:
-            return ccoords.T.A.reshape((3, ))
-        except ValueError:
-            return ccoords.T.A.reshape((len(fcoords), 3))
+        return np.dot(np.asarray(fcoords, dtype=float), self._cell_array) + \
+            np.asarray(self.offset)
 
     def cartesian_to_fractional(self, ccoords):
         """Convert cartesian coordinate to fractional coordinate.
@@ -531,19 +588,16 @@ class LatticeBase(TabulateMixin, BaseClass):
         Parameters
         ----------
         ccoords : array_like
+            A single cartesian coordinate or an :math:`N\\times 3` array
+            of cartesian coordinates.
 
         Returns
         -------
         :class:`~numpy:numpy.ndarray`
 
         """
-        fcoords = np.linalg.inv(self.ortho_matrix) * \
-            np.linalg.inv(self.orientation_matrix) * \
-            (np.asmatrix(ccoords).T - self.offset.column_matrix)
-        try:
-            return fcoords.T.A.reshape((3, ))
-        except ValueError:
-            return fcoords.T.A.reshape((len(ccoords), 3))
+        return np.dot(np.asarray(ccoords, dtype=float) -
+                      np.asarray(self.offset), self._inverse_cell_array)
 
     def wrap_fractional_coordinate(self, p, epsilon=1e-8, pbc=None):
         """Wrap fractional coordinate to lie within unit cell.
@@ -557,35 +611,33 @@ class LatticeBase(TabulateMixin, BaseClass):
         :class:`~numpy:numpy.ndarray`
 
         """
-        if pbc is None:
-            pbc = np.asarray(np.ones(3), dtype=bool)
-        elif isinstance(pbc, bool):
-            pbc = np.asarray(3 * [pbc], dtype=bool)
-        else:
-            pbc = np.asarray(pbc, dtype=bool)
-        p = np.ma.array(p, mask=~pbc)
-        p = np.ma.fmod(p, 1)
-        p[np.ma.where(p < 0)] += 1
-        p[np.ma.where(p > 1 - epsilon)] -= 1
-        p[np.ma.where(np.logical_or((p > 1 - epsilon), (p < epsilon)))] = 0
-        p.mask = np.ma.nomask
-        return np.asarray(p.tolist())
+        return self.wrap_fractional_coordinates(p, epsilon=epsilon, pbc=pbc)
 
     def wrap_fractional_coordinates(self, points, epsilon=1e-8, pbc=None):
         """Wrap array of fractional coordinates to lie within unit cell.
 
         Parameters
         ----------
-        p : array_like
+        points : array_like
+            :math:`N\\times 3` array of fractional coordinates.
 
         Returns
         -------
         :class:`~numpy:numpy.ndarray`
 
         """
-        return np.asarray([self.wrap_fractional_coordinate(p, epsilon=epsilon,
-                                                           pbc=pbc)
-                           for p in points])
+        if pbc is None:
+            pbc = np.ones(3, dtype=bool)
+        elif isinstance(pbc, bool):
+            pbc = np.asarray(3 * [pbc], dtype=bool)
+        else:
+            pbc = np.asarray(pbc, dtype=bool)
+        points = np.asarray(points, dtype=float)
+        wrapped = np.fmod(points, 1)
+        wrapped[wrapped < 0] += 1
+        wrapped[wrapped > 1 - epsilon] -= 1
+        wrapped[np.logical_or(wrapped > 1 - epsilon, wrapped < epsilon)] = 0
+        return np.where(pbc, wrapped, points)
 
     def wrap_cartesian_coordinate(self, p, epsilon=1e-8, pbc=None):
         """Wrap cartesian coordinate to lie within unit cell.
@@ -599,25 +651,25 @@ class LatticeBase(TabulateMixin, BaseClass):
         :class:`~numpy:numpy.ndarray`
 
         """
-        return self.fractional_to_cartesian(
-            self.wrap_fractional_coordinate(self.cartesian_to_fractional(p),
-                                            epsilon=epsilon, pbc=pbc))
+        return self.wrap_cartesian_coordinates(p, epsilon=epsilon, pbc=pbc)
 
     def wrap_cartesian_coordinates(self, points, epsilon=1e-8, pbc=None):
         """Wrap array of cartesian coordinates to lie within unit cell.
 
         Parameters
         ----------
-        p : array_like
+        points : array_like
+            :math:`N\\times 3` array of cartesian coordinates.
 
         Returns
         -------
         :class:`~numpy:numpy.ndarray`
 
         """
-        return np.asarray([self.wrap_cartesian_coordinate(p, epsilon=epsilon,
-                                                          pbc=pbc)
-                           for p in points])
+        return self.fractional_to_cartesian(
+            self.wrap_fractional_coordinates(
+                self.cartesian_to_fractional(points), epsilon=epsilon,
+                pbc=pbc))
 
     def rotate(self, **kwargs):
         """Rotate unit cell.
@@ -666,7 +718,12 @@ class LatticeBase(TabulateMixin, BaseClass):
 
         """
         self.offset.translate(t)
-        self.region.translate(t)
+        region = self.__dict__.get('_region')
+        if region is not None:
+            region.translate(t)
+        elif '_region_frame' in self.__dict__:
+            cell_matrix, o = self._region_frame
+            self._region_frame = (cell_matrix, o + np.asarray(t))
 
     def todict(self):
         """Return dict of constructor parameters."""
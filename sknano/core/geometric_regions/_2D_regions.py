@@ -218,7 +218,28 @@ class Parallelogram(Geometric2DRegion):
            \\le 1
 
         """
-        px, py = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Parallelogram`.
+
+        See Also
+        --------
+        Parallelogram.contains
+
+        """
+        px, py = self._points_array(points).T
 
         ox, oy = self.o
         ux, uy = self.u
@@ -227,7 +248,7 @@ class Parallelogram(Geometric2DRegion):
         q1 = ((py - oy) * vx + (ox - px) * vy) / (uy * vx - ux * vy)
         q2 = ((py - oy) * ux + (ox - px) * uy) / (ux * vy - uy * vx)
 
-        return q1 >= 0 and q1 <= 1 and q2 >= 0 and q2 <= 1
+        return (q1 >= 0) & (q1 <= 1) & (q2 >= 0) & (q2 <= 1)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Paralleogram` \
@@ -443,13 +464,34 @@ class Rectangle(Geometric2DRegion):
            y_{\mathrm{min}}\\le y\\le y_{\\mathrm{max}}
 
         """
-        px, py = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Rectangle`.
+
+        See Also
+        --------
+        Rectangle.contains
+
+        """
+        px, py = self._points_array(points).T
         xmin = self.xmin
         xmax = self.xmax
         ymin = self.ymin
         ymax = self.ymax
 
-        return (px >= xmin) and (px <= xmax) and (py >= ymin) and (py <= ymax)
+        return (px >= xmin) & (px <= xmax) & (py >= ymin) & (py <= ymax)
 
     def rotate(self, **kwargs):
         super().rotate(**kwargs)
@@ -554,14 +596,35 @@ class Square(Geometric2DRegion):
            i\\in \\{x, y\\}
 
         """
-        px, py = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Square`.
+
+        See Also
+        --------
+        Square.contains
+
+        """
+        px, py = self._points_array(points).T
         cx, cy = self.center
         a = self.a
         xmin = cx - a / 2
         xmax = cx + a / 2
         ymin = cy - a / 2
         ymax = cy + a / 2
-        return (px >= xmin) and (px <= xmax) and (py >= ymin) and (py <= ymax)
+        return (px >= xmin) & (px <= xmax) & (py >= ymin) & (py <= ymax)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Square` \
@@ -726,7 +789,28 @@ class Triangle(Geometric2DRegion):
 
 
         """
-        px, py = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Triangle`.
+
+        See Also
+        --------
+        Triangle.contains
+
+        """
+        px, py = self._points_array(points).T
         x1, y1 = self.p1
         x2, y2 = self.p2
         x3, y3 = self.p3
@@ -740,7 +824,7 @@ class Triangle(Geometric2DRegion):
         q3 = ((x2 - x3) * py + (x3 - px) * y2 + (px - x2) * y3) / \
             ((y1 - y2) * x3 + (y2 - y3) * x1 + (y3 - y1) * x2)
 
-        return q1 >= 0 and q2 >= 0 and q3 <= 0
+        return (q1 >= 0) & (q2 >= 0) & (q3 <= 0)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Triangle` \
@@ -854,7 +938,28 @@ class Ellipse(Geometric2DRegion):
            \\left(\\frac{p_y - c_y}{r_y}\\right)^2\\le 1
 
         """
-        px, py = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Ellipse`.
+
+        See Also
+        --------
+        Ellipse.contains
+
+        """
+        px, py = self._points_array(points).T
         cx, cy = self.center
         rx, ry = self.rx, self.ry
 
@@ -956,7 +1061,28 @@ class Circle(Geometric2DRegion):
            (p_x - h)^2 + (p_y - k)^2 \\le r^2
 
         """
-        x, y = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 2` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Circle`.
+
+        See Also
+        --------
+        Circle.contains
+
+        """
+        x, y = self._points_array(points).T
         h, k = self.center
         r = self.r
 
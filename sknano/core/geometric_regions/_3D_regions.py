@@ -288,7 +288,28 @@ class Parallelepiped(Geometric3DRegion):
            u_x (v_y w_z - v_z w_y)}\\le 1
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Parallelepiped`.
+
+        See Also
+        --------
+        Parallelepiped.contains
+
+        """
+        px, py, pz = self._points_array(points).T
 
         ox, oy, oz = self.o
         ux, uy, uz = self.u
@@ -319,8 +340,8 @@ class Parallelepiped(Geometric3DRegion):
              uy * (vz * wx - vx * wz) +
              ux * (vy * wz - vz * wy))
 
-        return q1 >= 0 and q1 <= 1 and q2 >= 0 and q2 <= 1 and \
-            q3 >= 0 and q3 <= 1
+        return (q1 >= 0) & (q1 <= 1) & (q2 >= 0) & (q2 <= 1) & \
+            (q3 >= 0) & (q3 <= 1)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Parallelepiped` \
@@ -591,11 +612,32 @@ class Cuboid(Geometric3DRegion):
            z_{\mathrm{min}}\\le z\\le z_{\\mathrm{max}}
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Cuboid`.
+
+        See Also
+        --------
+        Cuboid.contains
+
+        """
+        px, py, pz = self._points_array(points).T
 
-        return (px >= self.xmin) and (px <= self.xmax) and \
-            (py >= self.ymin) and (py <= self.ymax) and \
-            (pz >= self.zmin) and (pz <= self.zmax)
+        return (px >= self.xmin) & (px <= self.xmax) & \
+            (py >= self.ymin) & (py <= self.ymax) & \
+            (pz >= self.zmin) & (pz <= self.zmax)
 
     def rotate(self, **kwargs):
         super().rotate(**kwargs)
@@ -695,7 +737,28 @@ class Cube(Geometric3DRegion):
            i\\in \\{x, y, z\\}
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Cube`.
+
+        See Also
+        --------
+        Cube.contains
+
+        """
+        px, py, pz = self._points_array(points).T
         cx, cy, cz = self.center
         a = self.a
         xmin = cx - a / 2
@@ -704,9 +767,9 @@ class Cube(Geometric3DRegion):
         ymax = cy + a / 2
         zmin = cz - a / 2
         zmax = cz + a / 2
-        return (px >= xmin) and (px <= xmax) and \
-            (py >= ymin) and (py <= ymax) and \
-            (pz >= zmin) and (pz <= zmax)
+        return (px >= xmin) & (px <= xmax) & \
+            (py >= ymin) & (py <= ymax) & \
+            (pz >= zmin) & (pz <= zmax)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Cube` \
@@ -840,7 +903,28 @@ class Ellipsoid(Geometric3DRegion):
            \\left(\\frac{p_z - c_z}{r_z}\\right)^2\\le 1
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Ellipsoid`.
+
+        See Also
+        --------
+        Ellipsoid.contains
+
+        """
+        px, py, pz = self._points_array(points).T
         cx, cy, cz = self.center
         rx, ry, rz = self.rx, self.ry, self.rz
 
@@ -935,7 +1019,28 @@ class Sphere(Geometric3DRegion):
            (p_x - h)^2 + (p_y - k)^2 + (p_z - l)^2 \\le r^2
 
         """
-        x, y, z = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Sphere`.
+
+        See Also
+        --------
+        Sphere.contains
+
+        """
+        x, y, z = self._points_array(points).T
         h, k, l = self.center
         r = self.r
 
@@ -1102,11 +1207,36 @@ class Cylinder(Geometric3DRegion):
            (y_2 - y_1)^2 + (z_2 - z_1)^2}
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Cylinder`.
+
+        See Also
+        --------
+        Cylinder.contains
+
+        """
+        px, py, pz = self._points_array(points).T
         x1, y1, z1 = self.p1
         x2, y2, z2 = self.p2
         r = self.r
 
+        if (np.allclose(x1, x2) and np.allclose(y1, y2) and
+                np.allclose(z1, z2)) or not r > 0:
+            return np.zeros(len(px), dtype=bool)
+
         q1 = ((px - x1) * (x2 - x1) +
               (py - y1) * (y2 - y1) +
               (pz - z1) * (z2 - z1)) / \
@@ -1116,9 +1246,7 @@ class Cylinder(Geometric3DRegion):
             (y1 - py + (y2 - y1) * q1) ** 2 + \
             (z1 - pz + (z2 - z1) * q1) ** 2
 
-        return (not np.allclose(x1, x2) or not np.allclose(y1, y2) or
-                not np.allclose(z1, z2)) and r > 0 and q1 >= 0 and q1 <= 1 \
-            and q2 <= r ** 2
+        return (q1 >= 0) & (q1 <= 1) & (q2 <= r ** 2)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Cylinder` \
@@ -1283,11 +1411,36 @@ class Cone(Geometric3DRegion):
            (y_2 - y_1)^2 + (z_2 - z_1)^2}
 
         """
-        px, py, pz = Point(point)
+        return bool(self.contains_points([point])[0])
+
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times 3` array of points.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within
+            :class:`Cone`.
+
+        See Also
+        --------
+        Cone.contains
+
+        """
+        px, py, pz = self._points_array(points).T
         x1, y1, z1 = self.p1
         x2, y2, z2 = self.p2
         r = self.r
 
+        if (np.allclose(x1, x2) and np.allclose(y1, y2) and
+                np.allclose(z1, z2)) or not r > 0:
+            return np.zeros(len(px), dtype=bool)
+
         q1 = ((px - x1) * (x2 - x1) +
               (py - y1) * (y2 - y1) +
               (pz - z1) * (z2 - z1)) / \
@@ -1299,9 +1452,7 @@ class Cone(Geometric3DRegion):
 
         q3 = r ** 2 * q1 ** 2
 
-        return (not np.allclose(x1, x2) or not np.allclose(y1, y2) or
-                not np.allclose(z1, z2)) and r > 0 and q1 >= 0 and q1 <= 1 \
-            and q2 <= q3
+        return (q1 >= 0) & (q1 <= 1) & (q2 <= q3)
 
     def todict(self):
         """Returns a :class:`~python:dict` of the :class:`Cone` \
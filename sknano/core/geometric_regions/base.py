@@ -152,6 +152,34 @@ class GeometricRegion(BaseClass, TabulateMixin, metaclass=ABCMeta):
         """Test region membership of `point` in :class:`GeometricRegion`."""
         raise NotImplementedError
 
+    def contains_points(self, points):
+        """Test region membership of each point in `points`.
+
+        Parameters
+        ----------
+        points : array_like
+            :math:`N\\times d` array of points, where :math:`d` is the
+            :attr:`~GeometricRegion.ndim` of the region.
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Boolean array that is `True` for the points within the region.
+
+        """
+        return np.asarray([self.contains(point) for point in points],
+                          dtype=bool)
+
+    def _points_array(self, points):
+        """Return `points` as an :math:`N\\times d` \
+            :class:`~numpy:numpy.ndarray`."""
+        points = np.asarray(points, dtype=float)
+        if points.size == 0:
+            points = points.reshape(0, self.ndim)
+        if points.ndim != 2 or points.shape[1] != self.ndim:
+            raise ValueError(ndim_errmsg.format(self.ndim))
+        return points
+
     @property
     def pmin(self):
         """:class:`Point` at minimum extent."""
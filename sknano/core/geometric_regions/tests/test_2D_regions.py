@@ -143,6 +143,24 @@ class Tests(Geometric2DRegionsTestFixture):
         assert_false(region0.contains([1, 1]))
         assert_is_instance(region0.centroid, Point)
 
+    def test_contains_points(self):
+        points = np.random.RandomState(0).uniform(-1.5, 1.5, size=(500, 2))
+        x, y = points.T
+        r = np.linalg.norm(points, axis=1)
+        for region, expected in \
+                ((self.parallelogram,
+                  (y >= 0) & (y <= 1) & (x - y >= 0) & (x - y <= 1)),
+                 (self.rectangle, (x >= 0) & (x <= 1) & (y >= 0) & (y <= 1)),
+                 (self.square, (np.abs(x) <= 0.5) & (np.abs(y) <= 0.5)),
+                 (self.ellipse, r <= 1),
+                 (self.circle, r <= 1),
+                 (self.triangle, (x >= 0) & (y >= 0) & (x + y <= 1))):
+            mask = region.contains_points(points)
+            assert_equal(mask.dtype, bool)
+            assert_equal(mask.shape, (len(points),))
+            assert_true(mask.any())
+            assert_equal(mask.tolist(), expected.tolist())
+
 
 if __name__ == '__main__':
     nose.runmodule()
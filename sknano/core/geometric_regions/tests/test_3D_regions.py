@@ -163,6 +163,35 @@ class Tests(Geometric3DRegionsTestFixture):
         assert_is_instance(region0.centroid, Point)
         assert_is_instance(region0.axis, Vector)
 
+    def test_contains_points(self):
+        points = np.random.RandomState(0).uniform(-2.5, 2.5, size=(500, 3))
+        parallelepiped = self.parallelepiped
+        parallelepiped.rotate(angle=np.pi / 5, axis='x')
+        parallelepiped.translate(Vector([0.2, -0.3, 0.1]))
+        uvw = np.column_stack((parallelepiped.u, parallelepiped.v,
+                               parallelepiped.w))
+        fcoords = np.linalg.solve(
+            uvw, (points - np.asarray(parallelepiped.o)).T).T
+        x, y, z = points.T
+        r = np.linalg.norm(points, axis=1)
+        rxy = np.hypot(x, y)
+        for region, expected in \
+                ((parallelepiped,
+                  np.all((fcoords >= 0) & (fcoords <= 1), axis=1)),
+                 (self.cuboid,
+                  np.all((points >= 0) & (points <= 1), axis=1)),
+                 (self.cube, np.all(np.abs(points) <= 0.5, axis=1)),
+                 (self.ellipsoid, r <= 1),
+                 (self.sphere, r <= 1),
+                 (self.cylinder, (np.abs(z) <= 1) & (rxy <= 1)),
+                 (self.cone, (z >= 0) & (z <= 2) & (rxy <= z / 2))):
+            mask = region.contains_points(points)
+            assert_equal(mask.dtype, bool)
+            assert_equal(mask.shape, (len(points),))
+            assert_true(mask.any())
+            assert_equal(mask.tolist(), expected.tolist())
+        assert_equal(self.sphere.contains_points([]).shape, (0,))
+
 
 if __name__ == '__main__':
     nose.runmodule()
@@ -284,6 +284,7 @@ class Vector(np.ndarray):
         data = data.view(type(self))
         data._p0 = np.ndarray.view(p0, Point)
         data._p = np.ndarray.view(p, Point)
+        self._update_owner()
 
     def __eq__(self, other):
         try:
@@ -552,6 +553,20 @@ class Vector(np.ndarray):
 
     def _update_p(self):
         self._p[:] = self._p0[:] + self.__array__()
+        self._update_owner()
+
+    def _update_owner(self):
+        """Notify the object owning `self` of an in-place modification.
+
+        An object that stores a `Vector` as an attribute (e.g. the position
+        vector of an :class:`~sknano.core.atoms.XYZAtom`) may set itself as
+        the `Vector` `_owner`, which must then implement an
+        `_update_attrs_version` method.
+
+        """
+        owner = self.__dict__.get('_owner')
+        if owner is not None:
+            owner._update_attrs_version()
 
     def _update_vector(self):
         self[:] = self._p - self._p0
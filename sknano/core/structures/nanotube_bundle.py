@@ -241,6 +241,7 @@ class NanotubeBundleMixin:
     def init_bundle_parameters(self):
         """Initialize bundle attributes."""
         self.bundle_list = []
+        self.bundle_slices = None
         self.generate_bundle_coords()
         fmtstr = super().fmtstr
         match = re.search('(n3|L)=', fmtstr)
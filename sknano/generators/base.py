@@ -132,8 +132,23 @@ class GeneratorMixin:
         """Concrete implementation of :meth:`~GeneratorBase.generate` \
             method."""
         self.structure.clear()
-        for atom in self.crystal_cell:
-            self.atoms.append(Atom(**atom.todict()))
+        basis = self.crystal_cell.basis
+        lattice = basis.lattice
+        if lattice is None:
+            for atom in self.crystal_cell:
+                self.atoms.append(Atom(**atom.todict()))
+        else:
+            coords = basis._get_coords_array()
+            rs = lattice.cartesian_to_fractional(coords)
+            self.atoms.extend(
+                [Atom(element=element, mass=mass, id=id_, mol=mol,
+                      x=x, y=y, z=z, lattice=lattice, xs=xs, ys=ys, zs=zs)
+                 for element, mass, id_, mol, (x, y, z), (xs, ys, zs) in
+                 zip(basis.get_column('element', aslist=True),
+                     basis.get_column('mass', aslist=True),
+                     basis.get_column('id', aslist=True),
+                     basis.get_column('mol', aslist=True),
+                     coords.tolist(), rs.tolist())])
         if finalize:
             self.finalize()
 
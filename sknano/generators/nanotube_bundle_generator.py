@@ -13,9 +13,10 @@ __docformat__ = 'restructuredtext en'
 
 import copy
 
-# import numpy as np
+import numpy as np
 
 from sknano.core import pluralize
+from sknano.core.atoms import StructureAtom as Atom
 # from sknano.core.crystallography import SuperCell
 # from sknano.core.math import Vector
 # from sknano.core import grouper
@@ -32,30 +33,61 @@ class NanotubeBundleGeneratorBase(NanoStructureGenerator):
         if self.is_bundle:
             if self.bundle_geometry is not None:
                 self._generate_bundle_from_bundle_coords()
-
-            atoms = self.atoms
-            for mol in set(atoms.mol_ids):
-                self.bundle_list.append(atoms.filtered(atoms.mols == mol))
+                self.bundle_list = \
+                    [self.atoms[tube] for tube in self.bundle_slices]
+            else:
+                self._update_bundle_list()
 
         if finalize:
             self.finalize()
 
     def _generate_bundle_from_bundle_coords(self):
-        """Generate bundle atoms by replicating structure atoms to \
-            bundle coordinates."""
-        atomsobj0 = copy.deepcopy(self.atoms)
-        # atomsobj0 = copy.deepcopy(self.atoms.filtered(self.atoms.mols == 1))
-        # atomsobj0.center_centroid()
-        # self.lattice_shift = Vector(p0=self.crystal_cell.basis.centroid,
-        #                             p=atomsobj0.centroid)
+        """Generate bundle atoms by translating a single template block of \
+            structure atoms to the bundle coordinates.
+
+        The coordinates of every tube are computed with one broadcasted
+        addition of the :attr:`~NanotubeBundleMixin.bundle_coords` offsets
+        to the template coordinates, and the atoms of each tube occupy the
+        contiguous slice of :attr:`atoms` given by :attr:`bundle_slices`.
+
+        """
+        atoms = self.atoms
+        Natoms = atoms.Natoms
+        offsets = np.asarray(self.bundle_coords, dtype=float).reshape(-1, 3)
+        coords = atoms._get_coords_array()[np.newaxis, :, :] + \
+            offsets[:, np.newaxis, :]
+        elements = atoms.get_column('element', aslist=True)
+        masses = atoms.get_column('mass', aslist=True)
+        ids = np.asarray(atoms.get_column('id'), dtype=int)
+        lattice = atoms.lattice
 
         self.structure.clear()
-        for mol, dr in enumerate(self.bundle_coords, start=1):
-            atomsobj = copy.deepcopy(atomsobj0)
-            atomsobj.translate(dr)
-            [setattr(atom, 'mol', mol) for atom in atomsobj]
-            self.atoms.extend(atomsobj)
-            self.bundle_list.append(atomsobj)
+        for i, (dr, tube_coords) in enumerate(zip(offsets, coords)):
+            tube_lattice = None
+            if lattice is not None:
+                tube_lattice = copy.deepcopy(lattice)
+                tube_lattice.translate(dr)
+            self.atoms.extend(
+                [Atom(element=element, mass=mass, id=id_, mol=i + 1,
+                      lattice=tube_lattice, x=x, y=y, z=z)
+                 for element, mass, id_, (x, y, z) in
+                 zip(elements, masses, (ids + i * Natoms).tolist(),
+                     tube_coords.tolist())])
+        self.bundle_slices = [slice(i * Natoms, (i + 1) * Natoms)
+                              for i in range(len(offsets))]
+
+    def _update_bundle_list(self):
+        """Update :attr:`~NanotubeBundleMixin.bundle_list` with the atoms \
+            of each molecule id."""
+        atoms = self.atoms
+        mols = np.asarray(atoms.get_column('mol'))
+        order = np.argsort(mols, kind='mergesort')
+        bounds = np.flatnonzero(np.diff(mols[order])) + 1
+        data = atoms.data
+        self.bundle_slices = None
+        self.bundle_list = \
+            [atoms.__class__([data[i] for i in indices], **atoms.kwargs)
+             for indices in np.split(order, bounds) if len(indices)]
 
     @classmethod
     def generate_fname(cls, n1=None, n2=None, n3=None, L=None, fix_L=False,
@@ -154,5 +154,27 @@ class Tests(GeneratorTestFixture):
         bundle.save(structure_format='data')
         self.tmpdata.append(bundle.fname)
 
+    def test15(self):
+        bundle = SWNTGenerator(n=5, m=5, n1=3, n2=3, n3=1,
+                               bundle_geometry='hexagon')
+        atoms = bundle.atoms
+        assert_equal(len(bundle.bundle_list), bundle.Ntubes)
+        assert_equal(len(bundle.bundle_slices), bundle.Ntubes)
+        assert_equal(atoms.ids.tolist(), list(range(1, atoms.Natoms + 1)))
+        coords = np.asarray(atoms.coords)
+        tube0 = coords[bundle.bundle_slices[0]]
+        for mol, (tube, dr) in \
+                enumerate(zip(bundle.bundle_slices, bundle.bundle_coords),
+                          start=1):
+            assert_true(np.all(atoms.mols[tube] == mol))
+            assert_true(np.allclose(coords[tube], tube0 + np.asarray(dr)))
+            assert_equal(bundle.bundle_list[mol - 1].Natoms,
+                         tube0.shape[0])
+
+    def test16(self):
+        atoms = SWNTGenerator(n=5, m=5).atoms
+        assert_true(np.allclose([atom.r0 for atom in atoms],
+                                [atom.r for atom in atoms]))
+
 if __name__ == '__main__':
     nose.runmodule()
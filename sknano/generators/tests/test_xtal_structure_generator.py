@@ -9,7 +9,7 @@ import warnings
 warnings.simplefilter('always')
 
 import nose
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true
 
 import numpy as np
 
@@ -120,6 +120,11 @@ class Tests(GeneratorTestFixture):
         # for atom in structure.basis:
         #     print(atom.r)
 
+    def test16(self):
+        atoms = AlphaQuartzGenerator().atoms
+        assert_true(np.allclose([atom.r0 for atom in atoms],
+                                [atom.r for atom in atoms]))
+
 
 if __name__ == '__main__':
     nose.runmodule()
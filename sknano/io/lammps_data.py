@@ -12,7 +12,9 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
 from collections import OrderedDict
+from string import Formatter
 import os
+import re
 
 import numpy as np
 
@@ -52,6 +54,11 @@ class DATAReader(StructureData):
     Attributes
     ----------
     domain : :class:`sknano.core.crystallography.Domain`
+    section_arrays : :class:`~python:collections.OrderedDict`
+        :class:`~python:collections.OrderedDict` mapping each section
+        to an :class:`~python:collections.OrderedDict` of typed
+        :class:`~numpy:numpy.ndarray` columns keyed by the
+        :attr:`DATAFormatter.section_attrs` of the section.
 
     """
     def __init__(self, fpath, atom_style='full', bond_style=None,
@@ -70,6 +77,7 @@ class DATAReader(StructureData):
 
         self.header_data = OrderedDict()
         self.section_data = OrderedDict()
+        self.section_arrays = OrderedDict()
         self.domain = Domain()
         self.section_attrs = self.formatter.section_attrs
         self.section_attrs_specs = self.formatter.section_attrs_specs
@@ -135,22 +143,11 @@ class DATAReader(StructureData):
                         if section in line:
                             found = True
                             f.readline()
-                            n = 0
-                            data = []
-                            while n < self.header_data[header]:
-                                tmp = []
-                                line = f.readline().strip().split()
-                                for i, attrs in enumerate(
-                                    self.section_attrs_specs[
-                                        section].values()):
-                                    try:
-                                        tmp.append(
-                                            attrs['dtype'](float(line[i])))
-                                    except IndexError:
-                                        break
-                                data.append(tmp)
-                                n += 1
-                            self.section_data[section] = data[:]
+                            lines = [f.readline() for _ in
+                                     range(self.header_data[header])]
+                            self.section_data[section], \
+                                self.section_arrays[section] = \
+                                self.formatter.parse_section(lines, section)
                     f.readline()
                     line = f.readline().strip()
                     if len(line) == 0:
@@ -170,61 +167,54 @@ class DATAReader(StructureData):
 
     def _parse_atoms(self):
         """Populate `Atoms` object with `Atom` objects"""
+        atom_attrs = set(dir(Atom()))
+        section_arrays = self.section_arrays
         try:
-            atoms_section = self.section_data['Atoms']
-            atoms_section_attrs = self.section_attrs['Atoms']
+            atoms_columns = section_arrays['Atoms']
+            Natoms = len(self.section_data['Atoms'])
         except KeyError:
-            atoms_section = []
-            atoms_section_attrs = []
-
-        try:
-            masses_section = self.section_data['Masses']
-            masses_section_attrs = self.section_attrs['Masses']
-        except KeyError:
-            masses_section = []
-            masses_section_attrs = []
-
-        try:
-            velocities_section = self.section_data['Velocities']
-            velocities_section_attrs = self.section_attrs['Velocities']
-        except KeyError:
-            velocities_section = []
-            velocities_section_attrs = []
-
-        for line in atoms_section:
-            atom_kwargs = {}
-
-            for kw in dir(Atom()):
-                if kw in atoms_section_attrs:
-                    try:
-                        atom_kwargs[kw] = \
-                            line[
-                                self.section_attrs_specs['Atoms'][kw]['index']]
-                    except IndexError:
-                        pass
-                elif kw in masses_section_attrs:
-                    type = \
-                        line[self.section_attrs_specs[
-                            'Atoms']['type']['index']]
-                    atom_kwargs[kw] = \
-                        masses_section[type - 1][
-                            self.section_attrs_specs['Masses'][kw]['index']]
-                elif kw in velocities_section_attrs and \
-                        len(velocities_section) == len(atoms_section):
-                    id = line[self.section_attrs_specs['Atoms']['id']['index']]
-                    for velocity in velocities_section:
-                        atom_id = \
-                            velocity[self.section_attrs_specs[
-                                'Velocities']['id']['index']]
-                        if atom_id == id:
-                            atom_kwargs[kw] = \
-                                velocity[self.section_attrs_specs[
-                                    'Velocities'][kw]['index']]
-                # else:
-                #     print('unknown atom keyword: {}'.format(kw))
-
-            atom = Atom(**atom_kwargs)
-            self.atoms.append(atom)
+            atoms_columns = OrderedDict()
+            Natoms = 0
+
+        columns = OrderedDict((attr, column.tolist()) for attr, column in
+                              atoms_columns.items() if attr in atom_attrs)
+
+        masses_columns = section_arrays.get('Masses', {})
+        if 'mass' in masses_columns and 'mass' not in columns and \
+                'type' in atoms_columns:
+            columns['mass'] = \
+                masses_columns['mass'][atoms_columns['type'] - 1].tolist()
+
+        # Join the velocities to the atoms by atom id in one batch. Atoms
+        # without velocities are flagged with `None` values.
+        velocities_columns = section_arrays.get('Velocities', {})
+        missing = False
+        if 'id' in velocities_columns and 'id' in atoms_columns and \
+                len(self.section_data['Velocities']) == Natoms:
+            order = np.argsort(velocities_columns['id'], kind='mergesort')
+            ids = velocities_columns['id'][order]
+            positions = np.searchsorted(ids, atoms_columns['id'],
+                                        side='right') - 1
+            found = positions >= 0
+            found[found] = ids[positions[found]] == \
+                atoms_columns['id'][found]
+            missing = not np.all(found)
+            rows = order[positions]
+            for attr, column in velocities_columns.items():
+                if attr in atom_attrs and attr not in columns:
+                    column = column[rows].tolist()
+                    if missing:
+                        column = [value if isfound else None for
+                                  value, isfound in zip(column, found)]
+                    columns[attr] = column
+
+        attrs = list(columns.keys())
+        for values in zip(*columns.values()):
+            atom_kwargs = dict(zip(attrs, values))
+            if missing:
+                atom_kwargs = {attr: value for attr, value in
+                               atom_kwargs.items() if value is not None}
+            self.atoms.append(Atom(**atom_kwargs))
 
     def _parse_atom_types(self):
         Ntypes = self.atoms.Ntypes
@@ -295,14 +285,10 @@ class DATAReader(StructureData):
             typemap = OrderedDict(sorted(atoms.typemap.items()))
             sections['Masses'] = [[type, attrmap['mass']] for type, attrmap in
                                   typemap.items()]
-            atoms_section_attrs = self.section_attrs['Atoms']
-            sections['Atoms'] = \
-                [[getattr(atom, attr) for attr in atoms_section_attrs]
-                 for atom in atoms]
-            velocities_section_attrs = self.section_attrs['Velocities']
-            sections['Velocities'] = \
-                [[getattr(atom, attr) for attr in velocities_section_attrs]
-                 for atom in atoms]
+            for section in ('Atoms', 'Velocities'):
+                columns = [atoms.get_column(attr, aslist=True)
+                           for attr in self.section_attrs[section]]
+                sections[section] = [list(row) for row in zip(*columns)]
         self.section_data = sections
 
     def get(self, section, colnum=None, colname=None, colindex=None):
@@ -693,27 +679,19 @@ class DATAData(DATAReader):
                          '{:d}'.format(type).ljust(type_width), mass))
 
     def _write_atoms(self, stream):
-        section_attrs_specs_items = self.section_attrs_specs['Atoms'].items()
         stream.write('\nAtoms # {}\n\n'.format(self.formatter.atom_style))
-        for atom in self.atoms:
-            line = ''
-            for attr, specs in section_attrs_specs_items:
-                line += "{:>{}}".format(specs['fmtstr'].format(
-                                        getattr(atom, attr)), specs['width'])
-            line += '\n'
-            stream.write(line)
+        self._write_section_atoms(stream, 'Atoms')
 
     def _write_velocities(self, stream):
-        section_attrs_specs_items = \
-            self.section_attrs_specs['Velocities'].items()
         stream.write('\nVelocities\n\n')
-        for atom in self.atoms:
-            line = ''
-            for attr, specs in section_attrs_specs_items:
-                line += "{:>{}}".format(specs['fmtstr'].format(
-                                        getattr(atom, attr)), specs['width'])
-            line += '\n'
-            stream.write(line)
+        self._write_section_atoms(stream, 'Velocities')
+
+    def _write_section_atoms(self, stream, section):
+        """Write the `section` lines of all atoms in one call."""
+        atoms = self.atoms
+        columns = [atoms.get_column(attr, aslist=True)
+                   for attr in self.section_attrs[section]]
+        stream.write(self.formatter.format_section(section, zip(*columns)))
 
     def _write_force_fields(self, stream):
         pass
@@ -806,6 +784,26 @@ class DATAError(StructureDataError):
 LAMMPSDATAIOError = DATAIOError = DATAError
 
 
+_UNALIGNED_FORMAT_SPEC = re.compile(r'[-+ ]?#?[,_]?(\.\d+)?[a-zA-Z%]?$')
+
+
+def _aligned_field(fmtstr, width):
+    """Return a replacement field formatting a value like `fmtstr` \
+        right-aligned to `width`, or `None` if `fmtstr` is not a single \
+        replacement field without alignment or width."""
+    try:
+        fields = list(Formatter().parse(fmtstr))
+    except ValueError:
+        return None
+    if len(fields) != 1:
+        return None
+    literal, name, spec, conversion = fields[0]
+    if literal or name not in ('', '0') or conversion is not None or \
+            not _UNALIGNED_FORMAT_SPEC.match(spec):
+        return None
+    return '{{:>{}{}}}'.format(width, spec)
+
+
 class DATAFormatter(StructureDataFormatter):
     """`StructureDataFormatter` class the `LAMMPS data` format spec.
 
@@ -972,6 +970,63 @@ class DATAFormatter(StructureDataFormatter):
             raise ValueError(error_msg)
         self._pair_style = value
 
+    def parse_section(self, lines, section):
+        """Parse the `lines` of data file `section`.
+
+        The lines are parsed in one call to
+        :func:`~numpy:numpy.fromstring` if each line has the same number
+        of values, otherwise they are parsed line by line. Comments are
+        ignored, and values beyond the
+        :attr:`~DATAFormatter.section_attrs` of the section are dropped.
+
+        Parameters
+        ----------
+        lines : :class:`~python:list`
+        section : :class:`~python:str`
+
+        Returns
+        -------
+        rows : :class:`~python:list`
+            :class:`~python:list` of :class:`~python:list`\ s of the
+            section values of each line converted to their
+            :attr:`~DATAFormatter.section_attrs_specs` `dtype`.
+        columns : :class:`~python:collections.OrderedDict`
+            :class:`~python:collections.OrderedDict` mapping the section
+            attributes with values on every line to typed
+            :class:`~numpy:numpy.ndarray` columns.
+
+        """
+        specs = self.section_attrs_specs[section]
+        attrs = list(specs.keys())
+        Nattrs = len(attrs)
+        Nlines = len(lines)
+        columns = OrderedDict()
+        if Nattrs == 0 or Nlines == 0:
+            return [[] for line in lines], columns
+
+        text = ''.join(lines)
+        if '#' in text:
+            lines = [line.partition('#')[0] for line in lines]
+            text = '\n'.join(lines)
+        values = np.fromstring(text, dtype=float, sep=' ')
+        Ncols = values.size // Nlines
+        if values.size == Nlines * Ncols and Ncols > 0 and \
+                all(len(line.split()) == Ncols for line in lines):
+            values = values.reshape((Nlines, Ncols))
+            for i, attr in enumerate(attrs[:Ncols]):
+                columns[attr] = values[:, i].astype(specs[attr]['dtype'])
+            rows = [list(row) for row in
+                    zip(*[column.tolist() for column in columns.values()])]
+            return rows, columns
+
+        rows = [[spec['dtype'](float(value)) for spec, value in
+                 zip(specs.values(), line.split())] for line in lines]
+        Ncols = min(len(row) for row in rows)
+        for i, attr in enumerate(attrs[:Ncols]):
+            columns[attr] = np.array([row[i] for row in rows],
+                                     dtype=specs[attr]['dtype'])
+        return rows, columns
+
     def format(self):
         """Return :class:`~python:str` of dump attributes formatted for an \
             output stream.
@@ -979,6 +1034,34 @@ class DATAFormatter(StructureDataFormatter):
         """
         raise NotImplementedError
 
+    def format_section(self, section, rows):
+        """Return :class:`~python:str` of the lines of `section` rows \
+            formatted for an output stream.
+
+        Each value is formatted with the `fmtstr` of its
+        :attr:`~DATAFormatter.section_attrs_specs` and right-aligned to
+        the `width` of the spec. When every `fmtstr` is a single
+        replacement field without alignment or width, the specs are
+        merged into one format string per line.
+
+        Parameters
+        ----------
+        section : :class:`~python:str`
+        rows : iterable
+            Iterable of sequences of the section values of each line.
+
+        """
+        section_specs = list(self.section_attrs_specs[section].values())
+        fields = [_aligned_field(specs['fmtstr'], specs['width'])
+                  for specs in section_specs]
+        if None in fields:
+            return ''.join([''.join(['{:>{}}'.format(
+                specs['fmtstr'].format(value), specs['width'])
+                for specs, value in zip(section_specs, row)]) + '\n'
+                for row in rows])
+        fmtstr = ''.join(fields) + '\n'
+        return ''.join([fmtstr.format(*row) for row in rows])
+
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         attr_dict = super().todict()
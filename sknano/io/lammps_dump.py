@@ -11,9 +11,16 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from glob import glob
+from itertools import islice
 from operator import attrgetter
 # import re
+import io
+import json
+import os
 import sys
 
 import numpy as np
@@ -30,7 +37,222 @@ from .base import StructureData, StructureDataError, StructureDataFormatter
 
 __all__ = ['DUMP', 'DUMPData', 'DUMPReader', 'DUMPWriter', 'DUMPError',
            'DUMPFormatter', 'DUMPIO', 'DUMPIOReader', 'DUMPIOWriter',
-           'DUMPIOError', 'DUMPIOFormatter']
+           'DUMPIOError', 'DUMPIOFormatter', 'index_dumpfile']
+
+_CACHE_HEADER = 'header.json'
+_COMPRESSED_EXTS = ('.BZ2', '.GZ', '.Z', '.XZ', '.LZMA')
+
+
+def _index_fpath(dumpfile):
+    """Return the path of the snapshot index file of `dumpfile`."""
+    dirname, basename = os.path.split(dumpfile)
+    return os.path.join(dirname, '.{}.idx'.format(basename))
+
+
+def _scan_dumpfile(f, offset=0, chunksize=2 ** 24):
+    """Scan binary file object `f` for snapshots, starting at byte \
+        `offset`.
+
+    Returns
+    -------
+    offsets, timesteps : :class:`~python:list`
+        Byte offsets of the ``ITEM: TIMESTEP`` lines and the timesteps
+        of the snapshots.
+
+    """
+    item = b'ITEM: TIMESTEP'
+    offsets = []
+    timesteps = []
+    f.seek(offset)
+    buf = b''
+    while True:
+        chunk = f.read(chunksize)
+        buf += chunk
+        start = 0
+        pending = None
+        while True:
+            i = buf.find(item, start)
+            if i < 0:
+                break
+            j = buf.find(b'\n', i)
+            k = buf.find(b'\n', j + 1) if j >= 0 else -1
+            if k < 0:
+                if chunk:
+                    # the timestep line continues in the next chunk
+                    pending = i
+                elif j >= 0 and buf[j + 1:].strip():
+                    offsets.append(offset + i)
+                    timesteps.append(int(buf[j + 1:].split()[0]))
+                break
+            offsets.append(offset + i)
+            timesteps.append(int(buf[j + 1:k].split()[0]))
+            start = k + 1
+        if not chunk:
+            break
+        if pending is None:
+            pending = max(start, len(buf) - len(item) + 1)
+        offset += pending
+        buf = buf[pending:]
+    return offsets, timesteps
+
+
+def index_dumpfile(dumpfile, update=False):
+    """Return the byte offsets and timesteps of the snapshots in \
+        `dumpfile`.
+
+    The dump file is scanned once for the ``ITEM: TIMESTEP`` lines and the
+    index is saved to a hidden ``.<dumpfile>.idx`` file next to the dump
+    file, which is reused as long as the size and modification time of the
+    dump file are unchanged. Offsets into compressed dump files are offsets
+    into the decompressed data.
+
+    Parameters
+    ----------
+    dumpfile : :class:`~python:str`
+    update : :class:`~python:bool`, optional
+        If `True`, rescan the dump file even if an index file exists.
+
+    Returns
+    -------
+    offsets, timesteps : :class:`~numpy:numpy.ndarray`
+
+    """
+    fpath = _index_fpath(dumpfile)
+    stat = os.stat(dumpfile)
+    key = [stat.st_size, stat.st_mtime_ns]
+    if not update:
+        try:
+            with open(fpath) as f:
+                header = f.readline().split()[1:]
+                if [int(value) for value in header] == key:
+                    index = np.loadtxt(f, dtype=int, ndmin=2)
+                    return index[:, 0], index[:, 1]
+        except (OSError, ValueError, IndexError):
+            pass
+
+    with zopen(dumpfile, 'rb') as f:
+        offsets, timesteps = _scan_dumpfile(f)
+    offsets = np.asarray(offsets, dtype=int)
+    timesteps = np.asarray(timesteps, dtype=int)
+
+    if len(offsets) > 0:
+        try:
+            np.savetxt(fpath, np.column_stack((offsets, timesteps)),
+                       fmt='%d', header=' '.join(map(str, key)))
+        except OSError:
+            pass
+    return offsets, timesteps
+
+
+def _dumpfile_stamps(dumpfiles):
+    """Return :class:`~python:list` of the absolute path, size and \
+        modification time of each dump file in `dumpfiles`."""
+    stamps = []
+    for dumpfile in dumpfiles:
+        stat = os.stat(dumpfile)
+        stamps.append([os.path.abspath(dumpfile), stat.st_size,
+                       stat.st_mtime_ns])
+    return stamps
+
+
+def _has_row_width(text, nrows, ncols):
+    """Return `True` if `text` has `nrows` lines of `ncols` \
+        whitespace-separated values each.
+
+    The values are counted with vectorized byte comparisons rather than
+    by splitting each line.
+
+    """
+    b = np.frombuffer(text.encode(), dtype=np.uint8)
+    if b.size == 0:
+        return nrows == 0
+    ws = b <= 32
+    starts = np.flatnonzero(ws[:-1] & ~ws[1:]) + 1
+    ends = np.flatnonzero(b == 10)
+    if ends.size != nrows:
+        return False
+    counts = np.searchsorted(starts, ends)
+    if not ws[0]:
+        counts += 1
+    return np.array_equal(counts, np.arange(1, nrows + 1) * ncols)
+
+
+def _snapshot_header(snapshot):
+    """Return :class:`~python:dict` of the header data of `snapshot`."""
+    domain = snapshot.domain
+    return dict(timestep=snapshot.timestep, Natoms=snapshot.Natoms,
+                boxstr=snapshot.boxstr, triclinic=domain.triclinic,
+                bounds=[domain.xlo, domain.xhi, domain.ylo, domain.yhi,
+                        domain.zlo, domain.zhi],
+                tilts=[domain.xy, domain.xz, domain.yz])
+
+
+def _set_snapshot_header(snapshot, header):
+    """Set the header data of `snapshot` from the `header` \
+        :class:`~python:dict` returned by :func:`_snapshot_header`."""
+    snapshot.timestep = header['timestep']
+    Natoms = snapshot.Natoms = header['Natoms']
+    snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+    snapshot.boxstr = header['boxstr']
+    domain = snapshot.domain = Domain()
+    domain.triclinic = header['triclinic']
+    domain.xlo, domain.xhi, domain.ylo, domain.yhi, domain.zlo, domain.zhi = \
+        header['bounds']
+    domain.xy, domain.xz, domain.yz = header['tilts']
+
+
+def _read_dumpfile(formatter, dumpfile, offsets=None):
+    """Read the snapshots of `dumpfile` in a worker process of \
+        :meth:`DUMPReader.read`.
+
+    Parameters
+    ----------
+    formatter : :class:`DUMPFormatter`
+    dumpfile : :class:`~python:str`
+    offsets : array_like, optional
+        Byte offsets of the snapshots to read. If `None`, all snapshots
+        of `dumpfile` are read.
+
+    Returns
+    -------
+    snapshots : :class:`~python:list`
+        :class:`~python:list` of (header, atoms array) tuples, where
+        the header is the :class:`~python:dict` returned by
+        :func:`_snapshot_header`.
+    dumpattrs2index : :class:`~python:dict`
+    scale_original : {`None`, :class:`~python:bool`}
+    error : {`None`, :class:`~python:str`}
+        The :class:`DUMPError` message if `dumpfile` is invalid.
+
+    """
+    reader = DUMPReader(autoread=False, formatter=formatter)
+    snapshots = []
+    error = None
+    try:
+        if offsets is None:
+            with zopen(dumpfile, 'rt') as f:
+                snapshot = reader.read_snapshot(f)
+                while snapshot is not None:
+                    snapshots.append((_snapshot_header(snapshot),
+                                      snapshot.get_atoms(asarray=True)))
+                    snapshot = reader.read_snapshot(f)
+        else:
+            with zopen(dumpfile, 'rb') as fb:
+                for offset in offsets:
+                    fb.seek(offset)
+                    f = io.TextIOWrapper(fb)
+                    try:
+                        snapshot = reader.read_snapshot(f)
+                    finally:
+                        f.detach()
+                    if snapshot is None:
+                        break
+                    snapshots.append((_snapshot_header(snapshot),
+                                      snapshot.get_atoms(asarray=True)))
+    except DUMPError as e:
+        error = str(e)
+    return snapshots, formatter.dumpattrs2index, \
+        getattr(reader, 'scale_original', None), error
 
 
 class DUMPReader(StructureData):
@@ -66,6 +288,24 @@ class DUMPReader(StructureData):
 
         .. versionadded:: 0.4.0
 
+    lazy : :class:`~python:bool`, optional
+        If `True`, only the snapshot headers are read using the snapshot
+        index of each dump file (see :func:`index_dumpfile`), and the
+        snapshot atoms are read on demand. Default is `False`.
+    cache : :class:`~python:str`, optional
+        Path to a trajectory cache directory. If the cache was written
+        from the current versions of the dump files, the trajectory is
+        read from the cache (see :meth:`~DUMPReader.read_cache`),
+        otherwise the dump files are read and the cache is written (see
+        :meth:`~DUMPReader.write_cache`). If no dump files are given,
+        the trajectory is read from the cache unconditionally.
+    num_procs : :class:`~python:int`, optional
+        Number of worker processes for reading the dump files. If
+        greater than 1, the dump files are read in parallel, and the
+        snapshots of uncompressed dump files are split into ranges of
+        snapshots read in parallel when there are fewer dump files than
+        worker processes. Ignored if `lazy` is `True`. Default is 1.
+
     dumpattrmap : class:`~python:dict`
         Python :class:`~python:dict` mapping custom dump attributes
         to :class:`~sknano.core.atoms.Atom` attributes.
@@ -139,7 +379,8 @@ class DUMPReader(StructureData):
     """
     @deprecate_kwarg(kwarg='attrmap', since='0.4.0', alternative='dumpattrmap')
     def __init__(self, *args, autoread=True, reference_timestep=None,
-                 reference_index=None, formatter=None, style=None,
+                 reference_index=None, lazy=False, cache=None, num_procs=1,
+                 formatter=None, style=None,
                  dumpattrs=None, dumpattrmap=None, atomattrmap=None,
                  **kwargs):
 
@@ -156,6 +397,12 @@ class DUMPReader(StructureData):
                                         for arg in args]))
         self._reference_timestep = reference_timestep
         self._reference_index = reference_index
+        self.lazy = lazy
+        self.cache = cache
+        self.num_procs = num_procs
+        self._follow_offsets = {}
+        self._transforms = []
+        self._open_dumpfile = None
 
         if formatter is None or not isinstance(formatter, DUMPFormatter):
             formatter = DUMPFormatter(style=style,
@@ -167,9 +414,10 @@ class DUMPReader(StructureData):
 
         self.fmtstr = "{dumpfiles!r}, autoread=True, " + \
             "reference_timestep={reference_timestep!r}, " + \
-            "reference_index={reference_index!r}, " + formatter.fmtstr
+            "reference_index={reference_index!r}, lazy={lazy!r}, " + \
+            "cache={cache!r}, num_procs={num_procs!r}, " + formatter.fmtstr
 
-        if autoread and len(self.dumpfiles) > 0:
+        if autoread and (len(self.dumpfiles) > 0 or cache is not None):
             self.read()
 
     def __getattr__(self, name):
@@ -240,20 +488,39 @@ class DUMPReader(StructureData):
     def read(self):
         """Read all snapshots from each dump file."""
         trajectory = self.trajectory
-        for dumpfile in self.dumpfiles:
-            with zopen(dumpfile) as f:
+        cache = self.cache
+        if cache is not None:
+            try:
+                self.read_cache(cache, check=len(self.dumpfiles) > 0)
+                return
+            except DUMPError as e:
+                print(e)
+
+        if self.lazy:
+            self._transforms = []
+            for dumpfile in self.dumpfiles:
                 try:
-                    snapshot = self.read_snapshot(f)
-                    while snapshot is not None:
-                        trajectory.append(snapshot)
-                        print(snapshot.timestep, end=' ')
-                        sys.stdout.flush()
-                        snapshot = self.read_snapshot(f)
+                    self.read_snapshot_headers(dumpfile)
                 except DUMPError as e:
                     print(e)
                     continue
+        elif self.num_procs > 1:
+            self._read_dumpfiles_parallel()
+        else:
+            for dumpfile in self.dumpfiles:
+                with zopen(dumpfile, 'rt') as f:
+                    try:
+                        snapshot = self.read_snapshot(f)
+                        while snapshot is not None:
+                            trajectory.append(snapshot)
+                            print(snapshot.timestep, end=' ')
+                            sys.stdout.flush()
+                            snapshot = self.read_snapshot(f)
+                    except DUMPError as e:
+                        print(e)
+                        continue
 
-        print()
+            print()
 
         trajectory.sort(key=attrgetter('timestep'))
         trajectory.cull()
@@ -261,115 +528,398 @@ class DUMPReader(StructureData):
         print("read {:d} snapshots".format(self.Nsnaps))
 
         if len(trajectory) > 0:
-            trajectory.time_selection.all()
-            self._update_reference_snapshot()
+            self._setup_trajectory()
+            if cache is not None:
+                self.write_cache(cache)
+
+    def _setup_trajectory(self):
+        """Select all snapshots, set the reference snapshot and unscale \
+            the snapshots of a newly read trajectory."""
+        self.trajectory.time_selection.all()
+        self._update_reference_snapshot()
 
-            fmt = self.formatter
-            dumpattrs = fmt.dumpattrs
+        fmt = self.formatter
+        dumpattrs = fmt.dumpattrs
 
-            if dumpattrs:
-                print('Dumped Atom attributes: {}'.format(fmt.dumpattrs2str()))
+        if dumpattrs:
+            print('Dumped Atom attributes: {}'.format(fmt.dumpattrs2str()))
+        else:
+            print('No dump column assignments')
+
+        if 'x' not in dumpattrs or 'y' not in dumpattrs or \
+                'z' not in dumpattrs:
+            print('dump scaling status unknown')
+        elif self.Nsnaps > 0:
+            if self.scale_original:
+                self.unscale()
+            elif self.scale_original is None:
+                print('dump scaling status unknown')
             else:
-                print('No dump column assignments')
+                print('dump is already unscaled')
+
+    def follow(self):
+        """Read the snapshots appended to the dump files since they were \
+            last read.
+
+        The byte offset of the end of the last complete snapshot read
+        from each dump file is remembered, so that each call only parses
+        the snapshots completed since the previous call. On the first
+        call, reading resumes after the last snapshot of each dump file
+        in the :func:`index_dumpfile` index whose timestep is already in
+        the :attr:`~DUMPReader.trajectory`, or at the last snapshot in the
+        index if there is none. A snapshot at the end of a dump file that
+        is still being written is left for the next call.
+
+        The new snapshots are transformed like the snapshots already in
+        the :attr:`~DUMPReader.trajectory` (see
+        :meth:`~DUMPReader.unscale`), selected, and given the current
+        atom selection of the trajectory. Snapshots with timesteps already
+        in the trajectory are skipped, as by
+        :meth:`~sknano.core.atoms.Trajectory.cull`.
+
+        Returns
+        -------
+        :class:`~python:list`
+            :class:`~python:list` of the new
+            :class:`~sknano.core.atoms.Snapshot`\ s.
 
-            if 'x' not in dumpattrs or 'y' not in dumpattrs or \
-                    'z' not in dumpattrs:
-                print('dump scaling status unknown')
-            elif self.Nsnaps > 0:
-                if self.scale_original:
-                    self.unscale()
-                elif self.scale_original is None:
-                    print('dump scaling status unknown')
+        """
+        trajectory = self.trajectory
+        initialized = len(trajectory) > 0
+        timesteps = [ss.timestep for ss in trajectory.data]
+        snapshots = []
+        for dumpfile in self.dumpfiles:
+            offset = self._follow_offsets.get(dumpfile)
+            if offset is None:
+                offsets, file_timesteps = index_dumpfile(dumpfile)
+                read = np.flatnonzero(np.in1d(file_timesteps, timesteps))
+                if len(read) > 0:
+                    offset = int(offsets[min(read[-1] + 1,
+                                             len(offsets) - 1)])
                 else:
-                    print('dump is already unscaled')
+                    offset = int(offsets[-1]) if len(offsets) > 0 else 0
+
+            with zopen(dumpfile, 'rb') as fb:
+                starts, _ = _scan_dumpfile(fb, offset)
+                for start, stop in zip(starts, starts[1:] + [None]):
+                    fb.seek(start)
+                    if stop is None:
+                        data = fb.read()
+                        if not data.endswith(b'\n'):
+                            break
+                    else:
+                        data = fb.read(stop - start)
+                    f = io.StringIO(data.decode())
+                    f.name = dumpfile
+                    try:
+                        snapshot = self.read_snapshot(f)
+                    except DUMPError:
+                        snapshot = None
+                    if snapshot is None:
+                        if stop is None:
+                            # incomplete snapshot at the end of the file
+                            break
+                        print('Invalid snapshot at byte {} of {}'.format(
+                              start, dumpfile))
+                    else:
+                        snapshots.append(snapshot)
+                    offset = start + len(data)
+            self._follow_offsets[dumpfile] = offset
+
+        new_snapshots = []
+        for snapshot in snapshots:
+            i = bisect_left(timesteps, snapshot.timestep)
+            if i < len(timesteps) and timesteps[i] == snapshot.timestep:
+                continue
+            timesteps.insert(i, snapshot.timestep)
+            if initialized:
+                atoms_array = snapshot.get_atoms(asarray=True)
+                for transform in self._transforms:
+                    getattr(self, transform)(snapshot, atoms_array)
+                snapshot.selected = True
+                trajectory.atom_selection.apply(snapshot)
+            trajectory.insert(i, snapshot)
+            new_snapshots.append(snapshot)
+
+        if new_snapshots and not initialized:
+            self._setup_trajectory()
+        return new_snapshots
+
+    def _read_dumpfiles_parallel(self):
+        """Read the dump files in a pool of \
+            :attr:`~DUMPReader.num_procs` worker processes.
+
+        The snapshots are appended to the :attr:`~DUMPReader.trajectory`
+        in the order of the dump files and of the snapshots in each dump
+        file, as if the dump files were read one after another.
 
-    def read_snapshot(self, f):
-        """Read snapshot from file."""
+        """
+        num_procs = self.num_procs
+        dumpfiles = self.dumpfiles
+        tasks = []
+        for dumpfile in dumpfiles:
+            if len(dumpfiles) >= num_procs or \
+                    dumpfile.upper().endswith(_COMPRESSED_EXTS):
+                tasks.append((dumpfile, None))
+            else:
+                offsets, _ = index_dumpfile(dumpfile)
+                tasks.extend((dumpfile, chunk) for chunk in
+                             np.array_split(offsets, num_procs)
+                             if len(chunk) > 0)
+
+        formatter = self.formatter
+        trajectory = self.trajectory
+        with ProcessPoolExecutor(max_workers=num_procs) as executor:
+            futures = [executor.submit(_read_dumpfile, formatter, dumpfile,
+                                       offsets)
+                       for dumpfile, offsets in tasks]
+            for future in futures:
+                snapshots, dumpattrs2index, scale_original, error = \
+                    future.result()
+                if error is not None:
+                    print(error)
+                if not snapshots:
+                    continue
+                if formatter.dumpattrs is None:
+                    formatter.dumpattrs2index.update(dumpattrs2index)
+                    formatter._update_attrs()
+                    self.scale_original = scale_original
+                for header, atoms_array in snapshots:
+                    snapshot = Snapshot(trajectory)
+                    _set_snapshot_header(snapshot, header)
+                    snapshot._atoms_array = atoms_array
+                    snapshot.formatter = formatter
+                    trajectory.append(snapshot)
+                    print(snapshot.timestep, end=' ')
+                sys.stdout.flush()
+        print()
+
+    def read_cache(self, cachedir, check=False):
+        """Read the :attr:`~DUMPReader.trajectory` from the trajectory \
+            cache `cachedir`.
+
+        The snapshot headers are read from the cache header, and the
+        cache columns are memory-mapped. The atoms array of a snapshot is
+        assembled from its rows of the cache columns when it is first
+        accessed, while :meth:`~sknano.core.atoms.Snapshot.get_column`
+        returns read-only views of the memory-mapped cache columns
+        without copying.
+
+        Parameters
+        ----------
+        cachedir : :class:`~python:str`
+        check : :class:`~python:bool`, optional
+            If `True`, raise a :class:`DUMPError` if the cache was not
+            written from the current versions of the
+            :attr:`~DUMPReader.dumpfiles`.
+
+        Raises
+        ------
+        :class:`DUMPError`
+            If `cachedir` is not a valid trajectory cache or if `check`
+            is `True` and the cache is out of date.
+
+        """
         try:
-            snapshot = Snapshot(self.trajectory)
-            domain = snapshot.domain = Domain()
+            with open(os.path.join(cachedir, _CACHE_HEADER)) as f:
+                header = json.load(f)
+            columns = \
+                {attr: np.load(os.path.join(cachedir, fname), mmap_mode='r')
+                 for attr, fname in header['columns']}
+        except (OSError, ValueError, KeyError):
+            raise DUMPError('Invalid trajectory cache: {}'.format(cachedir))
+
+        if check and header['dumpfiles'] != \
+                _dumpfile_stamps(self.dumpfiles):
+            raise DUMPError('Outdated trajectory cache: {}'.format(cachedir))
+
+        formatter = self.formatter
+        formatter.dumpattrs2index.clear()
+        formatter.dumpattrs2index.update(
+            {attr: i for i, (attr, _) in enumerate(header['columns'])})
+        if formatter.dumpattrmap is None:
+            formatter.dumpattrmap = header['dumpattrmap']
+        formatter._update_attrs()
+        formatter._update_attr_dtypes()
+        self.scale_original = header['scale_original']
+        self._transforms = []
 
-            f.readline()
-            snapshot.timestep = int(f.readline().strip().split()[0])
-            f.readline()
-            Natoms = snapshot.Natoms = int(f.readline().strip())
-            snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+        trajectory = self.trajectory
+        start = 0
+        for ssheader in header['snapshots']:
+            snapshot = Snapshot(trajectory)
+            _set_snapshot_header(snapshot, ssheader)
+            stop = start + snapshot.Natoms
+            snapshot.columns = {attr: column[start:stop]
+                                for attr, column in columns.items()}
+            snapshot.formatter = formatter
+            snapshot.loader = partial(self._load_cached_atoms, snapshot,
+                                      snapshot.columns)
+            trajectory.append(snapshot)
+            start = stop
 
-            item = f.readline().strip()
-            try:
-                snapshot.boxstr = item.split('BOUNDS')[1].strip()
-            except IndexError:
-                snapshot.boxstr = ''
+        print("read {:d} snapshots from {}".format(self.Nsnaps, cachedir))
 
-            if 'xy' in snapshot.boxstr:
-                domain.triclinic = True
+        if len(trajectory) > 0:
+            trajectory.time_selection.all()
+            self._update_reference_snapshot()
 
-            for dim, tilt_factor in zip(('x', 'y', 'z'), ('xy', 'xz', 'yz')):
-                bounds = f.readline().strip().split()
+    def write_cache(self, cachedir):
+        """Write the :attr:`~DUMPReader.trajectory` to the trajectory \
+            cache `cachedir`.
 
-                setattr(domain, dim + 'lo', float(bounds[0]))
-                setattr(domain, dim + 'hi', float(bounds[1]))
+        The trajectory cache is a directory with one ``.npy`` file per
+        dump attribute, holding the column of that attribute for all
+        snapshots in trajectory order, and a ``header.json`` file with the
+        column map, the snapshot timesteps and :class:`Domain` bounds and
+        tilt factors, and the size and modification time of the
+        :attr:`~DUMPReader.dumpfiles`. The atoms of `lazy` snapshots are
+        read and released again one snapshot at a time.
 
-                if domain.triclinic:
-                    setattr(domain, tilt_factor, float(bounds[2]))
+        Parameters
+        ----------
+        cachedir : :class:`~python:str`
 
-            if domain.triclinic:
-                xlo_bound = domain.xlo
-                xhi_bound = domain.xhi
-                ylo_bound = domain.ylo
-                yhi_bound = domain.yhi
-                xy = domain.xy
-                xz = domain.xz
-                yz = domain.yz
-                domain.xlo = xlo_bound - min((0.0, xy, xz, xy + xz))
-                domain.xhi = xhi_bound - max((0.0, xy, xz, xy + xz))
-                domain.ylo = ylo_bound - min((0.0, yz))
-                domain.yhi = yhi_bound - max((0.0, yz))
+        """
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
 
-            formatter = self.formatter
-            if formatter.dumpattrs is None:
-                dumpattrs2index = formatter.dumpattrs2index
-                xflag = yflag = zflag = None
-                attrs = f.readline().strip().split()[2:]
-                for i, attr in enumerate(attrs):
-                    if attr in ('x', 'xu', 'xs', 'xsu'):
-                        dumpattrs2index['x'] = i
-                        if attr in ('x', 'xu'):
-                            xflag = False
-                        else:
-                            xflag = True
-                    elif attr in ('y', 'yu', 'ys', 'ysu'):
-                        dumpattrs2index['y'] = i
-                        if attr in ('y', 'yu'):
-                            yflag = False
-                        else:
-                            yflag = True
-                    elif attr in ('z', 'zu', 'zs', 'zsu'):
-                        dumpattrs2index['z'] = i
-                        if attr in ('z', 'zu'):
-                            zflag = False
-                        else:
-                            zflag = True
-                    else:
-                        dumpattrs2index[attr] = i
+        trajectory = self.trajectory
+        formatter = self.formatter
+        dumpattrs = formatter._dumpattrslist
+        Natoms = [snapshot.Natoms for snapshot in trajectory]
+        stops = np.cumsum(Natoms, dtype=int)
+        fnames = ['{}.npy'.format(attr) for attr in dumpattrs]
+        columns = \
+            [np.lib.format.open_memmap(os.path.join(cachedir, fname),
+                                       mode='w+', dtype=dtype,
+                                       shape=(max(sum(Natoms), 1),))
+             for fname, dtype in zip(fnames, formatter.attr_dtypes)]
+
+        snapshots = []
+        for snapshot, stop in zip(trajectory, stops):
+            loaded = snapshot.get_atoms(asarray=True, load=False) is not None
+            atoms = snapshot.get_atoms(asarray=True)
+            for i, column in enumerate(columns):
+                column[stop - snapshot.Natoms:stop] = atoms[:, i]
+            if not loaded:
+                snapshot.release()
+            snapshots.append(_snapshot_header(snapshot))
+
+        for column in columns:
+            column.flush()
+        del columns
+
+        header = dict(dumpfiles=_dumpfile_stamps(self.dumpfiles),
+                      columns=list(zip(dumpattrs, fnames)),
+                      dumpattrmap=formatter.dumpattrmap,
+                      scale_original=self.scale_original,
+                      snapshots=snapshots)
+        fpath = os.path.join(cachedir, _CACHE_HEADER)
+        with open(fpath + '.tmp', 'w') as f:
+            json.dump(header, f)
+        os.replace(fpath + '.tmp', fpath)
+
+    def read_snapshot_headers(self, dumpfile):
+        """Append the snapshots of `dumpfile` to the \
+            :attr:`~DUMPReader.trajectory` without reading their atoms.
+
+        The snapshot atoms are read from the snapshot offsets in the
+        :func:`index_dumpfile` index when they are first accessed.
 
-                self.scale_original = None
-                if all([flag is False for flag in (xflag, yflag, zflag)]):
-                    self.scale_original = False
-                if all([flag for flag in (xflag, yflag, zflag)]):
-                    self.scale_original = True
+        Parameters
+        ----------
+        dumpfile : :class:`~python:str`
 
-            else:
-                f.readline()
+        """
+        offsets, _ = index_dumpfile(dumpfile)
+        with zopen(dumpfile, 'rb') as fb:
+            for offset in offsets:
+                fb.seek(offset)
+                f = io.TextIOWrapper(fb)
+                try:
+                    snapshot = Snapshot(self.trajectory)
+                    self._read_snapshot_header(f, snapshot)
+                except IndexError:
+                    # incomplete snapshot at the end of the file
+                    continue
+                except ValueError:
+                    raise DUMPError('Invalid dumpfile: {}'.format(dumpfile))
+                finally:
+                    f.detach()
+                snapshot.formatter = self.formatter
+                snapshot.loader = \
+                    partial(self._load_snapshot_atoms, dumpfile, offset)
+                self.trajectory.append(snapshot)
+
+    def iter_snapshots(self):
+        """Iterate over the selected snapshots.
+
+        With a `lazy` reader, the atoms of each snapshot are read when
+        accessed and released again once the iteration moves on to the
+        next snapshot, so that only one snapshot is held in memory at
+        a time.
+
+        Yields
+        ------
+        :class:`~sknano.core.atoms.Snapshot`
 
-            atoms_array = \
-                np.zeros((Natoms, len(formatter.dumpattrs)), dtype=float)
-            for n in range(Natoms):
-                line = [float(value) for col, value in
-                        enumerate(f.readline().strip().split())]
-                atoms_array[n] = line
+        """
+        for snapshot in self.trajectory:
+            if not snapshot.selected:
+                continue
+            loaded = snapshot.get_atoms(asarray=True, load=False) is not None
+            yield snapshot
+            if not loaded:
+                snapshot.release()
+
+    def close(self):
+        """Close the dump file kept open for reading snapshot atoms."""
+        if self._open_dumpfile is not None:
+            self._open_dumpfile[-1].close()
+            self._open_dumpfile = None
+
+    def _load_snapshot_atoms(self, dumpfile, offset):
+        """Read the atoms array of the snapshot at byte `offset` \
+            in `dumpfile`."""
+        # Keep the last dump file open, so that reading the snapshots of
+        # a compressed dump file in order does not decompress the file
+        # from the start for each snapshot.
+        if self._open_dumpfile is None or \
+                self._open_dumpfile[0] != dumpfile:
+            self.close()
+            self._open_dumpfile = (dumpfile, zopen(dumpfile, 'rb'))
+        fb = self._open_dumpfile[-1]
+        fb.seek(offset)
+        f = io.TextIOWrapper(fb)
+        try:
+            snapshot = self.read_snapshot(f)
+        finally:
+            f.detach()
+        if snapshot is None:
+            raise DUMPError('Invalid dumpfile: {}'.format(dumpfile))
+
+        atoms_array = snapshot.get_atoms(asarray=True)
+        for transform in self._transforms:
+            getattr(self, transform)(snapshot, atoms_array)
+        return atoms_array
+
+    def _load_cached_atoms(self, snapshot, columns):
+        """Assemble the atoms array of `snapshot` from its trajectory \
+            cache `columns`."""
+        atoms_array = np.column_stack(list(columns.values())).astype(float)
+        for transform in self._transforms:
+            getattr(self, transform)(snapshot, atoms_array)
+        return atoms_array
 
-            snapshot._atoms_array = atoms_array
+    def read_snapshot(self, f):
+        """Read snapshot from file."""
+        try:
+            snapshot = Snapshot(self.trajectory)
+            self._read_snapshot_header(f, snapshot)
+            formatter = self.formatter
+            snapshot._atoms_array = \
+                formatter.parse_atoms(f, snapshot.Natoms)
             snapshot.formatter = formatter
             return snapshot
         except IndexError:
@@ -377,72 +927,170 @@ class DUMPReader(StructureData):
         except ValueError:
             raise DUMPError('Invalid dumpfile: {}'.format(f.name))
 
+    def _read_snapshot_header(self, f, snapshot):
+        """Read snapshot header from file."""
+        domain = snapshot.domain = Domain()
+
+        f.readline()
+        snapshot.timestep = int(f.readline().strip().split()[0])
+        f.readline()
+        Natoms = snapshot.Natoms = int(f.readline().strip())
+        snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+
+        item = f.readline().strip()
+        try:
+            snapshot.boxstr = item.split('BOUNDS')[1].strip()
+        except IndexError:
+            snapshot.boxstr = ''
+
+        if 'xy' in snapshot.boxstr:
+            domain.triclinic = True
+
+        for dim, tilt_factor in zip(('x', 'y', 'z'), ('xy', 'xz', 'yz')):
+            bounds = f.readline().strip().split()
+
+            setattr(domain, dim + 'lo', float(bounds[0]))
+            setattr(domain, dim + 'hi', float(bounds[1]))
+
+            if domain.triclinic:
+                setattr(domain, tilt_factor, float(bounds[2]))
+
+        if domain.triclinic:
+            xlo_bound = domain.xlo
+            xhi_bound = domain.xhi
+            ylo_bound = domain.ylo
+            yhi_bound = domain.yhi
+            xy = domain.xy
+            xz = domain.xz
+            yz = domain.yz
+            domain.xlo = xlo_bound - min((0.0, xy, xz, xy + xz))
+            domain.xhi = xhi_bound - max((0.0, xy, xz, xy + xz))
+            domain.ylo = ylo_bound - min((0.0, yz))
+            domain.yhi = yhi_bound - max((0.0, yz))
+
+        formatter = self.formatter
+        if formatter.dumpattrs is None:
+            dumpattrs2index = formatter.dumpattrs2index
+            xflag = yflag = zflag = None
+            attrs = f.readline().strip().split()[2:]
+            for i, attr in enumerate(attrs):
+                if attr in ('x', 'xu', 'xs', 'xsu'):
+                    dumpattrs2index['x'] = i
+                    if attr in ('x', 'xu'):
+                        xflag = False
+                    else:
+                        xflag = True
+                elif attr in ('y', 'yu', 'ys', 'ysu'):
+                    dumpattrs2index['y'] = i
+                    if attr in ('y', 'yu'):
+                        yflag = False
+                    else:
+                        yflag = True
+                elif attr in ('z', 'zu', 'zs', 'zsu'):
+                    dumpattrs2index['z'] = i
+                    if attr in ('z', 'zu'):
+                        zflag = False
+                    else:
+                        zflag = True
+                else:
+                    dumpattrs2index[attr] = i
+
+            self.scale_original = None
+            if all([flag is False for flag in (xflag, yflag, zflag)]):
+                self.scale_original = False
+            if all([flag for flag in (xflag, yflag, zflag)]):
+                self.scale_original = True
+
+        else:
+            f.readline()
+
     def scale(self):
         """Scale cartesian coordinates to fractional coordinates."""
+        self._transform('_scale_snapshot')
+
+    def unscale(self):
+        """Unscale fractional coordinates to cartesian coordinates."""
+        self._transform('_unscale_snapshot')
+
+    def wrap(self):
+        """Wrap coordinates from outside box to inside."""
+        self._transform('_wrap_snapshot')
+
+    def unwrap(self):
+        """Unwrap coordinates from inside box to outside."""
+        self._transform('_unwrap_snapshot')
+
+    def _transform(self, transform):
+        """Apply `transform` to the atoms of each snapshot.
+
+        The atoms of `lazy` or cached snapshots which have not been read
+        yet are transformed when they are read.
+
+        """
+        self._transforms.append(transform)
+        for snapshot in self.trajectory:
+            snapshot.columns = None
+            atoms = snapshot.get_atoms(asarray=True, load=False)
+            if atoms is not None:
+                getattr(self, transform)(snapshot, atoms)
+
+    def _scale_snapshot(self, snapshot, atoms):
         dumpattrs2index = self.formatter.dumpattrs2index
         xi = dumpattrs2index['x']
         yi = dumpattrs2index['y']
         zi = dumpattrs2index['z']
-        for snapshot in self.trajectory:
-            atoms = snapshot.get_atoms(asarray=True)
-            if atoms is not None:
-                domain = snapshot.domain
-                lx = domain.lx
-                ly = domain.ly
-                lz = domain.lz
-                xy = domain.xy
-                xz = domain.xz
-                yz = domain.yz
-
-                if np.allclose([xy, xz, yz], np.zeros(3)):
-                    atoms[:, xi] = (atoms[:, xi] - domain.xlo) / lx
-                    atoms[:, yi] = (atoms[:, yi] - domain.ylo) / ly
-                    atoms[:, zi] = (atoms[:, zi] - domain.zlo) / lz
-                else:
-                    xlo_bound = domain.xlo_bound
-                    ylo_bound = domain.ylo_bound
-                    zlo_bound = domain.zlo_bound
-                    atoms[:, xi] = (atoms[:, xi] - xlo_bound) / lx + \
-                        (atoms[:, yi] - ylo_bound) * xy / (lx * ly) + \
-                        (atoms[:, zi] - zlo_bound) * (yz * xy - ly * xz) / \
-                        (lx * ly * lz)
-                    atoms[:, yi] = (atoms[:, yi] - ylo_bound) / ly + \
-                        (atoms[:, zi] - zlo_bound) * yz / (ly * lz)
-                    atoms[:, zi] = (atoms[:, zi] - zlo_bound) / lz
-
-    def unscale(self):
-        """Unscale fractional coordinates to cartesian coordinates."""
+        domain = snapshot.domain
+        lx = domain.lx
+        ly = domain.ly
+        lz = domain.lz
+        xy = domain.xy
+        xz = domain.xz
+        yz = domain.yz
+
+        if np.allclose([xy, xz, yz], np.zeros(3)):
+            atoms[:, xi] = (atoms[:, xi] - domain.xlo) / lx
+            atoms[:, yi] = (atoms[:, yi] - domain.ylo) / ly
+            atoms[:, zi] = (atoms[:, zi] - domain.zlo) / lz
+        else:
+            xlo_bound = domain.xlo_bound
+            ylo_bound = domain.ylo_bound
+            zlo_bound = domain.zlo_bound
+            atoms[:, xi] = (atoms[:, xi] - xlo_bound) / lx + \
+                (atoms[:, yi] - ylo_bound) * xy / (lx * ly) + \
+                (atoms[:, zi] - zlo_bound) * (yz * xy - ly * xz) / \
+                (lx * ly * lz)
+            atoms[:, yi] = (atoms[:, yi] - ylo_bound) / ly + \
+                (atoms[:, zi] - zlo_bound) * yz / (ly * lz)
+            atoms[:, zi] = (atoms[:, zi] - zlo_bound) / lz
+
+    def _unscale_snapshot(self, snapshot, atoms):
         dumpattrs2index = self.formatter.dumpattrs2index
         xi = dumpattrs2index['x']
         yi = dumpattrs2index['y']
         zi = dumpattrs2index['z']
-        for snapshot in self.trajectory:
-            atoms = snapshot.get_atoms(asarray=True)
-            if atoms is not None:
-                domain = snapshot.domain
-                lx = domain.lx
-                ly = domain.ly
-                lz = domain.lz
-                xy = domain.xy
-                xz = domain.xz
-                yz = domain.yz
-                if np.allclose([xy, xz, yz], np.zeros(3)):
-                    atoms[:, xi] = domain.xlo + atoms[:, xi] * lx
-                    atoms[:, yi] = domain.ylo + atoms[:, yi] * ly
-                    atoms[:, zi] = domain.zlo + atoms[:, zi] * lz
-                else:
-                    xlo_bound = domain.xlo_bound
-                    ylo_bound = domain.ylo_bound
-                    zlo_bound = domain.zlo_bound
+        domain = snapshot.domain
+        lx = domain.lx
+        ly = domain.ly
+        lz = domain.lz
+        xy = domain.xy
+        xz = domain.xz
+        yz = domain.yz
+        if np.allclose([xy, xz, yz], np.zeros(3)):
+            atoms[:, xi] = domain.xlo + atoms[:, xi] * lx
+            atoms[:, yi] = domain.ylo + atoms[:, yi] * ly
+            atoms[:, zi] = domain.zlo + atoms[:, zi] * lz
+        else:
+            xlo_bound = domain.xlo_bound
+            ylo_bound = domain.ylo_bound
+            zlo_bound = domain.zlo_bound
 
-                    atoms[:, xi] = xlo_bound + atoms[:, xi] * lx + \
-                        atoms[:, yi] * xy + atoms[:, zi] * xz
-                    atoms[:, yi] = ylo_bound + atoms[:, yi] * ly + \
-                        atoms[:, zi] * yz
-                    atoms[:, zi] = zlo_bound + atoms[:, zi] * lz
+            atoms[:, xi] = xlo_bound + atoms[:, xi] * lx + \
+                atoms[:, yi] * xy + atoms[:, zi] * xz
+            atoms[:, yi] = ylo_bound + atoms[:, yi] * ly + \
+                atoms[:, zi] * yz
+            atoms[:, zi] = zlo_bound + atoms[:, zi] * lz
 
-    def wrap(self):
-        """Wrap coordinates from outside box to inside."""
+    def _wrap_snapshot(self, snapshot, atoms):
         dumpattrs2index = self.formatter.dumpattrs2index
         x = dumpattrs2index['x']
         y = dumpattrs2index['y']
@@ -453,19 +1101,15 @@ class DUMPReader(StructureData):
         iz = dumpattrs2index.get('iz', None)
 
         if all([iflag is not None for iflag in (ix, iy, iz)]):
-            for snapshot in self.trajectory:
-                atoms = snapshot.get_atoms(asarray=True)
-                if atoms is not None:
-                    domain = snapshot.domain
-                    lx = domain.lx
-                    ly = domain.ly
-                    lz = domain.lz
-                    atoms[:, x] -= atoms[:, ix] * lx
-                    atoms[:, y] -= atoms[:, iy] * ly
-                    atoms[:, z] -= atoms[:, iz] * lz
-
-    def unwrap(self):
-        """Unwrap coordinates from inside box to outside."""
+            domain = snapshot.domain
+            lx = domain.lx
+            ly = domain.ly
+            lz = domain.lz
+            atoms[:, x] -= atoms[:, ix] * lx
+            atoms[:, y] -= atoms[:, iy] * ly
+            atoms[:, z] -= atoms[:, iz] * lz
+
+    def _unwrap_snapshot(self, snapshot, atoms):
         dumpattrs2index = self.formatter.dumpattrs2index
         x = dumpattrs2index['x']
         y = dumpattrs2index['y']
@@ -476,16 +1120,13 @@ class DUMPReader(StructureData):
         iz = dumpattrs2index.get('iz', None)
 
         if all([iflag is not None for iflag in (ix, iy, iz)]):
-            for snapshot in self.trajectory:
-                atoms = snapshot.get_atoms(asarray=True)
-                if atoms is not None:
-                    domain = snapshot.domain
-                    lx = domain.lx
-                    ly = domain.ly
-                    lz = domain.lz
-                    atoms[:, x] += atoms[:, ix] * lx
-                    atoms[:, y] += atoms[:, iy] * ly
-                    atoms[:, z] += atoms[:, iz] * lz
+            domain = snapshot.domain
+            lx = domain.lx
+            ly = domain.ly
+            lz = domain.lz
+            atoms[:, x] += atoms[:, ix] * lx
+            atoms[:, y] += atoms[:, iy] * ly
+            atoms[:, z] += atoms[:, iz] * lz
 
     def new_dumpattr(self, attr, values=None):
         """Add new dump attr to :attr:`~DUMPReader.trajectory.snapshots`.
@@ -530,7 +1171,7 @@ class DUMPReader(StructureData):
             values = np.asarray(values)
             for i, ss in enumerate(trajectory):
                 ss._atoms_array = \
-                    np.insert(ss._atoms_array, attridx, values[i])
+                    np.insert(ss.get_atoms(asarray=True), attridx, values[i])
 
     def map(self, *pairs):
         """Update :attr:`~DUMPFormatter.dumpattrs2index` mapping.
@@ -595,13 +1236,15 @@ class DUMPReader(StructureData):
                            for atom in ss.atoms] for ss in trajectory]
             values = np.asarray(values)
             for i, ss in enumerate(trajectory):
-                ss._atoms_array[:, attridx] = values[i]
+                ss.get_atoms(asarray=True)[:, attridx] = values[i]
 
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         attr_dict = dict(dumpfiles=self.dumpfiles,
                          reference_timestep=self.reference_timestep,
-                         reference_index=self.reference_index)
+                         reference_index=self.reference_index,
+                         lazy=self.lazy, cache=self.cache,
+                         num_procs=self.num_procs)
         attr_dict.update(self.formatter.todict())
         return attr_dict
 
@@ -852,11 +1495,8 @@ class DUMPData(DUMPReader):
         """Write snapshot atoms."""
         atoms_array = ss.get_atoms(asarray=True)[ss.atom_selection]
         formatter = ss.formatter
-        attr_dtypes = formatter.attr_dtypes
-        sformat = formatter.format
         stream.write('ITEM: ATOMS {}\n'.format(formatter.dumpattrs2str()))
-        for atom in atoms_array:
-            stream.write(sformat(atom, attr_dtypes))
+        stream.write(formatter.format_atoms(atoms_array))
 
 DUMP = DUMPIO = DUMPData
 
@@ -1019,6 +1659,47 @@ class DUMPFormatter(StructureDataFormatter):
             except ValueError:
                 pass
 
+    def parse_atoms(self, f, Natoms):
+        """Parse the next `Natoms` lines of atom attributes from file `f`.
+
+        If every line has one value per dump attribute, the lines are
+        parsed in one call to :func:`~numpy:numpy.fromstring`. Otherwise
+        they are parsed line by line.
+
+        Parameters
+        ----------
+        f : file object
+        Natoms : :class:`~python:int`
+
+        Returns
+        -------
+        :class:`~numpy:numpy.ndarray`
+            Array of atom attributes with shape
+            (`Natoms`, len(:attr:`~DUMPFormatter.dumpattrs`)).
+
+        Raises
+        ------
+        :class:`~python:ValueError`
+            If the lines do not contain `Natoms` rows of atom attributes.
+
+        """
+        ncols = len(self.dumpattrs)
+        lines = list(islice(f, Natoms))
+        if len(lines) == Natoms:
+            text = ''.join(lines)
+            if not text.endswith('\n'):
+                text += '\n'
+            if _has_row_width(text, Natoms, ncols):
+                atoms_array = np.fromstring(text, dtype=float, sep=' ')
+                if atoms_array.size == Natoms * ncols:
+                    return atoms_array.reshape((Natoms, ncols))
+
+        atoms_array = np.zeros((Natoms, ncols), dtype=float)
+        for n in range(Natoms):
+            line = lines[n] if n < len(lines) else ''
+            atoms_array[n] = [float(value) for value in line.split()]
+        return atoms_array
+
     def format(self, attrs, attr_dtypes=None):
         """Return :class:`~python:str` of dump attributes formatted for an \
             output stream.
@@ -1036,6 +1717,32 @@ class DUMPFormatter(StructureDataFormatter):
         line += '\n'
         return line
 
+    def format_atoms(self, atoms_array, attr_dtypes=None):
+        """Return :class:`~python:str` of the rows of `atoms_array` \
+            formatted for an output stream.
+
+        The output is the same as calling :meth:`~DUMPFormatter.format`
+        for each row, but each column is converted to its `dtype` in one
+        call.
+
+        Parameters
+        ----------
+        atoms_array : :class:`~numpy:numpy.ndarray`
+            2D array of dump attribute values.
+
+        """
+        if attr_dtypes is None:
+            attr_dtypes = self.attr_dtypes
+        columns = []
+        for column, dtype in zip(np.asarray(atoms_array).T, attr_dtypes):
+            if dtype in (int, float):
+                column = column.astype(dtype).tolist()
+            else:
+                column = [dtype(value) for value in column]
+            columns.append(column)
+        fmtstr = ' '.join(['{}'] * len(columns)) + '\n'
+        return ''.join([fmtstr.format(*row) for row in zip(*columns)])
+
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         attr_dict = super().todict()
@@ -5,8 +5,13 @@ from __future__ import unicode_literals
 
 from collections import OrderedDict
 
+from pkg_resources import resource_filename
+
+import numpy as np
+
 import nose
-from nose.tools import assert_equal, assert_not_equal, assert_is_instance
+from nose.tools import assert_equal, assert_not_equal, assert_is_instance, \
+    assert_true
 from sknano.testing import IOTestFixture, GeneratorTestFixture, \
     generate_structure
 
@@ -83,5 +88,55 @@ class Tests(DATATestFixture):
         swnt.save(structure_format='data')
         self.tmpdata.append(swnt.fname)
 
+    def test5(self):
+        datafile = resource_filename('sknano', 'data/lammps_data/data.peptide')
+        data = DATAReader(datafile)
+        bonds = data.section_arrays['Bonds']
+        assert_equal(list(bonds.keys()), data.section_attrs['Bonds'])
+        assert_equal(bonds['atom1'].dtype, np.dtype(int))
+        assert_equal(bonds['atom1'].size, data.headers['bonds'])
+        assert_equal(np.column_stack(list(bonds.values())).tolist(),
+                     data.sections['Bonds'])
+        assert_true(np.allclose(data.section_arrays['Atoms']['x'],
+                                data.atoms.x))
+
+        with open(datafile) as f:
+            lines = f.readlines()
+        start = lines.index('Velocities\n') + 2
+        stop = start + data.headers['atoms']
+        lines[start:stop] = lines[start:stop][::-1]
+        testfile = 'test5.data'
+        self.tmpdata.append(testfile)
+        with open(testfile, 'w') as f:
+            f.writelines(lines)
+        test_data = DATAReader(testfile)
+        assert_equal(data.atoms.ids.tolist(), test_data.atoms.ids.tolist())
+        assert_true(np.allclose(np.asarray(data.atoms.v),
+                                np.asarray(test_data.atoms.v)))
+        assert_true(np.any(np.asarray(data.atoms.v) != 0))
+
+    def test6(self):
+        formatter = DATAFormatter()
+        lines = ['1 1 1 2\n', '2 1 2\n', '3 1 3 4 5\n']
+        rows, columns = formatter.parse_section(lines, 'Bonds')
+        assert_equal(rows, [[1, 1, 1, 2], [2, 1, 2], [3, 1, 3, 4]])
+        assert_equal(list(columns.keys()), ['id', 'type', 'atom1'])
+        assert_equal(columns['atom1'].tolist(), [1, 2, 3])
+
+    def test7(self):
+        formatter = DATAFormatter()
+        specs = formatter.section_attrs_specs['Masses']
+        rows = [(1, 12.0107), (2, 1.00794)]
+        for fmtstr in ('{:.4e}', '{:10.3f}', '{:.2f}*'):
+            specs['mass']['fmtstr'] = fmtstr
+            expected = ''.join(
+                '{:>{}}{:>{}}\n'.format('{:d}'.format(type_),
+                                        specs['type']['width'],
+                                        fmtstr.format(mass),
+                                        specs['mass']['width'])
+                for type_, mass in rows)
+            assert_equal(formatter.format_section('Masses', rows), expected)
+
+
 if __name__ == '__main__':
     nose.runmodule()
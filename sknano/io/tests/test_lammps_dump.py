@@ -4,13 +4,18 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
 from operator import attrgetter
+import gzip
+import io
+import os
+import shutil
+import tempfile
 
 import numpy as np
 
 import nose
-from nose.tools import assert_equal, assert_true
+from nose.tools import assert_equal, assert_true, assert_raises
 from sknano.testing import DUMPTestFixture, GeneratorTestFixture
-from sknano.io import DUMPData, DUMPWriter
+from sknano.io import DUMPData, DUMPReader, DUMPWriter, index_dumpfile
 
 
 class Tests(DUMPTestFixture, GeneratorTestFixture):
@@ -145,6 +150,190 @@ class Tests(DUMPTestFixture, GeneratorTestFixture):
                   dumpattrs=['id', 'type', 'x', 'y', 'z'])
         self.tmpdata.append(swnt.fname)
 
+    def test9(self):
+        dump = self.dump_reader
+        for testfile in ('test9.dump', 'test9.dump.gz'):
+            with open(dump.dumpfiles[0], 'rb') as fsrc, \
+                    (gzip.open if testfile.endswith('.gz') else open)(
+                        testfile, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst)
+            self.tmpdata.extend([testfile, '.{}.idx'.format(testfile)])
+
+            offsets, timesteps = index_dumpfile(testfile)
+            assert_true(os.path.exists('.{}.idx'.format(testfile)))
+            assert_equal(timesteps.tolist(), dump.timesteps)
+            cached_offsets, _ = index_dumpfile(testfile)
+            assert_true(np.all(offsets == cached_offsets))
+
+            test_dump = DUMPReader(testfile, lazy=True,
+                                   dumpattrmap=dump.dumpattrmap,
+                                   atomattrmap=dump.atomattrmap)
+            assert_equal(dump.timesteps, test_dump.timesteps)
+            ss = test_dump[-1]
+            assert_true(ss.get_atoms(asarray=True, load=False) is None)
+            assert_true(np.allclose(dump[-1].get_atoms(asarray=True),
+                                    ss.get_atoms(asarray=True)))
+
+            test_dump.tselect.skip(10)
+            timesteps = [ss.timestep for ss in test_dump.iter_snapshots()]
+            assert_equal(timesteps, dump.timesteps[::10])
+            assert_true(ss.get_atoms(asarray=True, load=False) is not None)
+            assert_true(test_dump[10].get_atoms(asarray=True, load=False)
+                        is None)
+            test_dump.close()
+
+    def test10(self):
+        dump = self.dump_reader
+        formatter = dump.formatter
+        ss = dump[0]
+        lines = [' '.join(map(repr, atom)) + '\n'
+                 for atom in ss.get_atoms(asarray=True)]
+        atoms_array = formatter.parse_atoms(io.StringIO(''.join(lines)),
+                                            ss.Natoms)
+        assert_true(np.array_equal(atoms_array, ss.get_atoms(asarray=True)))
+
+        f = io.StringIO(''.join(lines[:10]) + 'ITEM: TIMESTEP\n')
+        assert_equal(formatter.parse_atoms(f, 10).shape,
+                     (10, len(formatter.dumpattrs)))
+        assert_equal(f.readline(), 'ITEM: TIMESTEP\n')
+        assert_raises(ValueError, formatter.parse_atoms,
+                      io.StringIO(''.join(lines[:10])), 11)
+        # The total number of values matches, but two rows are irregular
+        values = lines[1].split()
+        irregular = lines[:1] + [' '.join(values[:-1]) + '\n',
+                                 lines[2].rstrip() + ' ' + values[-1] + '\n']
+        assert_raises(ValueError, formatter.parse_atoms,
+                      io.StringIO(''.join(irregular)), 3)
+
+        atoms = ss.atoms
+        assert_true(all(isinstance(atom.id, int) and
+                        isinstance(atom.type, int) for atom in atoms))
+
+    def test11(self):
+        dump = self.dump_reader
+        testfile = 'test11.dump'
+        shutil.copyfile(dump.dumpfiles[0], testfile)
+        self.tmpdata.append(testfile)
+        cachedir = tempfile.mkdtemp()
+        try:
+            test_dump = DUMPReader(testfile, cache=cachedir,
+                                   dumpattrmap=dump.dumpattrmap,
+                                   atomattrmap=dump.atomattrmap)
+            assert_true(os.path.exists(os.path.join(cachedir,
+                                                    'header.json')))
+            assert_true(test_dump[0].columns is None)
+
+            test_dump = DUMPReader(testfile, cache=cachedir,
+                                   dumpattrmap=dump.dumpattrmap,
+                                   atomattrmap=dump.atomattrmap)
+            assert_equal(dump.timesteps, test_dump.timesteps)
+            assert_equal(dump.dumpattrs, test_dump.dumpattrs)
+            ss = test_dump[-1]
+            assert_true(ss.columns is not None)
+            x = ss.get_column('x')
+            assert_true(isinstance(x, np.memmap))
+            assert_true(ss.get_atoms(asarray=True, load=False) is None)
+            assert_true(np.allclose(dump[-1].get_column('x'), x))
+            assert_true(np.allclose(dump[-1].get_atoms(asarray=True),
+                                    ss.get_atoms(asarray=True)))
+            assert_equal(dump[-1].domain.tilt_factors,
+                         ss.domain.tilt_factors)
+            assert_equal(dump[-1].domain.xhi, ss.domain.xhi)
+            assert_equal(dump[-1].atoms, ss.atoms)
+
+            test_dump = DUMPReader(cache=cachedir)
+            assert_equal(dump.timesteps, test_dump.timesteps)
+            test_dump.scale()
+            assert_true(test_dump[-1].columns is None)
+            assert_true(np.all(test_dump[-1].get_column('x') <= 1.0))
+        finally:
+            shutil.rmtree(cachedir)
+
+    def test12(self):
+        dump = self.dump_reader
+        testfiles = ['test12.dump', 'test12.dump.gz']
+        with open(dump.dumpfiles[0], 'rb') as fsrc, \
+                gzip.open(testfiles[-1], 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst)
+        shutil.copyfile(dump.dumpfiles[0], testfiles[0])
+        self.tmpdata.extend(testfiles + ['.test12.dump.idx'])
+
+        test_dump = DUMPReader(testfiles[0], num_procs=2,
+                               dumpattrmap=dump.dumpattrmap,
+                               atomattrmap=dump.atomattrmap)
+        assert_equal(dump.timesteps, test_dump.timesteps)
+        assert_equal(dump.dumpattrs, test_dump.dumpattrs)
+        assert_true(all(np.array_equal(ss.get_atoms(asarray=True),
+                                       test_ss.get_atoms(asarray=True))
+                        for ss, test_ss in zip(dump, test_dump)))
+        assert_equal(dump[0].domain.tilt_factors,
+                     test_dump[0].domain.tilt_factors)
+        assert_equal(dump[0].atoms, test_dump[0].atoms)
+
+        test_dump = DUMPReader(' '.join(testfiles), num_procs=2,
+                               dumpattrmap=dump.dumpattrmap,
+                               atomattrmap=dump.atomattrmap)
+        assert_equal(dump.timesteps, test_dump.timesteps)
+        assert_true(np.array_equal(dump[-1].get_atoms(asarray=True),
+                                   test_dump[-1].get_atoms(asarray=True)))
+
+    def test13(self):
+        dump = self.dump_reader
+        offsets, _ = index_dumpfile(dump.dumpfiles[0])
+        with open(dump.dumpfiles[0], 'rb') as f:
+            data = f.read()
+        testfile = 'test13.dump'
+        self.tmpdata.extend([testfile, '.test13.dump.idx'])
+        with open(testfile, 'wb') as f:
+            f.write(data[:offsets[5] + 100])
+
+        test_dump = DUMPReader(testfile, dumpattrmap=dump.dumpattrmap,
+                               atomattrmap=dump.atomattrmap)
+        assert_equal(test_dump.timesteps, dump.timesteps[:5])
+        assert_equal(test_dump.follow(), [])
+
+        selection = test_dump[0].atoms
+        selection = selection.filtered(selection.ids < 100)
+        test_dump.atom_selection.update(selection)
+        with open(testfile, 'ab') as f:
+            f.write(data[offsets[5] + 100:offsets[10] - 1])
+        snapshots = test_dump.follow()
+        assert_equal([ss.timestep for ss in snapshots],
+                     dump.timesteps[5:9])
+        assert_equal(test_dump.timesteps, dump.timesteps[:9])
+        assert_true(np.allclose(dump[8].get_atoms(asarray=True),
+                                test_dump[8].get_atoms(asarray=True)))
+        assert_equal(test_dump[8].atoms.ids.tolist(),
+                     selection.ids.tolist())
+
+        with open(testfile, 'ab') as f:
+            f.write(data[offsets[10] - 1:])
+        snapshots = test_dump.follow()
+        assert_equal(test_dump.timesteps, dump.timesteps)
+        assert_true(np.allclose(dump[-1].get_atoms(asarray=True),
+                                test_dump[-1].get_atoms(asarray=True)))
+
+        with open(testfile, 'wb') as f:
+            f.write(data[:offsets[5]])
+        test_dump = DUMPReader(testfile, dumpattrmap=dump.dumpattrmap,
+                               atomattrmap=dump.atomattrmap)
+        assert_equal(test_dump.timesteps, dump.timesteps[:5])
+        with open(testfile, 'ab') as f:
+            f.write(data[offsets[5]:offsets[10]])
+        snapshots = test_dump.follow()
+        assert_equal([ss.timestep for ss in snapshots],
+                     dump.timesteps[5:10])
+        assert_equal(test_dump.timesteps, dump.timesteps[:10])
+
+    def test14(self):
+        dump = self.dump_reader
+        ss = dump[0]
+        formatter = ss.formatter
+        atoms_array = ss.get_atoms(asarray=True)
+        assert_equal(formatter.format_atoms(atoms_array),
+                     ''.join(formatter.format(atom, formatter.attr_dtypes)
+                             for atom in atoms_array))
+
 
 if __name__ == '__main__':
     nose.runmodule()
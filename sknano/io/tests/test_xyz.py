@@ -5,9 +5,12 @@ from __future__ import unicode_literals
 
 from operator import attrgetter
 
+import numpy as np
+
 import nose
-from nose.tools import assert_equal
-from sknano.io import XYZData, XYZReader, XYZWriter, XYZ2DATAConverter
+from nose.tools import assert_equal, assert_true
+from sknano.io import XYZData, XYZReader, XYZWriter, XYZ2DATAConverter, \
+    XYZFormatter, XYZTrajectoryReader, XYZTrajectoryWriter, index_xyzfile
 from sknano.testing import IOTestFixture
 
 
@@ -43,6 +46,63 @@ class Tests(XYZTestFixture):
         xyz_reader = self.xyz_reader
         # print(xyz_reader)
 
+    def test3(self):
+        atoms = self.atoms
+        formatter = XYZFormatter()
+        assert_equal(formatter.format_atoms(atoms),
+                     ''.join(formatter.format(atom) for atom in atoms))
+
+    def test4(self):
+        atoms = self.xyz_reader.atoms
+        testfile = 'test4.xyz'
+        self.tmpdata.append(testfile)
+        XYZTrajectoryWriter.write(fpath=testfile, atoms=atoms)
+        for step in (10, 20):
+            atoms.translate([0, 0, 1.0])
+            XYZTrajectoryWriter.write(
+                fpath=testfile, atoms=atoms, append=True,
+                comment_line='Lattice="10 0 0 0 10 0 0 0 5" '
+                'Properties=species:S:1:pos:R:3 step={}'.format(step))
+        offsets, Natoms = index_xyzfile(testfile)
+        assert_equal(len(offsets), 3)
+        assert_equal(Natoms.tolist(), [atoms.Natoms] * 3)
+
+        traj = XYZTrajectoryReader(testfile)
+        assert_equal(traj.timesteps, [0, 10, 20])
+        assert_equal(traj[2].domain.zhi, 5.0)
+        assert_true(np.allclose(traj[2].atoms.coords, atoms.coords))
+        assert_equal(traj[2].atoms.elements.tolist(),
+                     atoms.elements.tolist())
+        assert_true(np.allclose(XYZReader(testfile, frame=2).atoms.coords,
+                                atoms.coords))
+
+        lazy_traj = XYZTrajectoryReader(testfile, lazy=True)
+        assert_true(lazy_traj[1].get_atoms(asarray=True, load=False) is None)
+        assert_true(np.allclose(lazy_traj[1].get_atoms(asarray=True),
+                                traj[1].get_atoms(asarray=True)))
+
+        XYZTrajectoryWriter.write(fpath=testfile, trajectory=traj.trajectory)
+        test_traj = XYZTrajectoryReader(testfile)
+        assert_equal(test_traj.timesteps, traj.timesteps)
+        assert_true(np.allclose(test_traj[2].get_atoms(asarray=True),
+                                traj[2].get_atoms(asarray=True)))
+
+    def test5(self):
+        testfile = 'test5.xyz'
+        self.tmpdata.append(testfile)
+        frame = '3\n\nC 0.0 0.0 0.0\n\nC 1.0 0.0 0.0\n  \nC 2.0 0.0 0.0\n'
+        with open(testfile, 'w') as f:
+            f.write(frame + '\n' + frame)
+        atoms = XYZReader(testfile).atoms
+        assert_equal(atoms.Natoms, 3)
+        assert_equal(atoms.x.tolist(), [0.0, 1.0, 2.0])
+        offsets, Natoms = index_xyzfile(testfile)
+        assert_equal(offsets.tolist(), [0, len(frame) + 1])
+        assert_equal(Natoms.tolist(), [3, 3])
+        assert_equal(XYZReader(testfile, frame=1).atoms.x.tolist(),
+                     [0.0, 1.0, 2.0])
+        assert_equal(XYZTrajectoryReader(testfile).Nsnaps, 2)
+
     # def test2(self):
     #     # data = XYZData()
     #     # data.fpath = infile
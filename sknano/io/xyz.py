@@ -11,20 +11,105 @@ from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 __docformat__ = 'restructuredtext en'
 
+from collections import OrderedDict
+from functools import partial
+from glob import glob
+from itertools import islice
+import io
 import os
+import shlex
+
+import numpy as np
 
 from monty.io import zopen
-from sknano.core import get_fpath
-from sknano.core.atoms import StructureAtom as Atom
+from sknano.core import get_fpath, flatten
+from sknano.core.atoms import StructureAtom as Atom, Trajectory, Snapshot
+from sknano.core.crystallography import Domain
 from sknano.core.structures import update_structure
 
 from .base import StructureData, StructureDataError, StructureDataConverter, \
     StructureDataFormatter, default_comment_line
+from .lammps_dump import DUMPFormatter
 
 __all__ = ['XYZ', 'XYZData', 'XYZReader', 'XYZWriter', 'XYZFormatter',
            'XYZConverter', 'XYZError', 'XYZIO', 'XYZIOReader', 'XYZIOWriter',
            'XYZIOFormatter', 'XYZIOConverter', 'XYZIOError', 'XYZFormatSpec',
-           'XYZ2DATAConverter']
+           'XYZ2DATAConverter', 'XYZTrajectoryReader', 'XYZTrajectoryWriter',
+           'index_xyzfile']
+
+_DEFAULT_PROPERTIES = [('species', 'S', 1), ('pos', 'R', 3)]
+_XYZ_PROPERTY_ATTRS = {'species': ['element'], 'pos': ['x', 'y', 'z'],
+                       'velo': ['vx', 'vy', 'vz'],
+                       'forces': ['fx', 'fy', 'fz']}
+
+
+def _property_attrs(properties):
+    """Return :class:`~python:list` of (attr, type) tuples of the atom \
+        attributes of the columns of the extended `xyz` `properties`."""
+    attrs = []
+    for name, dtype, ncols in properties:
+        names = _XYZ_PROPERTY_ATTRS.get(name)
+        if names is None or len(names) != ncols:
+            names = [name] if ncols == 1 else \
+                ['{}{}'.format(name, i) for i in range(ncols)]
+        attrs.extend((attr, dtype) for attr in names)
+    return attrs
+
+
+def _read_atom_lines(f, Natoms):
+    """Return the next `Natoms` non-blank lines of file `f` and the \
+        total length of the lines read, including blank lines."""
+    lines = list(islice(f, Natoms))
+    size = sum(map(len, lines))
+    atom_lines = [line for line in lines if line.strip()]
+    while len(atom_lines) < Natoms:
+        lines = list(islice(f, Natoms - len(atom_lines)))
+        if not lines:
+            break
+        size += sum(map(len, lines))
+        atom_lines.extend(line for line in lines if line.strip())
+    return atom_lines, size
+
+
+def index_xyzfile(xyzfile):
+    """Return the byte offsets and number of atoms of the frames in \
+        `xyzfile`.
+
+    The frames are located by skipping the comment line and the non-blank
+    atom lines of each frame following its atom count line, without
+    parsing them. An incomplete frame at the end of the file is not
+    indexed. Offsets into compressed `xyz` files are offsets into the
+    decompressed data.
+
+    Parameters
+    ----------
+    xyzfile : :class:`~python:str`
+
+    Returns
+    -------
+    offsets, Natoms : :class:`~numpy:numpy.ndarray`
+
+    """
+    offsets = []
+    Natoms = []
+    offset = 0
+    with zopen(xyzfile, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                offset += len(line)
+                continue
+            try:
+                N = int(line.split()[0])
+            except ValueError:
+                raise XYZError('Invalid `xyz` file: {}'.format(xyzfile))
+            comment_line = next(f, None)
+            lines, size = _read_atom_lines(f, N)
+            if comment_line is None or len(lines) < N:
+                break
+            offsets.append(offset)
+            Natoms.append(N)
+            offset += len(line) + len(comment_line) + size
+    return np.asarray(offsets, dtype=int), np.asarray(Natoms, dtype=int)
 
 
 class XYZReader(StructureData):
@@ -34,12 +119,17 @@ class XYZReader(StructureData):
     ----------
     fpath : str
         `xyz` structure file path.
+    frame : :class:`~python:int`, optional
+        Index of the frame of a multi-frame `xyz` file to read.
+        Default is 0.
 
     """
-    def __init__(self, fpath, formatter=None, **kwargs):
+    def __init__(self, fpath, frame=0, formatter=None, **kwargs):
         if formatter is None or not isinstance(formatter, XYZFormatter):
             formatter = XYZFormatter()
         super().__init__(fpath=fpath, formatter=formatter, **kwargs)
+        self.frame = frame
+        self.fmtstr = ', '.join((self.fmtstr, "frame={frame!r}"))
 
         if self.fpath is not None:
             self.read()
@@ -47,22 +137,32 @@ class XYZReader(StructureData):
     def read(self):
         """Read `xyz` file."""
         self.structure.clear()
-        with zopen(self.fpath) as stream:
-            Natoms = int(stream.readline().strip())
-            self.comment_line = stream.readline().strip()
-            lines = stream.readlines()
-            for line in lines:
-                s = line.strip().split()
-                if len(s) != 0:
-                    atom = \
-                        Atom(element=s[0],
-                             x=float(s[1]), y=float(s[2]), z=float(s[3]))
-                    self.atoms.append(atom)
-            if self.atoms.Natoms != Natoms:
-                error_msg = '`xyz` data contained {} atoms '.format(
-                    self.atoms.Natoms) + 'but should contain ' + \
-                    '{}'.format(Natoms)
-                raise StructureDataError(error_msg)
+        offset = 0
+        if self.frame:
+            offsets, _ = index_xyzfile(self.fpath)
+            try:
+                offset = offsets[self.frame]
+            except IndexError:
+                raise XYZError('`xyz` file {} has no frame {}'.format(
+                               self.fpath, self.frame))
+
+        formatter = self.formatter
+        with zopen(self.fpath, 'rb') as fb:
+            fb.seek(offset)
+            stream = io.TextIOWrapper(fb)
+            try:
+                Natoms = int(stream.readline().strip())
+                self.comment_line = stream.readline().strip()
+                properties = formatter.parse_properties(
+                    formatter.parse_comment_line(
+                        self.comment_line).get('Properties'))
+                columns = formatter.parse_atoms(stream, Natoms, properties)
+            finally:
+                stream.detach()
+
+        for element, x, y, z in zip(*[columns[attr].tolist() for attr in
+                                      ('element', 'x', 'y', 'z')]):
+            self.atoms.append(Atom(element=element, x=x, y=y, z=z))
 
         if len(set(self.atoms.elements)) > 1:
             self.assign_unique_types()
@@ -70,6 +170,7 @@ class XYZReader(StructureData):
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         attr_dict = super().todict()
+        attr_dict.update(dict(frame=self.frame))
         attr_dict.update(self.formatter.todict())
         return attr_dict
 
@@ -176,13 +277,347 @@ class XYZData(XYZReader):
         stream.write('{}\n'.format(comment_line))
 
     def _write_atoms(self, stream):
-        sformat = self.formatter.format
-        for atom in self.atoms:
-            stream.write(sformat(atom))
+        stream.write(self.formatter.format_atoms(self.atoms))
 
 XYZ = XYZIO = XYZData
 
 
+class XYZTrajectoryReader(StructureData):
+    """Class for reading multi-frame `xyz` trajectory files.
+
+    Each frame is read into a :class:`~sknano.core.atoms.Snapshot` of the
+    :attr:`~XYZTrajectoryReader.trajectory`, with atoms array columns
+    `id`, `type`, `x`, `y`, `z` and the other numeric columns of extended
+    `xyz` frames. The atoms are numbered in the order of the frame lines
+    unless the frames have an `id` property, and the elements are
+    assigned atom :attr:`~XYZTrajectoryReader.types` in the order they
+    are first read, which are mapped back to the elements of the snapshot
+    atoms.
+
+    The snapshot timesteps are read from the `timestep` or `step` keys of
+    extended `xyz` comment lines and default to the frame index. The
+    snapshot domain is read from the `Lattice` key, with the lattice
+    vectors taken to be in the lower triangular form of a LAMMPS
+    simulation box.
+
+    Parameters
+    ----------
+    *args : :class:`~python:list`
+        :class:`~python:list` of one or more `xyz` files.
+    autoread : :class:`~python:bool`, optional
+        Automatically read the `xyz` files. Default is `True`.
+    lazy : :class:`~python:bool`, optional
+        If `True`, only the frame headers are read using the frame index
+        of each `xyz` file (see :func:`index_xyzfile`), and the frame
+        atoms are read on demand. Default is `False`.
+
+    Attributes
+    ----------
+    trajectory
+    types : :class:`~python:dict`
+        :class:`~python:dict` mapping elements to atom types.
+
+    """
+    def __init__(self, *args, autoread=True, lazy=False, formatter=None,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.trajectory = Trajectory()
+        self.xyzfiles = tuple(flatten([[glob(f) for f in arg.split()]
+                                       for arg in args]))
+        self.lazy = lazy
+        self.types = OrderedDict()
+        self._type_elements = {}
+        self._snapshot_formatters = {}
+        self._open_xyzfile = None
+
+        if formatter is None or not isinstance(formatter, XYZFormatter):
+            formatter = XYZFormatter()
+        self.formatter = formatter
+
+        self.fmtstr = "{xyzfiles!r}, autoread=True, lazy={lazy!r}, " + \
+            formatter.fmtstr
+
+        if autoread and len(self.xyzfiles) > 0:
+            self.read()
+
+    def __getattr__(self, name):
+        try:
+            return getattr(self.trajectory, name)
+        except AttributeError:
+            return super().__getattr__(name)
+
+    def __getitem__(self, index):
+        return self.trajectory[index]
+
+    def __iter__(self):
+        return iter(self.trajectory)
+
+    def read(self):
+        """Read the frames of each `xyz` file."""
+        trajectory = self.trajectory
+        for xyzfile in self.xyzfiles:
+            try:
+                if self.lazy:
+                    self.read_frame_headers(xyzfile)
+                else:
+                    with zopen(xyzfile, 'rt') as f:
+                        snapshot = self.read_frame(f)
+                        while snapshot is not None:
+                            trajectory.append(snapshot)
+                            snapshot = self.read_frame(f)
+            except XYZError as e:
+                print(e)
+                continue
+
+        print("read {:d} frames".format(self.Nsnaps))
+
+        if len(trajectory) > 0:
+            trajectory.time_selection.all()
+            trajectory.reference_snapshot = trajectory[0]
+
+    def read_frame_headers(self, xyzfile):
+        """Append the frames of `xyzfile` to the \
+            :attr:`~XYZTrajectoryReader.trajectory` without reading their \
+            atoms.
+
+        The frame atoms are read from the frame offsets in the
+        :func:`index_xyzfile` index when they are first accessed.
+
+        Parameters
+        ----------
+        xyzfile : :class:`~python:str`
+
+        """
+        offsets, _ = index_xyzfile(xyzfile)
+        with zopen(xyzfile, 'rb') as fb:
+            for offset in offsets:
+                fb.seek(offset)
+                f = io.TextIOWrapper(fb)
+                try:
+                    snapshot = Snapshot(self.trajectory)
+                    self._read_frame_header(f, snapshot)
+                finally:
+                    f.detach()
+                snapshot.loader = \
+                    partial(self._load_frame_atoms, xyzfile, offset)
+                self.trajectory.append(snapshot)
+
+    def iter_snapshots(self):
+        """Iterate over the selected snapshots.
+
+        With a `lazy` reader, the atoms of each snapshot are read when
+        accessed and released again once the iteration moves on to the
+        next snapshot, so that only one frame is held in memory at a time.
+
+        Yields
+        ------
+        :class:`~sknano.core.atoms.Snapshot`
+
+        """
+        for snapshot in self.trajectory:
+            if not snapshot.selected:
+                continue
+            loaded = snapshot.get_atoms(asarray=True, load=False) is not None
+            yield snapshot
+            if not loaded:
+                snapshot.release()
+
+    def close(self):
+        """Close the `xyz` file kept open for reading frame atoms."""
+        if self._open_xyzfile is not None:
+            self._open_xyzfile[-1].close()
+            self._open_xyzfile = None
+
+    def _load_frame_atoms(self, xyzfile, offset):
+        """Read the atoms array of the frame at byte `offset` \
+            in `xyzfile`."""
+        if self._open_xyzfile is None or self._open_xyzfile[0] != xyzfile:
+            self.close()
+            self._open_xyzfile = (xyzfile, zopen(xyzfile, 'rb'))
+        fb = self._open_xyzfile[-1]
+        fb.seek(offset)
+        f = io.TextIOWrapper(fb)
+        try:
+            snapshot = self.read_frame(f)
+        finally:
+            f.detach()
+        if snapshot is None:
+            raise XYZError('Invalid `xyz` file: {}'.format(xyzfile))
+        return snapshot.get_atoms(asarray=True)
+
+    def read_frame(self, f):
+        """Read the next frame from file `f`.
+
+        Returns
+        -------
+        :class:`~sknano.core.atoms.Snapshot`
+            The frame snapshot, or `None` at the end of the file.
+
+        """
+        snapshot = Snapshot(self.trajectory)
+        properties = self._read_frame_header(f, snapshot)
+        if properties is None:
+            return None
+        columns = self.formatter.parse_atoms(f, snapshot.Natoms, properties)
+
+        if 'element' in columns:
+            elements, types = np.unique(columns['element'],
+                                        return_inverse=True)
+            types = np.asarray([self._element_type(element) for element
+                                in elements.tolist()], dtype=float)[types]
+        else:
+            types = np.zeros(snapshot.Natoms)
+        ids = columns.get('id', np.arange(1, snapshot.Natoms + 1))
+        snapshot._atoms_array = np.column_stack(
+            [ids, types] + [columns[attr] for attr in
+                            snapshot.formatter.dumpattrs[2:]]).astype(float)
+        return snapshot
+
+    def _read_frame_header(self, f, snapshot):
+        """Read frame header from file.
+
+        Returns
+        -------
+        :class:`~python:list`
+            The frame properties returned by
+            :meth:`~XYZFormatter.parse_properties`, or `None` at the end
+            of the file.
+
+        """
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+        if not line:
+            return None
+        try:
+            Natoms = snapshot.Natoms = int(line.split()[0])
+        except ValueError:
+            raise XYZError('Invalid `xyz` atom count line: {}'.format(line))
+        snapshot.atom_selection = np.zeros(Natoms, dtype=bool)
+
+        formatter = self.formatter
+        comment_line = snapshot.comment_line = f.readline().strip()
+        info = formatter.parse_comment_line(comment_line)
+        try:
+            snapshot.timestep = int(info.get('timestep', info.get('step')))
+        except (TypeError, ValueError):
+            snapshot.timestep = len(self.trajectory)
+
+        domain = snapshot.domain = Domain()
+        lattice = info.get('Lattice')
+        if lattice is not None:
+            try:
+                a, b, c = np.asarray(lattice.split(),
+                                     dtype=float).reshape(3, 3).tolist()
+            except ValueError:
+                raise XYZError('Invalid `Lattice`: {}'.format(lattice))
+            domain.xlo = domain.ylo = domain.zlo = 0.0
+            domain.xhi, domain.yhi, domain.zhi = a[0], b[1], c[2]
+            domain.xy, domain.xz, domain.yz = b[0], c[0], c[1]
+            domain.triclinic = any(domain.tilt_factors)
+
+        properties = formatter.parse_properties(info.get('Properties'))
+        dumpattrs = ['id', 'type'] + \
+            [attr for attr, dtype in _property_attrs(properties)
+             if dtype in ('R', 'I') and attr not in ('id', 'type')]
+        snapshot.formatter = self._snapshot_formatter(dumpattrs)
+        return properties
+
+    def _snapshot_formatter(self, dumpattrs):
+        """Return the :class:`~sknano.io.DUMPFormatter` of the snapshots \
+            with atoms array columns `dumpattrs`."""
+        key = tuple(dumpattrs)
+        try:
+            return self._snapshot_formatters[key]
+        except KeyError:
+            formatter = self._snapshot_formatters[key] = \
+                DUMPFormatter(dumpattrs=dumpattrs,
+                              atomattrmap={('type', 'element'):
+                                           self._type_elements})
+            return formatter
+
+    def _element_type(self, element):
+        """Return the atom type of `element`."""
+        try:
+            return self.types[element]
+        except KeyError:
+            atomtype = self.types[element] = len(self.types) + 1
+            self._type_elements[atomtype] = element
+            return atomtype
+
+    def todict(self):
+        """Return :class:`~python:dict` of constructor parameters."""
+        attr_dict = dict(xyzfiles=self.xyzfiles, lazy=self.lazy)
+        attr_dict.update(self.formatter.todict())
+        return attr_dict
+
+
+class XYZTrajectoryWriter:
+    """Class for writing multi-frame `xyz` trajectory files."""
+
+    @classmethod
+    def write(cls, fname=None, outpath=None, fpath=None, trajectory=None,
+              atoms=None, comment_line=None, append=False, formatter=None):
+        """Write trajectory frames to an `xyz` file.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Output file name.
+        outpath : str, optional
+            Output file path.
+        fpath : str, optional
+            Full path (directory path + file name) to output data file.
+        trajectory : :class:`~sknano.core.atoms.Trajectory`, optional
+            :class:`~sknano.core.atoms.Trajectory` whose selected
+            snapshots are written as frames, with extended `xyz` comment
+            lines recording the snapshot timesteps.
+        atoms : :class:`~sknano.core.atoms.Atoms`, optional
+            :class:`~sknano.core.atoms.Atoms` written as a single frame.
+        comment_line : str, optional
+            Comment line of the `atoms` frame.
+        append : bool, optional
+            If `True`, append the frames to the `xyz` file.
+            Default is `False`.
+        formatter : :class:`XYZFormatter`, optional
+
+        """
+        if trajectory is None and atoms is None:
+            raise ValueError('Expected either `trajectory` or `atoms` '
+                             'object.')
+
+        if fpath is None:
+            fpath = get_fpath(fname=fname, ext='xyz', outpath=outpath,
+                              overwrite=not append, add_fnum=False)
+
+        if formatter is None:
+            formatter = XYZFormatter()
+
+        with zopen(fpath, 'at' if append else 'wt') as stream:
+            if atoms is not None:
+                if comment_line is None:
+                    comment_line = default_comment_line
+                cls._write_frame(stream, formatter, atoms, comment_line)
+
+            if trajectory is not None:
+                for snapshot in trajectory:
+                    if not snapshot.selected:
+                        continue
+                    loaded = snapshot.get_atoms(asarray=True,
+                                                load=False) is not None
+                    cls._write_frame(
+                        stream, formatter, snapshot.atoms,
+                        'Properties=species:S:1:pos:R:3 timestep={}'.format(
+                            snapshot.timestep))
+                    if not loaded:
+                        snapshot.release()
+
+    @staticmethod
+    def _write_frame(stream, formatter, atoms, comment_line):
+        stream.write('{:d}\n{}\n'.format(atoms.Natoms, comment_line))
+        stream.write(formatter.format_atoms(atoms))
+
+
 class XYZFormatter(StructureDataFormatter):
     """`StructureDataFormatter` class defining properties for `xyz` format."""
     def __init__(self, format_string=None):
@@ -204,6 +639,124 @@ class XYZFormatter(StructureDataFormatter):
             output stream."""
         return self.format_string.format(atom.symbol, atom.x, atom.y, atom.z)
 
+    def format_atoms(self, atoms):
+        """Return :class:`~python:str` of the attributes of all `atoms` \
+            formatted for an output stream.
+
+        The atom attribute columns are gathered once and formatted with
+        :attr:`~XYZFormatter.format_string` in a single pass.
+
+        Parameters
+        ----------
+        atoms : :class:`~sknano.core.atoms.Atoms`
+
+        """
+        columns = [atoms.get_column(attr, aslist=True)
+                   for attr in ('symbol', 'x', 'y', 'z')]
+        return ''.join(map(self.format_string.format, *columns))
+
+    def parse_comment_line(self, comment_line):
+        """Return :class:`~python:dict` of the `key=value` pairs of an \
+            extended `xyz` comment line.
+
+        Parameters
+        ----------
+        comment_line : :class:`~python:str`
+
+        Returns
+        -------
+        :class:`~python:collections.OrderedDict`
+            The `key=value` pairs, with quoted values unquoted. Empty if
+            the comment line is not an extended `xyz` comment line.
+
+        """
+        try:
+            tokens = shlex.split(comment_line)
+        except ValueError:
+            return OrderedDict()
+        return OrderedDict(token.split('=', 1) for token in tokens
+                           if '=' in token)
+
+    def parse_properties(self, properties=None):
+        """Return :class:`~python:list` of the per-atom columns of an \
+            extended `xyz` `Properties` value.
+
+        Parameters
+        ----------
+        properties : {`None`, :class:`~python:str`}, optional
+            `Properties` value of the form
+            ``species:S:1:pos:R:3[:name:type:ncols...]``. If `None`,
+            the columns of the plain `xyz` format are returned.
+
+        Returns
+        -------
+        :class:`~python:list`
+            :class:`~python:list` of (name, type, ncols) tuples.
+
+        """
+        if properties is None:
+            return _DEFAULT_PROPERTIES[:]
+        fields = properties.split(':')
+        try:
+            return [(name, dtype, int(ncols)) for name, dtype, ncols in
+                    zip(fields[::3], fields[1::3], fields[2::3])]
+        except ValueError:
+            raise XYZError('Invalid `Properties`: {}'.format(properties))
+
+    def parse_atoms(self, f, Natoms, properties=None):
+        """Parse the next `Natoms` lines of atom attributes from file `f`.
+
+        Blank lines are skipped. The lines are split into one array of
+        tokens and each column is converted to its type in one call. Lines
+        with more columns than the `properties` are truncated.
+
+        Parameters
+        ----------
+        f : file object
+        Natoms : :class:`~python:int`
+        properties : :class:`~python:list`, optional
+            (name, type, ncols) tuples returned by
+            :meth:`~XYZFormatter.parse_properties`.
+
+        Returns
+        -------
+        :class:`~python:collections.OrderedDict`
+            :class:`~python:dict` mapping atom attributes to
+            :class:`~numpy:numpy.ndarray` columns. The `species`, `pos`,
+            `velo` and `forces` properties are mapped to the `element`,
+            `x`, `y`, `z`, `vx`, `vy`, `vz`, `fx`, `fy` and `fz`
+            attributes.
+
+        """
+        if properties is None:
+            properties = _DEFAULT_PROPERTIES
+        ncols = sum(n for _, _, n in properties)
+        lines, _ = _read_atom_lines(f, Natoms)
+        if len(lines) < Natoms:
+            raise XYZError('`xyz` data contained {} atoms '.format(
+                           len(lines)) + 'but should contain ' +
+                           '{}'.format(Natoms))
+        tokens = ''.join(lines).split()
+        if len(tokens) != Natoms * ncols:
+            tokens = [token for line in lines for token in
+                      line.split()[:ncols]]
+        try:
+            tokens = np.array(tokens).reshape(Natoms, ncols)
+        except ValueError:
+            raise XYZError('Invalid `xyz` atom lines')
+
+        columns = OrderedDict()
+        for col, (attr, dtype) in enumerate(_property_attrs(properties)):
+            column = tokens[:, col]
+            if dtype == 'R':
+                column = column.astype(float)
+            elif dtype == 'I':
+                column = column.astype(int)
+            elif dtype == 'L':
+                column = np.in1d(column, ['T', 'True', 'true', '1'])
+            columns[attr] = column
+        return columns
+
     def todict(self):
         """Return :class:`~python:dict` of constructor parameters."""
         attr_dict = super().todict()
@@ -283,13 +836,15 @@ class XYZ2DATAConverter(XYZConverter):
         """`LAMMPS data` file name."""
         return self.outfile
 
-    def convert(self, return_reader=False, **kwargs):
+    def convert(self, return_reader=False, frame=0, **kwargs):
         """Convert `xyz` to `LAMMPS data` chemical file format.
 
         Parameters
         ----------
         return_reader : bool, optional
             return an instance of :class:`~DATAReader`
+        frame : int, optional
+            Index of the frame of a multi-frame `xyz` file to convert.
 
         Returns
         -------
@@ -300,7 +855,7 @@ class XYZ2DATAConverter(XYZConverter):
 
         kwargs.update(self.kwargs)
 
-        xyzreader = XYZReader(self.infile, **kwargs)
+        xyzreader = XYZReader(self.infile, frame=frame, **kwargs)
         structure = xyzreader.structure
 
         if self._add_new_atoms: